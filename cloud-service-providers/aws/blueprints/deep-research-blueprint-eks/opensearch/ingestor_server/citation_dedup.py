@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Deduplicated upload of citation payloads to MinIO.
+
+Every thumbnail id keeps its complete payload, so the rag-server and any other
+reader of citations is unaffected, and deleting a document or collection
+removes its objects as before. Within one upload, a payload that was already
+stored is created with a server-side copy of the stored object instead of being
+sent again: a logo or header image repeated on hundreds of pages is transferred
+to MinIO once.
+
+1. copy_payload: Copy a stored payload to another object name, server-side
+2. CitationDeduplicator: Upload citation payloads, copying repeated ones
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from minio.commonconfig import CopySource
+
+logger = logging.getLogger(__name__)
+
+ENABLE_MINIO_CITATION_DEDUP = (
+    os.getenv("ENABLE_MINIO_CITATION_DEDUP", "true").lower() == "true"
+)
+# Smaller payloads are cheaper to upload again (in the same bulk request) than
+# to copy with a request of their own
+MINIO_CITATION_DEDUP_MIN_BYTES = int(os.getenv("MINIO_CITATION_DEDUP_MIN_BYTES", 16384))
+
+
+def copy_payload(minio_operator, source_object_name: str, object_name: str) -> None:
+    """Copy a stored payload to another object name without transferring it"""
+    minio_operator.client.copy_object(
+        minio_operator.default_bucket_name,
+        object_name,
+        CopySource(minio_operator.default_bucket_name, source_object_name),
+    )
+
+
+class CitationDeduplicator:
+    """
+    Upload function for the citation upload stage that sends repeated payloads once.
+
+    upload_fn(payloads, object_names) uploads payloads and copy_fn(source, target)
+    copies a stored object. The instance remembers what it stored, so one is
+    created per upload and shared by the workers of its upload stage.
+    """
+
+    def __init__(
+        self,
+        upload_fn: Callable[[list[dict[str, Any]], list[str]], None],
+        copy_fn: Callable[[str, str], None],
+        min_bytes: int = MINIO_CITATION_DEDUP_MIN_BYTES,
+    ):
+        self.upload_fn = upload_fn
+        self.copy_fn = copy_fn
+        self.min_bytes = min_bytes
+        self.copied = 0
+        # Payload hash to the object name it was stored under
+        self._stored: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def upload(self, payloads: list[dict[str, Any]], object_names: list[str]) -> None:
+        """Upload the payloads of one chunk, copying those already stored."""
+        upload_payloads, upload_object_names = [], []
+        uploaded = {}
+        copies = []
+        for payload, object_name in zip(payloads, object_names, strict=True):
+            payload_json = json.dumps(payload, sort_keys=True)
+            if len(payload_json) < self.min_bytes:
+                upload_payloads.append(payload)
+                upload_object_names.append(object_name)
+                continue
+            payload_hash = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+            with self._lock:
+                source_object_name = self._stored.get(payload_hash)
+            source_object_name = source_object_name or uploaded.get(payload_hash)
+            if source_object_name is None:
+                uploaded[payload_hash] = object_name
+                upload_payloads.append(payload)
+                upload_object_names.append(object_name)
+            else:
+                copies.append((source_object_name, object_name, payload))
+
+        if upload_payloads:
+            self.upload_fn(upload_payloads, upload_object_names)
+        # Only payloads that are stored can be copied by later chunks
+        with self._lock:
+            for payload_hash, object_name in uploaded.items():
+                self._stored.setdefault(payload_hash, object_name)
+        copied = 0
+        fallback_payloads, fallback_object_names = [], []
+        for source_object_name, object_name, payload in copies:
+            try:
+                self.copy_fn(source_object_name, object_name)
+                copied += 1
+            except Exception as e:
+                # e.g. the source document was deleted meanwhile
+                logger.debug("Copying %s failed (%s), uploading it", object_name, e)
+                fallback_payloads.append(payload)
+                fallback_object_names.append(object_name)
+        if fallback_payloads:
+            self.upload_fn(fallback_payloads, fallback_object_names)
+        if copied:
+            with self._lock:
+                self.copied += copied
+            logger.debug(
+                "Copied %d repeated citation payload(s) in MinIO instead of uploading them",
+                copied,
+            )
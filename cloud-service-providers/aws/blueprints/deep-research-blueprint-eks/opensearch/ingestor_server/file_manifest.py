@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+File manifest of an upload, built with one concurrent stat pass.
+
+Validation, batching, failure reporting and the upload response read file
+name, extension, type and size from the manifest instead of hitting the
+(possibly network) file system again for every file. The sha256 of the file
+content is read lazily, only by the features that need it (duplicate
+detection, ingestion journal), and at most once per file. The same streaming
+read counts the pages of PDFs for batch scheduling.
+
+1. FileEntry: Stat result of one uploaded file
+2. FileManifest: File entries of an upload, keyed by filepath
+"""
+
+import hashlib
+import os
+import re
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+# Threads used to stat the files of an upload
+FILE_MANIFEST_WORKERS = int(os.getenv("FILE_MANIFEST_WORKERS", 16))
+# Threads used to hash file contents, reads are I/O bound but much larger
+FILE_HASH_WORKERS = int(os.getenv("FILE_HASH_WORKERS", 8))
+
+_HASH_READ_SIZE = 1024 * 1024
+# Page objects of a PDF; whitespace is bounded so a match never spans more than
+# the bytes carried over between reads
+_PDF_PAGE_PATTERN = re.compile(rb"/Type\s{0,16}/Page(?![a-zA-Z])")
+_PDF_PAGE_CARRY = 64
+
+
+class FileEntry(NamedTuple):
+    """Stat result of one uploaded file"""
+
+    filepath: str
+    document_name: str
+    extension: str
+    exists: bool
+    is_file: bool
+    resolvable: bool
+    size_bytes: int
+
+
+def _stat_file(filepath: str) -> FileEntry:
+    document_name = os.path.basename(filepath)
+    extension = os.path.splitext(filepath)[1].lower()
+    try:
+        # resolve(strict=True) follows symlinks, so it also covers the existence
+        # check and the directory traversal validation
+        file_stat = Path(filepath).resolve(strict=True).stat()
+    except (OSError, RuntimeError):
+        return FileEntry(filepath, document_name, extension, False, False, False, 0)
+    return FileEntry(
+        filepath,
+        document_name,
+        extension,
+        True,
+        stat.S_ISREG(file_stat.st_mode),
+        True,
+        file_stat.st_size,
+    )
+
+
+def _read_content(filepath: str, count_pages: bool) -> tuple[str | None, int]:
+    """
+    Read a file once for its sha256 and, if requested, its number of PDF page
+    objects (0 if they are hidden in compressed object streams).
+    """
+    digest = hashlib.sha256()
+    pages = 0
+    carry = b""
+    try:
+        with open(filepath, "rb") as f:
+            while chunk := f.read(_HASH_READ_SIZE):
+                digest.update(chunk)
+                if count_pages:
+                    data = carry + chunk
+                    # Matches starting in the carried tail are counted next read
+                    limit = len(data) - _PDF_PAGE_CARRY
+                    pages += sum(
+                        1
+                        for match in _PDF_PAGE_PATTERN.finditer(data)
+                        if match.start() < limit
+                    )
+                    carry = data[max(limit, 0) :]
+    except OSError:
+        return None, 0
+    if count_pages:
+        pages += len(_PDF_PAGE_PATTERN.findall(carry))
+    return digest.hexdigest(), pages
+
+
+class FileManifest:
+    """File entries of an upload, keyed by filepath"""
+
+    def __init__(self, entries: dict[str, FileEntry] | None = None):
+        self.entries = entries or {}
+        # sha256 per filepath, None for unreadable files
+        self._content_hashes: dict[str, str | None] = {}
+        # PDF page counts found while hashing
+        self._page_counts: dict[str, int] = {}
+        self._content_hashes_lock = threading.Lock()
+
+    @classmethod
+    def build(
+        cls, filepaths: list[str], workers: int = FILE_MANIFEST_WORKERS
+    ) -> "FileManifest":
+        """Stat all files concurrently"""
+        unique_filepaths = list(dict.fromkeys(filepaths))
+        if len(unique_filepaths) <= 1:
+            return cls(
+                {filepath: _stat_file(filepath) for filepath in unique_filepaths}
+            )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            entries = executor.map(_stat_file, unique_filepaths)
+            return cls(dict(zip(unique_filepaths, entries, strict=True)))
+
+    def get(self, filepath: str) -> FileEntry:
+        """Get the entry of a file, files not in the manifest are stat-ed on demand"""
+        entry = self.entries.get(filepath)
+        if entry is None:
+            entry = self.entries[filepath] = _stat_file(filepath)
+        return entry
+
+    def size(self, filepath: str) -> int:
+        return self.get(filepath).size_bytes
+
+    def sizes(self, filepaths: list[str]) -> dict[str, int]:
+        return {filepath: self.size(filepath) for filepath in filepaths}
+
+    def total_size(self, filepaths: list[str]) -> int:
+        return sum(self.size(filepath) for filepath in filepaths)
+
+    def content_hash(self, filepath: str) -> str | None:
+        """sha256 of the file content, read on first use. None if the file is unreadable."""
+        with self._content_hashes_lock:
+            if filepath in self._content_hashes:
+                return self._content_hashes[filepath]
+        digest, pages = _read_content(filepath, self.get(filepath).extension == ".pdf")
+        with self._content_hashes_lock:
+            if pages:
+                self._page_counts.setdefault(filepath, pages)
+            return self._content_hashes.setdefault(filepath, digest)
+
+    def content_hashes(
+        self, filepaths: list[str], workers: int = FILE_HASH_WORKERS
+    ) -> dict[str, str]:
+        """sha256 of files keyed by filepath, missing ones read concurrently. Unreadable files are left out."""
+        unique_filepaths = list(dict.fromkeys(filepaths))
+        with self._content_hashes_lock:
+            missing = [
+                filepath
+                for filepath in unique_filepaths
+                if filepath not in self._content_hashes
+            ]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self.content_hash, missing))
+        return {
+            filepath: digest
+            for filepath in unique_filepaths
+            if (digest := self.content_hash(filepath)) is not None
+        }
+
+    def page_counts(self, filepaths: list[str]) -> dict[str, int]:
+        """PDF page counts of the files already hashed; never reads a file."""
+        with self._content_hashes_lock:
+            return {
+                filepath: self._page_counts[filepath]
+                for filepath in filepaths
+                if filepath in self._page_counts
+            }
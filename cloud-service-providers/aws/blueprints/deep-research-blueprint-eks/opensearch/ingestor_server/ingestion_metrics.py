@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+OpenTelemetry metrics of the ingestion pipeline.
+
+Instruments are created on the global meter provider. Without a configured
+provider (e.g. the OTLP or Prometheus exporter of the server) they are no-ops,
+so recording is always safe.
+
+1. record_stage_duration: Record the duration of an ingestion stage
+2. stage_timer: Context manager timing an ingestion stage
+3. record_files: Count indexed and failed files and their bytes
+4. record_minio_objects: Count objects uploaded to MinIO
+5. record_summaries: Count generated, cached and failed summaries
+6. add_in_flight_batches: Track the number of batches being extracted
+7. add_queue_depth: Track the depth of the summary and upload queues
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from opentelemetry import metrics
+
+_METER = metrics.get_meter("nvidia_rag.ingestor_server")
+
+# Stages: validation, extraction, citation_upload, minio_upload,
+# consistency_wait, verification, summarization
+_STAGE_DURATION = _METER.create_histogram(
+    "rag_ingestion_stage_duration",
+    unit="s",
+    description="Duration of ingestion pipeline stages",
+)
+_FILES = _METER.create_counter(
+    "rag_ingestion_files",
+    description="Files processed by ingestion, by status",
+)
+_BYTES = _METER.create_counter(
+    "rag_ingestion_bytes",
+    unit="By",
+    description="Bytes of files processed by ingestion",
+)
+_CHUNKS = _METER.create_counter(
+    "rag_ingestion_chunks",
+    description="Chunks extracted and indexed by ingestion",
+)
+_MINIO_OBJECTS = _METER.create_counter(
+    "rag_ingestion_minio_objects",
+    description="Objects uploaded to MinIO, by store and status",
+)
+_SUMMARIES = _METER.create_counter(
+    "rag_ingestion_summaries",
+    description="Document summaries, by status",
+)
+_IN_FLIGHT_BATCHES = _METER.create_up_down_counter(
+    "rag_ingestion_batches_in_flight",
+    description="Batches currently being extracted and indexed",
+)
+_QUEUE_DEPTH = _METER.create_up_down_counter(
+    "rag_ingestion_queue_depth",
+    description="Items waiting in the summary and MinIO upload queues",
+)
+
+
+def record_stage_duration(stage: str, seconds: float, **attributes: str) -> None:
+    _STAGE_DURATION.record(seconds, {"stage": stage, **attributes})
+
+
+@contextmanager
+def stage_timer(stage: str, **attributes: str) -> Iterator[None]:
+    """Record the duration of the enclosed block as an ingestion stage"""
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage_duration(stage, time.perf_counter() - start_time, **attributes)
+
+
+def record_files(indexed: int, failed: int, size_bytes: int, chunks: int) -> None:
+    if indexed:
+        _FILES.add(indexed, {"status": "indexed"})
+    if failed:
+        _FILES.add(failed, {"status": "failed"})
+    _BYTES.add(size_bytes)
+    _CHUNKS.add(chunks)
+
+
+def record_minio_objects(store: str, uploaded: int, failed: int = 0) -> None:
+    if uploaded:
+        _MINIO_OBJECTS.add(uploaded, {"store": store, "status": "uploaded"})
+    if failed:
+        _MINIO_OBJECTS.add(failed, {"store": store, "status": "failed"})
+
+
+def record_summaries(count: int, status: str) -> None:
+    _SUMMARIES.add(count, {"status": status})
+
+
+def add_in_flight_batches(count: int) -> None:
+    _IN_FLIGHT_BATCHES.add(count)
+
+
+def add_queue_depth(queue: str, count: int) -> None:
+    _QUEUE_DEPTH.add(count, {"queue": queue})
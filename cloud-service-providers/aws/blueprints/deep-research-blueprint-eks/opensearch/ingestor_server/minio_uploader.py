@@ -0,0 +1,235 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bounded asynchronous upload stage for MinIO payloads.
+
+Callers submit the payloads of a batch and continue with their next unit of
+work while a pool of workers uploads them in chunks. The queue is bounded, so
+a slow object store pushes back on the producer instead of letting payloads
+pile up in memory.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+from opentelemetry import context as otel_context
+from opentelemetry import trace
+
+from nvidia_rag.ingestor_server.ingestion_metrics import (
+    add_queue_depth,
+    record_minio_objects,
+    record_stage_duration,
+)
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+MINIO_UPLOAD_WORKERS = int(os.getenv("MINIO_UPLOAD_WORKERS", 4))
+# Maximum number of queued chunks before submit() waits
+MINIO_UPLOAD_QUEUE_SIZE = int(os.getenv("MINIO_UPLOAD_QUEUE_SIZE", 64))
+# Payloads uploaded per worker call
+MINIO_UPLOAD_CHUNK_SIZE = int(os.getenv("MINIO_UPLOAD_CHUNK_SIZE", 100))
+MINIO_UPLOAD_MAX_RETRIES = int(os.getenv("MINIO_UPLOAD_MAX_RETRIES", 3))
+
+
+class _BatchTracker:
+    """Completion state of one submitted batch."""
+
+    def __init__(self, label: str, total: int, chunks: int):
+        self.label = label
+        self.total = total
+        self.failed = 0
+        # First unexpected error of a chunk, the batch future is failed with it
+        self.error = None
+        self.remaining_chunks = chunks
+        self.start_time = time.perf_counter()
+        self.done = asyncio.get_running_loop().create_future()
+        # Trace context of the submitter, the upload spans are its children
+        self.context = otel_context.get_current()
+
+    def chunk_finished(self, failed: int, error: Exception | None = None) -> None:
+        self.failed += failed
+        if error is not None and self.error is None:
+            self.error = error
+        self.remaining_chunks -= 1
+        if self.remaining_chunks == 0 and not self.done.done():
+            elapsed = time.perf_counter() - self.start_time
+            logger.info(
+                "== MinIO upload for %s complete: %d object(s), %d failed, %.2f seconds ==",
+                self.label,
+                self.total - self.failed,
+                self.failed,
+                elapsed,
+            )
+            if self.error is not None:
+                self.done.set_exception(self.error)
+            else:
+                self.done.set_result(self.total - self.failed)
+
+
+class MinioUploadStage:
+    """
+    Upload payloads to MinIO from a pool of async workers.
+
+    upload_fn(payloads, object_names) is a blocking call that uploads one chunk;
+    it runs in a worker thread and is retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        upload_fn: Callable[[list[dict[str, Any]], list[str]], None],
+        name: str = "minio",
+        workers: int = MINIO_UPLOAD_WORKERS,
+        queue_size: int = MINIO_UPLOAD_QUEUE_SIZE,
+        chunk_size: int = MINIO_UPLOAD_CHUNK_SIZE,
+        max_retries: int = MINIO_UPLOAD_MAX_RETRIES,
+    ):
+        self.upload_fn = upload_fn
+        self.name = name
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_retries = max(1, max_retries)
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        self._worker_tasks = []
+        self._trackers = []
+        # Failures of finished batches that were pruned from _trackers
+        self._pruned_failed = 0
+
+    def start(self) -> None:
+        """Start the worker pool on the running event loop."""
+        if not self._worker_tasks:
+            self._worker_tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+
+    async def submit(
+        self, label: str, payloads: list[dict[str, Any]], object_names: list[str]
+    ) -> asyncio.Future:
+        """
+        Queue a batch of payloads and return a future that resolves with the
+        number of uploaded objects once the whole batch is done, or fails with
+        the first unexpected error of its chunks.
+        """
+        self.start()
+        # Long lived stages would otherwise keep every finished batch around
+        pending_trackers = []
+        for tracker in self._trackers:
+            if tracker.done.done():
+                self._pruned_failed += tracker.failed
+            else:
+                pending_trackers.append(tracker)
+        self._trackers = pending_trackers
+        chunks = [
+            (payloads[i : i + self.chunk_size], object_names[i : i + self.chunk_size])
+            for i in range(0, len(payloads), self.chunk_size)
+        ]
+        tracker = _BatchTracker(label, len(payloads), len(chunks))
+        self._trackers.append(tracker)
+        if not chunks:
+            tracker.done.set_result(0)
+        for chunk_payloads, chunk_object_names in chunks:
+            await self._queue.put((tracker, chunk_payloads, chunk_object_names))
+            add_queue_depth(f"minio_{self.name.lower()}", 1)
+        return tracker.done
+
+    async def close(self) -> int:
+        """Wait for every submitted batch, stop the workers and return the failure count."""
+        if self._trackers:
+            await asyncio.gather(
+                *(tracker.done for tracker in self._trackers), return_exceptions=True
+            )
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        return self._pruned_failed + sum(tracker.failed for tracker in self._trackers)
+
+    async def _worker(self) -> None:
+        while True:
+            tracker, payloads, object_names = await self._queue.get()
+            add_queue_depth(f"minio_{self.name.lower()}", -1)
+            # The chunk counts as failed unless the upload reports otherwise
+            failed = len(payloads)
+            error = None
+            try:
+                start_time = time.perf_counter()
+                with tracer.start_as_current_span(
+                    "minio.upload",
+                    context=tracker.context,
+                    attributes={
+                        "rag.store": self.name,
+                        "rag.object_count": len(payloads),
+                    },
+                ) as span:
+                    failed = await self._upload_with_retries(
+                        tracker.label, payloads, object_names
+                    )
+                    span.set_attribute("rag.failed_count", failed)
+                record_stage_duration(
+                    "minio_upload", time.perf_counter() - start_time, store=self.name
+                )
+                record_minio_objects(self.name, len(payloads) - failed, failed)
+            except Exception as e:
+                logger.error(
+                    "%s upload worker failed for %s: %s",
+                    self.name,
+                    tracker.label,
+                    e,
+                    exc_info=logger.getEffectiveLevel() <= logging.DEBUG,
+                )
+                error = e
+            finally:
+                # Always resolve the batch, otherwise close() would wait forever
+                tracker.chunk_finished(failed, error)
+                self._queue.task_done()
+
+    async def _upload_with_retries(
+        self, label: str, payloads: list[dict[str, Any]], object_names: list[str]
+    ) -> int:
+        """Upload one chunk, returning the number of objects that could not be stored."""
+        delay = 1.0
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await asyncio.to_thread(self.upload_fn, payloads, object_names)
+                return 0
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(
+                        "%s upload for %s failed after %d attempts, %d object(s) not stored: %s",
+                        self.name,
+                        label,
+                        attempt,
+                        len(payloads),
+                        e,
+                        exc_info=logger.getEffectiveLevel() <= logging.DEBUG,
+                    )
+                    return len(payloads)
+                logger.warning(
+                    "%s upload for %s failed (attempt %d/%d), retrying in %.1fs: %s",
+                    self.name,
+                    label,
+                    attempt,
+                    self.max_retries,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+        return len(payloads)
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Columnar representation of nv-ingest results.
+
+The nested list[list[dict]] returned by nv-ingest is decoded once per batch
+into typed arrays (element type, subtype, source, page and text offsets) and
+a single text buffer. Result logging, citation collection and summary
+preparation read the columns, so the result dicts can be released right after
+decoding.
+
+1. ResultColumns: Columns of the elements of one nv-ingest batch
+"""
+
+import os
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any
+
+# Page number column value of elements without a page number
+NO_PAGE = -(2**31)
+
+
+class ResultColumns:
+    """
+    Elements of one nv-ingest batch, stored column by column.
+
+    Element i belongs to sources[source_index[i]], its type and subtype are
+    indexes into type_names and subtype_names, and its text (text content,
+    table/chart content, image caption or audio transcript) is
+    text[text_offsets[i]:text_offsets[i + 1]]. The elements of source s are
+    source_offsets[s] up to source_offsets[s + 1]. Image and structured elements
+    with a location keep their content for citations.
+    """
+
+    def __init__(self):
+        self.sources: list[str] = []
+        self.type_names: list[str] = []
+        self.subtype_names: list[str] = [""]
+        self.document_types = array("H")
+        self.subtypes = array("H")
+        self.source_index = array("I")
+        self.source_offsets = array("Q", [0])
+        self.page_numbers = array("i")
+        self.text_offsets = array("Q", [0])
+        self.text = ""
+        self.citation_elements = array("I")
+        self.citation_locations: list[list[float]] = []
+        self.citation_contents: list[str] = []
+
+    @classmethod
+    def decode(
+        cls, results: list[list[dict[str, Any]]], keep_citations: bool = True
+    ) -> "ResultColumns":
+        """Decode nv-ingest results in a single pass"""
+        columns = cls()
+        type_codes = {}
+        subtype_codes = {"": 0}
+        texts = []
+        text_length = 0
+
+        for result in results:
+            if not result:
+                continue
+            source_number = len(columns.sources)
+            source_id = (
+                result[0]
+                .get("metadata", {})
+                .get("source_metadata", {})
+                .get("source_id")
+            )
+            columns.sources.append(source_id)
+            for result_element in result:
+                element_number = len(columns.document_types)
+                document_type = result_element.get("document_type", "unknown")
+                metadata = result_element.get("metadata") or {}
+                content_metadata = metadata.get("content_metadata") or {}
+                subtype = content_metadata.get("subtype") or ""
+
+                type_code = type_codes.get(document_type)
+                if type_code is None:
+                    type_code = type_codes[document_type] = len(columns.type_names)
+                    columns.type_names.append(document_type)
+                subtype_code = subtype_codes.get(subtype)
+                if subtype_code is None:
+                    subtype_code = subtype_codes[subtype] = len(columns.subtype_names)
+                    columns.subtype_names.append(subtype)
+                page_number = content_metadata.get("page_number")
+
+                if document_type == "text":
+                    text = metadata.get("content")
+                elif document_type == "structured":
+                    text = (metadata.get("table_metadata") or {}).get("table_content")
+                elif document_type == "image":
+                    text = (metadata.get("image_metadata") or {}).get("caption")
+                elif document_type == "audio":
+                    text = (metadata.get("audio_metadata") or {}).get(
+                        "audio_transcript"
+                    )
+                else:
+                    text = None
+                if text:
+                    texts.append(text)
+                    text_length += len(text)
+
+                columns.document_types.append(type_code)
+                columns.subtypes.append(subtype_code)
+                columns.source_index.append(source_number)
+                columns.page_numbers.append(
+                    page_number if isinstance(page_number, int) else NO_PAGE
+                )
+                columns.text_offsets.append(text_length)
+
+                location = content_metadata.get("location")
+                if (
+                    keep_citations
+                    and document_type in ["image", "structured"]
+                    and location is not None
+                ):
+                    columns.citation_elements.append(element_number)
+                    columns.citation_locations.append(location)
+                    columns.citation_contents.append(metadata.get("content"))
+            columns.source_offsets.append(len(columns.document_types))
+
+        columns.text = "".join(texts)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.document_types)
+
+    def document_type(self, element: int) -> str:
+        return self.type_names[self.document_types[element]]
+
+    def subtype(self, element: int) -> str:
+        return self.subtype_names[self.subtypes[element]]
+
+    def source(self, element: int) -> str:
+        return self.sources[self.source_index[element]]
+
+    def page_number(self, element: int) -> int | None:
+        page_number = self.page_numbers[element]
+        return None if page_number == NO_PAGE else page_number
+
+    def get_text(self, element: int) -> str:
+        return self.text[self.text_offsets[element] : self.text_offsets[element + 1]]
+
+    def source_elements(self, source_number: int) -> range:
+        """Element indexes of a source; elements of a source are contiguous"""
+        return range(
+            self.source_offsets[source_number], self.source_offsets[source_number + 1]
+        )
+
+    def source_counts(self) -> dict[str, int]:
+        """Number of elements per source id"""
+        return {
+            source_id: len(self.source_elements(source_number))
+            for source_number, source_id in enumerate(self.sources)
+        }
+
+    def type_counts(self) -> Counter:
+        """Number of elements per "type" or "type(subtype)" label"""
+        counts = Counter(zip(self.document_types, self.subtypes, strict=True))
+        labels = Counter()
+        for (type_code, subtype_code), count in counts.items():
+            subtype = self.subtype_names[subtype_code]
+            label = self.type_names[type_code]
+            labels[f"{label}({subtype})" if subtype else label] += count
+        return labels
+
+    def text_size(self, document_type: str = "text") -> int:
+        """Total text length of the elements of one type"""
+        if document_type not in self.type_names:
+            return 0
+        type_code = self.type_names.index(document_type)
+        return sum(
+            self.text_offsets[element + 1] - self.text_offsets[element]
+            for element, code in enumerate(self.document_types)
+            if code == type_code
+        )
+
+    def iter_citations(self) -> Iterator[tuple[str, int | None, list[float], str]]:
+        """File name, page number, location and content of each citation element"""
+        for element, location, content in zip(
+            self.citation_elements,
+            self.citation_locations,
+            self.citation_contents,
+            strict=True,
+        ):
+            yield (
+                os.path.basename(self.source(element)),
+                self.page_number(element),
+                location,
+                content,
+            )
@@ -0,0 +1,267 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Live progress of ingestion tasks, persisted so that it outlives the process.
+
+1. IngestionProgress: Progress counters, throughput and ETA of one ingestion run
+2. TaskProgressStore: SQLite store of the latest progress snapshot per task
+3. get_task_progress_store: Get the process wide store, None if disabled
+"""
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from nvidia_rag.ingestor_server.ingestion_journal import INGESTION_STATE_PATH
+
+logger = logging.getLogger(__name__)
+
+ENABLE_TASK_PROGRESS_STORE = (
+    os.getenv("ENABLE_TASK_PROGRESS_STORE", "true").lower() == "true"
+)
+# Shares the database file with the ingestion journal unless set
+TASK_PROGRESS_DB_PATH = os.getenv("TASK_PROGRESS_DB_PATH", INGESTION_STATE_PATH)
+# Minimum seconds between two persisted snapshots of a running task
+TASK_PROGRESS_SAVE_INTERVAL = float(os.getenv("TASK_PROGRESS_SAVE_INTERVAL", 2))
+# Snapshots of tasks not updated for this many seconds are pruned on startup
+TASK_PROGRESS_RETENTION = float(os.getenv("TASK_PROGRESS_RETENTION", 7 * 24 * 3600))
+
+
+class IngestionProgress:
+    """
+    Progress of one ingestion run.
+
+    Stage times are cumulative busy time: with parallel batches the extraction
+    time of all batches is summed, so it can exceed the wall clock time.
+    """
+
+    def __init__(self, collection_name: str = None):
+        self.task_id = None
+        self.store = None
+        self.collection_name = collection_name
+        self.state = "RUNNING"
+        self.started_at = time.time()
+        self.updated_at = self.started_at
+        self.finished_at = None
+        self.total_files = 0
+        self.total_batches = 0
+        self.total_bytes = 0
+        self.batches_done = 0
+        self.files_indexed = 0
+        self.files_failed = 0
+        self.chunks_indexed = 0
+        self.bytes_processed = 0
+        self.stage_seconds = {}
+        self._lock = threading.Lock()
+        self._saved_at = 0.0
+
+    def bind(self, task_id: str, store: "TaskProgressStore | None") -> None:
+        """Attach the run to its task id and persist it from now on"""
+        self.task_id = task_id
+        self.store = store
+        self.save(force=True)
+
+    def add_plan(self, total_files: int, total_batches: int, total_bytes: int) -> None:
+        with self._lock:
+            self.total_files += total_files
+            self.total_batches += total_batches
+            self.total_bytes += total_bytes
+        self.save(force=True)
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+        self.save()
+
+    def batch_done(
+        self, files_indexed: int, files_failed: int, chunks: int, size_bytes: int
+    ) -> None:
+        with self._lock:
+            self.batches_done += 1
+            self.files_indexed += files_indexed
+            self.files_failed += files_failed
+            self.chunks_indexed += chunks
+            self.bytes_processed += size_bytes
+        self.save()
+
+    def finish(self, state: str) -> None:
+        with self._lock:
+            self.state = state
+            self.finished_at = time.time()
+        self.save(force=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Snapshot of the progress with derived throughput and ETA"""
+        with self._lock:
+            now = self.finished_at or time.time()
+            elapsed = max(now - self.started_at, 1e-6)
+            bytes_per_second = self.bytes_processed / elapsed
+            eta_seconds = None
+            if self.state == "RUNNING" and self.bytes_processed:
+                eta_seconds = max(self.total_bytes - self.bytes_processed, 0) / max(
+                    bytes_per_second, 1e-6
+                )
+            return {
+                "task_id": self.task_id,
+                "collection_name": self.collection_name,
+                "state": self.state,
+                "started_at": self.started_at,
+                "updated_at": self.updated_at,
+                "finished_at": self.finished_at,
+                "elapsed_seconds": round(elapsed, 2),
+                "batches_done": self.batches_done,
+                "total_batches": self.total_batches,
+                "files_indexed": self.files_indexed,
+                "files_failed": self.files_failed,
+                "total_files": self.total_files,
+                "chunks_indexed": self.chunks_indexed,
+                "bytes_processed": self.bytes_processed,
+                "total_bytes": self.total_bytes,
+                "bytes_per_second": round(bytes_per_second, 2),
+                "files_per_second": round(self.files_indexed / elapsed, 4),
+                "eta_seconds": None if eta_seconds is None else round(eta_seconds, 1),
+                "stage_seconds": {
+                    stage: round(seconds, 2)
+                    for stage, seconds in self.stage_seconds.items()
+                },
+            }
+
+    def save(self, force: bool = False) -> None:
+        """Persist a snapshot, at most once per TASK_PROGRESS_SAVE_INTERVAL unless forced"""
+        now = time.time()
+        self.updated_at = now
+        if self.store is None or self.task_id is None:
+            return
+        if not force and now - self._saved_at < TASK_PROGRESS_SAVE_INTERVAL:
+            return
+        self._saved_at = now
+        self.store.save(self.task_id, self.to_dict())
+
+
+class TaskProgressStore:
+    """
+    Latest progress snapshot per task id, backed by SQLite.
+
+    save() is called from the event loop, so snapshots are only queued there and
+    written by a background thread, all pending ones in one transaction.
+    """
+
+    def __init__(self, path: str = TASK_PROGRESS_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS task_progress (
+                    task_id TEXT PRIMARY KEY,
+                    progress TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "DELETE FROM task_progress WHERE updated_at < ?",
+                (time.time() - TASK_PROGRESS_RETENTION,),
+            )
+        # Latest unwritten snapshot per task id
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._writer_thread = None
+
+    def save(self, task_id: str, progress: dict[str, Any]) -> None:
+        """Queue a snapshot for the writer thread, replacing an unwritten one"""
+        with self._pending_lock:
+            self._pending[task_id] = progress
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._write_pending,
+                    name="task-progress-writer",
+                    daemon=True,
+                )
+                self._writer_thread.start()
+        self._wakeup.set()
+
+    def _write_pending(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending snapshots"""
+        with self._lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            now = time.time()
+            try:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO task_progress VALUES (?, ?, ?)",
+                        [
+                            (task_id, json.dumps(progress), now)
+                            for task_id, progress in pending.items()
+                        ],
+                    )
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"Failed to persist progress of tasks {list(pending)}: {e}"
+                )
+
+    def get(self, task_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            with self._pending_lock:
+                progress = self._pending.get(task_id)
+            if progress is not None:
+                return progress
+            row = self._connection.execute(
+                "SELECT progress FROM task_progress WHERE task_id = ?", (task_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+_TASK_PROGRESS_STORE = None
+_TASK_PROGRESS_STORE_LOCK = threading.Lock()
+
+
+def get_task_progress_store() -> TaskProgressStore | None:
+    """Get the process wide task progress store, None if it is disabled or unusable"""
+    global _TASK_PROGRESS_STORE
+    if not ENABLE_TASK_PROGRESS_STORE:
+        return None
+    with _TASK_PROGRESS_STORE_LOCK:
+        if _TASK_PROGRESS_STORE is None:
+            try:
+                _TASK_PROGRESS_STORE = TaskProgressStore()
+                # Snapshots still queued on shutdown
+                atexit.register(_TASK_PROGRESS_STORE.flush)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    f"Task progress store disabled, could not open "
+                    f"{TASK_PROGRESS_DB_PATH}: {e}"
+                )
+                return None
+        return _TASK_PROGRESS_STORE
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Token budgets for summarization requests.
+
+Tokens are counted with the tiktoken encoding SUMMARY_TOKENIZER (cl100k_base by
+default), otherwise with a fast approximation (about 4 characters per token for
+ASCII text, one token per character for other scripts). Neither is the
+tokenizer of the summary model, so budgets against a context window keep a
+safety margin. The encoding is loaded on first use; tiktoken downloads it
+unless TIKTOKEN_CACHE_DIR holds a copy, so air-gapped deployments should
+pre-populate that directory or set SUMMARY_TOKENIZER to an empty value to use
+the approximation.
+
+1. count_tokens: Count or estimate the tokens of a text
+2. chars_to_tokens: Convert a character based setting to tokens
+3. get_token_budget: Tokens left for document text in one request
+4. split_by_tokens: Split a text into chunks of at most a token budget
+5. pack_by_tokens: Group texts so each group fits a token budget
+"""
+
+import logging
+import math
+import os
+import threading
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_TOKENIZER = os.getenv("SUMMARY_TOKENIZER", "cl100k_base")
+
+# Context window of the summarizer, 0 keeps the character based chunk size
+# (summarizer max_chunk_length) converted to tokens
+SUMMARY_CONTEXT_TOKENS = int(os.getenv("SUMMARY_CONTEXT_TOKENS", 0))
+# Tokens reserved for the generated summary
+SUMMARY_MAX_OUTPUT_TOKENS = int(os.getenv("SUMMARY_MAX_OUTPUT_TOKENS", 1024))
+
+_CHARS_PER_TOKEN = 4
+# Share of the context window filled, the token counts only approximate the
+# tokenizer of the summary model
+_CONTEXT_MARGIN = 0.9
+_MIN_BUDGET = 256
+_SEPARATORS = ["\n\n", "\n", ". ", "! ", "? ", " ", ""]
+
+_ENCODING = None
+_ENCODING_LOADED = False
+_ENCODING_LOCK = threading.Lock()
+
+
+def _get_encoding():
+    """Load the tiktoken encoding once, None if it is disabled or unavailable"""
+    global _ENCODING, _ENCODING_LOADED
+    if _ENCODING_LOADED:
+        return _ENCODING
+    with _ENCODING_LOCK:
+        if not _ENCODING_LOADED:
+            if SUMMARY_TOKENIZER:
+                try:
+                    import tiktoken
+
+                    _ENCODING = tiktoken.get_encoding(SUMMARY_TOKENIZER)
+                except Exception as e:
+                    logger.warning(
+                        f"Tokenizer {SUMMARY_TOKENIZER} unavailable, summary token "
+                        f"counts are estimated from the text length: {e}"
+                    )
+            _ENCODING_LOADED = True
+    return _ENCODING
+
+
+def count_tokens(text: str) -> int:
+    """Count the tokens of a text, estimated if no tokenizer is available"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return (ascii_chars + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN + (
+        len(text) - ascii_chars
+    )
+
+
+def chars_to_tokens(chars: int) -> int:
+    """Tokens of a character based setting (e.g. the chunk overlap), rounded up"""
+    return math.ceil(chars / _CHARS_PER_TOKEN)
+
+
+def get_token_budget(
+    prompt_text: str, max_chunk_chars: int, reserved_tokens: int = 0
+) -> int:
+    """
+    Tokens left for document text in one request: the request size minus the
+    prompt and any other reserved tokens (e.g. a previous summary). The request
+    size is the context window, less a safety margin and the generated summary,
+    or without a configured context window the character chunk size converted
+    to tokens.
+    """
+    if SUMMARY_CONTEXT_TOKENS > 0:
+        request_tokens = (
+            int(SUMMARY_CONTEXT_TOKENS * _CONTEXT_MARGIN) - SUMMARY_MAX_OUTPUT_TOKENS
+        )
+        setting = "SUMMARY_CONTEXT_TOKENS"
+    else:
+        request_tokens = max_chunk_chars // _CHARS_PER_TOKEN
+        setting = "the summarizer max_chunk_length"
+    budget = request_tokens - count_tokens(prompt_text) - reserved_tokens
+    if budget < _MIN_BUDGET:
+        logger.warning(
+            f"Summary token budget of {budget} is too small, check {setting}"
+        )
+    return max(_MIN_BUDGET, budget)
+
+
+def split_by_tokens(text: str, budget: int, overlap_tokens: int = 0) -> list[str]:
+    """Split a text at natural boundaries into chunks of at most budget tokens"""
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=budget,
+        chunk_overlap=min(overlap_tokens, budget // 2),
+        length_function=count_tokens,
+        separators=_SEPARATORS,
+    )
+    return text_splitter.split_text(text)
+
+
+def pack_by_tokens(texts: list[str], budget: int) -> list[list[str]]:
+    """Group consecutive texts so that each group fits budget tokens"""
+    groups = []
+    group_tokens = 0
+    for text in texts:
+        tokens = count_tokens(text)
+        if groups and group_tokens + tokens <= budget:
+            groups[-1].append(text)
+            group_tokens += tokens
+        else:
+            groups.append([text])
+            group_tokens = tokens
+    return groups
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared fixtures for the ingestor server unit tests"""
+
+from typing import Any
+
+import pytest
+
+
+class FakeMinioOperator:
+    """In-memory stand-in for the MinIO operator"""
+
+    def __init__(self):
+        self.objects: dict[str, dict[str, Any]] = {}
+        self.delete_calls: list[list[str]] = []
+
+    def put_payload(self, payload: dict[str, Any], object_name: str) -> None:
+        self.objects[object_name] = payload
+
+    def put_payloads_bulk(
+        self, payloads: list[dict[str, Any]], object_names: list[str]
+    ) -> None:
+        self.objects.update(zip(object_names, payloads, strict=True))
+
+    def get_payload(self, object_name: str) -> dict[str, Any]:
+        return self.objects[object_name]
+
+    def list_payloads(self, prefix: str = "") -> list[str]:
+        return [name for name in self.objects if name.startswith(prefix)]
+
+    def delete_payloads(self, object_names: list[str]) -> None:
+        self.delete_calls.append(list(object_names))
+        for object_name in object_names:
+            self.objects.pop(object_name, None)
+
+
+@pytest.fixture
+def minio_operator() -> FakeMinioOperator:
+    return FakeMinioOperator()
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the size-aware batch scheduling"""
+
+import pytest
+
+from nvidia_rag.ingestor_server.batch_scheduler import (
+    estimate_file_cost,
+    estimate_file_costs,
+    pack_batches,
+)
+
+
+def test_estimate_file_cost():
+    assert estimate_file_cost("a.pdf", size_bytes=1000 * 1024) == pytest.approx(10.5)
+    # A known page count wins over the size
+    assert estimate_file_cost("a.pdf", 1000 * 1024, page_count=3) == 3.5
+    assert estimate_file_cost("a.png", size_bytes=50 * 1024 * 1024) == 1.5
+    # Small files cost at least one page, unknown formats are costed as text
+    assert estimate_file_cost("a.txt", size_bytes=10) == 1.5
+    assert estimate_file_cost("a.md", size_bytes=2000 * 1024) == pytest.approx(10.5)
+
+
+def test_estimate_file_cost_stats_files(tmp_path):
+    filepath = tmp_path / "a.pdf"
+    filepath.write_bytes(b"x" * 300 * 1024)
+    assert estimate_file_cost(str(filepath)) == pytest.approx(3.5)
+    assert estimate_file_cost(str(tmp_path / "missing.pdf")) == 0.5
+
+
+def test_estimate_file_costs():
+    costs = estimate_file_costs(
+        ["a.pdf", "b.pdf"],
+        sizes={"a.pdf": 100 * 1024, "b.pdf": 100 * 1024},
+        page_counts={"b.pdf": 20},
+    )
+    assert costs == {"a.pdf": 1.5, "b.pdf": 20.5}
+
+
+def test_pack_batches_by_cost():
+    file_costs = {"big.pdf": 500.0, "a.pdf": 100.0, "b.pdf": 100.0, "c.pdf": 250.0}
+    batches = pack_batches(file_costs, max_files_per_batch=10, target_cost=300)
+    # A file above the target gets a batch of its own, most expensive batch first
+    assert batches == [["big.pdf"], ["c.pdf"], ["a.pdf", "b.pdf"]]
+
+
+def test_pack_batches_file_limit():
+    file_costs = {f"{i}.txt": 1.0 for i in range(5)}
+    batches = pack_batches(file_costs, max_files_per_batch=2, target_cost=100)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert sorted(filepath for batch in batches for filepath in batch) == sorted(
+        file_costs
+    )
+
+
+def test_pack_no_files():
+    assert pack_batches({}, max_files_per_batch=2) == []
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the deduplicated citation upload"""
+
+import pytest
+
+from nvidia_rag.ingestor_server.citation_dedup import CitationDeduplicator
+
+LOGO = {"content": "logo" * 10}
+CHART = {"content": "chart" * 10}
+CAPTION = {"content": "tiny"}
+
+
+@pytest.fixture
+def deduplicator(minio_operator):
+    uploads, copies = [], []
+
+    def upload(payloads, object_names):
+        uploads.append(list(object_names))
+        minio_operator.put_payloads_bulk(payloads, object_names)
+
+    def copy(source_object_name, object_name):
+        copies.append(object_name)
+        minio_operator.put_payload(
+            minio_operator.get_payload(source_object_name), object_name
+        )
+
+    deduplicator = CitationDeduplicator(upload, copy, min_bytes=20)
+    deduplicator.uploads, deduplicator.copies = uploads, copies
+    return deduplicator
+
+
+def test_repeated_payloads_are_copied(deduplicator, minio_operator):
+    deduplicator.upload(
+        [LOGO, CHART, LOGO, CAPTION, CAPTION], ["1", "2", "3", "4", "5"]
+    )
+    # A later chunk copies payloads stored by earlier ones
+    deduplicator.upload([LOGO, CHART], ["6", "7"])
+
+    # Readers still find the complete payload under every object name
+    assert minio_operator.objects == {
+        "1": LOGO,
+        "2": CHART,
+        "3": LOGO,
+        "4": CAPTION,
+        "5": CAPTION,
+        "6": LOGO,
+        "7": CHART,
+    }
+    # Small payloads are uploaded every time
+    assert deduplicator.uploads == [["1", "2", "4", "5"]]
+    assert deduplicator.copies == ["3", "6", "7"]
+    assert deduplicator.copied == 3
+
+
+def test_failed_copy_falls_back_to_upload(deduplicator, minio_operator):
+    deduplicator.upload([LOGO], ["1"])
+    # The source document was deleted meanwhile
+    minio_operator.delete_payloads(["1"])
+    deduplicator.upload([LOGO], ["2"])
+    assert minio_operator.objects == {"2": LOGO}
+    assert deduplicator.uploads == [["1"], ["2"]]
+    assert deduplicator.copied == 0
@@ -0,0 +1,350 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for document ingestion with an in-memory OpenSearch and nv-ingest"""
+
+import asyncio
+import functools
+import hashlib
+import os
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from nvidia_rag.ingestor_server import file_manifest, main
+from nvidia_rag.ingestor_server.fingerprint_index import (
+    FingerprintIndex,
+    plan_duplicates,
+)
+from nvidia_rag.ingestor_server.ingestion_journal import (
+    STAGE_CITATIONS,
+    IngestionJournal,
+)
+from nvidia_rag.ingestor_server.main import NvidiaRAGIngestor
+from nvidia_rag.ingestor_server.minio_uploader import MinioUploadStage
+
+
+class FakeNvIngest:
+    """Stands in for the nv-ingest upload: every line of a file is a page.
+
+    Records are handed to the operator's run(), as nv-ingest's vdb_upload does.
+    """
+
+    def __init__(self):
+        self.extracted: list[str] = []
+
+    async def upload(self, filepaths, collection_name, vdb_op=None, **kwargs):
+        records = []
+        for file in filepaths:
+            self.extracted.append(os.path.basename(file))
+            lines = Path(file).read_text().splitlines()
+            records.extend(
+                {
+                    "document_type": "text",
+                    "metadata": {
+                        "content": line,
+                        "embedding": [0.1, 0.2],
+                        "source_metadata": {"source_name": file, "source_id": file},
+                        "content_metadata": {"type": "text", "page_number": page},
+                    },
+                }
+                for page, line in enumerate(lines, start=1)
+            )
+        if records:
+            vdb_op.run(records)
+        return dict.fromkeys(filepaths, 1), []
+
+
+@pytest.fixture
+def nv_ingest(monkeypatch) -> FakeNvIngest:
+    nv_ingest = FakeNvIngest()
+    monkeypatch.setattr(
+        NvidiaRAGIngestor,
+        "_NvidiaRAGIngestor__nvingest_upload_doc",
+        lambda ingestor, *args, **kwargs: nv_ingest.upload(*args, **kwargs),
+    )
+    monkeypatch.setattr(main, "get_ingestion_journal", lambda: None)
+    monkeypatch.setattr(main, "get_fingerprint_index", lambda: None)
+    return nv_ingest
+
+
+@pytest.fixture
+def ingestor(vdb, nv_ingest) -> NvidiaRAGIngestor:
+    vdb.create_index()
+    return NvidiaRAGIngestor(vdb_op=vdb)
+
+
+@pytest.fixture
+def journal(monkeypatch, tmp_path, nv_ingest) -> IngestionJournal:
+    journal = IngestionJournal(str(tmp_path / "journal.sqlite"))
+    monkeypatch.setattr(main, "get_ingestion_journal", lambda: journal)
+    return journal
+
+
+@pytest.fixture
+def fingerprint_policy(monkeypatch, tmp_path, nv_ingest):
+    """Set DUPLICATE_CONTENT_POLICY for the test, backed by an index in tmp_path"""
+    index = FingerprintIndex(str(tmp_path / "fingerprints.sqlite"))
+    monkeypatch.setattr(main, "get_fingerprint_index", lambda: index)
+
+    def set_policy(policy: str) -> FingerprintIndex:
+        monkeypatch.setattr(
+            main, "plan_duplicates", functools.partial(plan_duplicates, policy=policy)
+        )
+        return index
+
+    return set_policy
+
+
+def write_file(tmp_path: Path, name: str, *pages: str) -> str:
+    path = tmp_path / name
+    path.write_text("\n".join(pages))
+    return str(path)
+
+
+def content_hash(file: str) -> str:
+    return hashlib.sha256(Path(file).read_bytes()).hexdigest()
+
+
+def interrupt_upload(journal: IngestionJournal, file: str, stage: str | None = None):
+    """Journal the file as left by an upload that did not complete"""
+    owner = journal.new_owner()
+    journal.start_files("docs", {os.path.basename(file): content_hash(file)}, owner)
+    if stage is not None:
+        journal.mark_stage("docs", [os.path.basename(file)], stage)
+    journal.release_owner(owner)
+
+
+def stored_texts(opensearch_client) -> dict[str, str]:
+    return {
+        doc_id: chunk["text"]
+        for doc_id, chunk in opensearch_client.documents["docs"].items()
+    }
+
+
+def test_upload_rejects_existing_documents(tmp_path, ingestor, nv_ingest):
+    file = write_file(tmp_path, "a.pdf", "intro", "body")
+    response = asyncio.run(ingestor.upload_documents([file], blocking=True))
+    assert [document["document_name"] for document in response["documents"]] == [
+        "a.pdf"
+    ]
+
+    response = asyncio.run(ingestor.upload_documents([file], blocking=True))
+    assert response["documents"] == []
+    assert [document["document_name"] for document in response["failed_documents"]] == [
+        "a.pdf"
+    ]
+    assert nv_ingest.extracted == ["a.pdf"]
+
+
+def test_diff_update_keeps_unchanged_chunks(tmp_path, vdb, ingestor, opensearch_client):
+    file = write_file(tmp_path, "a.pdf", "intro", "old")
+    asyncio.run(ingestor.upload_documents([file], blocking=True))
+    intro_id = next(
+        doc_id
+        for doc_id, text in stored_texts(opensearch_client).items()
+        if text == "intro"
+    )
+
+    file = write_file(tmp_path, "a.pdf", "intro", "new")
+    response = asyncio.run(
+        ingestor.update_documents([file], blocking=True, diff_update=True)
+    )
+    assert [document["document_name"] for document in response["documents"]] == [
+        "a.pdf"
+    ]
+    texts = stored_texts(opensearch_client)
+    assert sorted(texts.values()) == ["intro", "new"]
+    assert texts[intro_id] == "intro"
+    # The operator is shared by requests, the diff update used its own copy
+    assert not vdb.diff_update
+
+
+def test_failed_batch_stops_sibling_batches_before_closing_uploads(
+    monkeypatch, tmp_path, vdb
+):
+    monkeypatch.setattr(main, "ENABLE_NV_INGEST_BATCH_MODE", True)
+    monkeypatch.setattr(main, "ENABLE_NV_INGEST_PARALLEL_BATCH_MODE", True)
+    monkeypatch.setattr(main, "ENABLE_NV_INGEST_DYNAMIC_BATCHING", False)
+    monkeypatch.setattr(main, "NV_INGEST_FILES_PER_BATCH", 1)
+    monkeypatch.setattr(main, "NV_INGEST_CONCURRENT_BATCHES", 2)
+    events = []
+
+    async def nv_ingest_ingestion(ingestor, batch_number, **kwargs):
+        if batch_number == 1:
+            await asyncio.sleep(0)
+            raise RuntimeError("nv-ingest failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("batch cancelled")
+            raise
+        return {}, []
+
+    close = MinioUploadStage.close
+
+    async def close_uploader(uploader):
+        events.append("uploader closed")
+        return await close(uploader)
+
+    monkeypatch.setattr(
+        NvidiaRAGIngestor,
+        "_NvidiaRAGIngestor__nv_ingest_ingestion",
+        nv_ingest_ingestion,
+    )
+    monkeypatch.setattr(MinioUploadStage, "close", close_uploader)
+    filepaths = [write_file(tmp_path, f"{name}.pdf", name) for name in "ab"]
+
+    ingestor = NvidiaRAGIngestor(vdb_op=vdb)
+    with pytest.raises(RuntimeError, match="nv-ingest failed"):
+        asyncio.run(
+            ingestor._NvidiaRAGIngestor__nvingest_upload_doc(
+                filepaths=filepaths, collection_name="docs", vdb_op=vdb
+            )
+        )
+    assert events == ["batch cancelled", "uploader closed"]
+
+
+def test_journal_forgets_ingested_files(tmp_path, ingestor, nv_ingest, journal):
+    file = write_file(tmp_path, "a.pdf", "intro", "body")
+    asyncio.run(ingestor.upload_documents([file], blocking=True))
+    assert journal.get_entries("docs", ["a.pdf"]) == {}
+
+    # A completed upload is not resumed, uploading the file again is rejected
+    response = asyncio.run(ingestor.upload_documents([file], blocking=True))
+    assert response["documents"] == []
+    assert "already exists" in response["failed_documents"][0]["error_message"]
+    assert nv_ingest.extracted == ["a.pdf"]
+
+
+def test_journal_reingests_files_left_halfway(
+    tmp_path, ingestor, nv_ingest, journal, opensearch_client
+):
+    file = write_file(tmp_path, "a.pdf", "intro", "body")
+    asyncio.run(ingestor.upload_documents([file], blocking=True))
+    interrupt_upload(journal, file)
+
+    response = asyncio.run(ingestor.upload_documents([file], blocking=True))
+    assert [document["document_name"] for document in response["documents"]] == [
+        "a.pdf"
+    ]
+    assert response["failed_documents"] == []
+    assert nv_ingest.extracted == ["a.pdf", "a.pdf"]
+    assert sorted(stored_texts(opensearch_client).values()) == ["body", "intro"]
+    assert journal.get_entries("docs", ["a.pdf"]) == {}
+
+
+def test_journal_skips_files_completed_by_interrupted_upload(
+    tmp_path, ingestor, nv_ingest, journal
+):
+    file = write_file(tmp_path, "a.pdf", "intro", "body")
+    asyncio.run(ingestor.upload_documents([file], blocking=True))
+    interrupt_upload(journal, file, STAGE_CITATIONS)
+
+    response = asyncio.run(ingestor.upload_documents([file], blocking=True))
+    assert [document["document_name"] for document in response["documents"]] == [
+        "a.pdf"
+    ]
+    assert response["failed_documents"] == []
+    assert nv_ingest.extracted == ["a.pdf"]
+    assert journal.get_entries("docs", ["a.pdf"]) == {}
+
+
+def test_journal_does_not_resume_changed_files(tmp_path, ingestor, nv_ingest, journal):
+    file = write_file(tmp_path, "a.pdf", "intro", "body")
+    asyncio.run(ingestor.upload_documents([file], blocking=True))
+    interrupt_upload(journal, file)
+
+    file = write_file(tmp_path, "a.pdf", "intro", "changed")
+    response = asyncio.run(ingestor.upload_documents([file], blocking=True))
+    assert response["documents"] == []
+    assert "already exists" in response["failed_documents"][0]["error_message"]
+    assert nv_ingest.extracted == ["a.pdf"]
+
+
+def test_journal_rejects_files_of_running_upload(tmp_path, ingestor, journal):
+    file = write_file(tmp_path, "a.pdf", "intro")
+    journal.start_files("docs", {"a.pdf": content_hash(file)}, journal.new_owner())
+
+    response = asyncio.run(ingestor.upload_documents([file], blocking=True))
+    assert response["documents"] == []
+    assert (
+        "being ingested by another upload"
+        in (response["failed_documents"][0]["error_message"])
+    )
+
+
+def test_identical_file_is_aliased_without_extraction(
+    tmp_path, ingestor, nv_ingest, fingerprint_policy, opensearch_client
+):
+    fingerprint_policy("alias")
+    file = write_file(tmp_path, "a.pdf", "intro", "body")
+    asyncio.run(ingestor.upload_documents([file], blocking=True))
+
+    copy = write_file(tmp_path, "copy.pdf", "intro", "body")
+    response = asyncio.run(ingestor.upload_documents([copy], blocking=True))
+    assert [document["document_name"] for document in response["documents"]] == [
+        "copy.pdf"
+    ]
+    assert nv_ingest.extracted == ["a.pdf"]
+    texts = defaultdict(list)
+    for chunk in opensearch_client.documents["docs"].values():
+        texts[chunk["metadata"]["document_name"]].append(chunk["text"])
+    assert {name: sorted(chunks) for name, chunks in texts.items()} == {
+        "a.pdf": ["body", "intro"],
+        "copy.pdf": ["body", "intro"],
+    }
+
+
+def test_identical_file_is_rejected(tmp_path, ingestor, nv_ingest, fingerprint_policy):
+    fingerprint_policy("reject")
+    file = write_file(tmp_path, "a.pdf", "intro", "body")
+    asyncio.run(ingestor.upload_documents([file], blocking=True))
+
+    copy = write_file(tmp_path, "copy.pdf", "intro", "body")
+    response = asyncio.run(ingestor.upload_documents([copy], blocking=True))
+    assert response["documents"] == []
+    assert (
+        "same content as document a.pdf"
+        in (response["failed_documents"][0]["error_message"])
+    )
+    assert nv_ingest.extracted == ["a.pdf"]
+
+
+def test_unsupported_files_are_reported_from_the_manifest(
+    monkeypatch, tmp_path, ingestor
+):
+    stat_calls = []
+    stat_file = file_manifest._stat_file
+
+    def counting_stat_file(filepath):
+        stat_calls.append(os.path.basename(filepath))
+        return stat_file(filepath)
+
+    monkeypatch.setattr(file_manifest, "_stat_file", counting_stat_file)
+    filepaths = [
+        write_file(tmp_path, "a.pdf", "intro"),
+        write_file(tmp_path, "b.xyz", "notes"),
+    ]
+    response = asyncio.run(ingestor.upload_documents(filepaths, blocking=True))
+    assert [document["document_name"] for document in response["documents"]] == [
+        "a.pdf"
+    ]
+    failed_document = response["failed_documents"][0]
+    assert failed_document["document_name"] == "b.xyz"
+    assert failed_document["error_message"].startswith("Unsupported file type")
+    # Every file is stat-ed once, when the manifest is built
+    assert sorted(stat_calls) == ["a.pdf", "b.xyz"]
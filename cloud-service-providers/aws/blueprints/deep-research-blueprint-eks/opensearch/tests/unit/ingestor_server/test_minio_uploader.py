@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the MinIO upload stage"""
+
+import asyncio
+
+import pytest
+
+from nvidia_rag.ingestor_server import minio_uploader
+from nvidia_rag.ingestor_server.minio_uploader import MinioUploadStage
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args, **kwargs):
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+
+def test_batches_are_uploaded_in_chunks(minio_operator):
+    async def run():
+        stage = MinioUploadStage(
+            minio_operator.put_payloads_bulk, workers=2, queue_size=1, chunk_size=2
+        )
+        first = await stage.submit(
+            "first", [{"i": i} for i in range(5)], [f"a/{i}" for i in range(5)]
+        )
+        empty = await stage.submit("empty", [], [])
+        second = await stage.submit("second", [{"i": 0}], ["b/0"])
+        return await first, await empty, await second, await stage.close()
+
+    assert asyncio.run(run()) == (5, 0, 1, 0)
+    assert sorted(minio_operator.objects) == [f"a/{i}" for i in range(5)] + ["b/0"]
+
+
+def test_failed_chunks_are_retried_and_counted():
+    attempts = []
+
+    def upload_fn(payloads, object_names):
+        attempts.append(object_names[0])
+        if object_names[0] == "bad":
+            raise OSError("unreachable")
+
+    async def run():
+        stage = MinioUploadStage(upload_fn, workers=1, chunk_size=1, max_retries=3)
+        done = await stage.submit("batch", [{}, {}], ["bad", "good"])
+        return await done, await stage.close()
+
+    assert asyncio.run(run()) == (1, 1)
+    assert attempts.count("bad") == 3
+    assert attempts.count("good") == 1
+
+
+def test_worker_error_fails_the_batch_without_hanging(monkeypatch, minio_operator):
+    def record_minio_objects(*args, **kwargs):
+        raise RuntimeError("metrics unavailable")
+
+    monkeypatch.setattr(minio_uploader, "record_minio_objects", record_minio_objects)
+
+    async def run():
+        stage = MinioUploadStage(minio_operator.put_payloads_bulk, workers=1)
+        done = await stage.submit("batch", [{}], ["a"])
+        with pytest.raises(RuntimeError, match="metrics unavailable"):
+            await done
+        # close() still returns, the objects themselves were stored
+        return await asyncio.wait_for(stage.close(), timeout=5)
+
+    assert asyncio.run(run()) == 0
+    assert list(minio_operator.objects) == ["a"]
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the columnar nv-ingest result decoding"""
+
+from nvidia_rag.ingestor_server.result_columns import ResultColumns
+
+
+def _element(document_type, source_id, page_number=None, location=None, **metadata):
+    content_metadata = {"page_number": page_number}
+    if location is not None:
+        content_metadata["location"] = location
+    content_metadata.update(metadata.pop("content_metadata", {}))
+    return {
+        "document_type": document_type,
+        "metadata": {
+            "source_metadata": {"source_id": source_id},
+            "content_metadata": content_metadata,
+            **metadata,
+        },
+    }
+
+
+RESULTS = [
+    [
+        _element("text", "/tmp/a.pdf", 1, content="first page"),
+        _element(
+            "structured",
+            "/tmp/a.pdf",
+            2,
+            [1.0, 2.0, 3.0, 4.0],
+            content="base64-table",
+            table_metadata={"table_content": "| a | b |"},
+            content_metadata={"subtype": "table"},
+        ),
+        _element(
+            "image",
+            "/tmp/a.pdf",
+            2,
+            [5.0, 6.0, 7.0, 8.0],
+            content="base64-image",
+            image_metadata={"caption": "a chart"},
+        ),
+    ],
+    [],
+    [
+        _element("text", "/tmp/b.txt", content="plain text"),
+        _element("audio", "/tmp/b.txt", audio_metadata={"audio_transcript": "hello"}),
+    ],
+]
+
+
+def test_decode_columns():
+    columns = ResultColumns.decode(RESULTS)
+
+    assert len(columns) == 5
+    assert columns.sources == ["/tmp/a.pdf", "/tmp/b.txt"]
+    assert [columns.document_type(i) for i in range(5)] == [
+        "text",
+        "structured",
+        "image",
+        "text",
+        "audio",
+    ]
+    assert columns.subtype(1) == "table"
+    assert columns.subtype(0) == ""
+    assert columns.source(3) == "/tmp/b.txt"
+    assert [columns.page_number(i) for i in range(5)] == [1, 2, 2, None, None]
+    assert [columns.get_text(i) for i in range(5)] == [
+        "first page",
+        "| a | b |",
+        "a chart",
+        "plain text",
+        "hello",
+    ]
+    assert list(columns.source_elements(1)) == [3, 4]
+
+
+def test_counts_and_sizes():
+    columns = ResultColumns.decode(RESULTS)
+
+    assert columns.source_counts() == {"/tmp/a.pdf": 3, "/tmp/b.txt": 2}
+    assert columns.type_counts() == {
+        "text": 2,
+        "structured(table)": 1,
+        "image": 1,
+        "audio": 1,
+    }
+    assert columns.text_size() == len("first page") + len("plain text")
+    assert columns.text_size("audio") == len("hello")
+    assert columns.text_size("video") == 0
+
+
+def test_citations():
+    assert list(ResultColumns.decode(RESULTS).iter_citations()) == [
+        ("a.pdf", 2, [1.0, 2.0, 3.0, 4.0], "base64-table"),
+        ("a.pdf", 2, [5.0, 6.0, 7.0, 8.0], "base64-image"),
+    ]
+    assert (
+        list(ResultColumns.decode(RESULTS, keep_citations=False).iter_citations()) == []
+    )
+
+
+def test_decode_empty_results():
+    columns = ResultColumns.decode([])
+    assert len(columns) == 0
+    assert columns.source_counts() == {}
+    assert columns.type_counts() == {}
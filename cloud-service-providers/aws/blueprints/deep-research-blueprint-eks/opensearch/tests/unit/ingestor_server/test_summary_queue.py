@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the summary job queue"""
+
+import asyncio
+
+import pytest
+from langchain_core.documents import Document
+
+from nvidia_rag.ingestor_server import summary_queue
+from nvidia_rag.ingestor_server.summary_queue import SummaryJobQueue
+
+
+def _document(filename: str) -> Document:
+    return Document(
+        page_content="text",
+        metadata={"filename": filename, "collection_name": "docs"},
+    )
+
+
+async def _run_jobs(queue: SummaryJobQueue, documents, process_fn, task_id):
+    await queue.submit(documents, process_fn, task_id)
+    await queue._start().join()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    sleep = asyncio.sleep
+    delays = []
+
+    async def fake_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def recorded_summaries(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(
+        summary_queue,
+        "record_summaries",
+        lambda count, status: recorded.append((count, status)),
+    )
+    return recorded
+
+
+def test_jobs_are_processed():
+    processed = []
+
+    async def process_fn(documents):
+        processed.extend(document.metadata["filename"] for document in documents)
+
+    queue = SummaryJobQueue(workers=2, queue_size=1)
+    documents = [_document(f"{i}.pdf") for i in range(5)]
+    asyncio.run(_run_jobs(queue, documents, process_fn, "task"))
+
+    assert sorted(processed) == [f"{i}.pdf" for i in range(5)]
+    status = queue.get_status("task")
+    assert status["total"] == 5
+    assert status["done"] == 5
+    assert status["queue_depth"] == 0
+    assert queue.get_status("other") is None
+
+
+def test_job_is_retried_until_success(no_backoff, recorded_summaries):
+    attempts = []
+
+    async def process_fn(documents):
+        attempts.append(documents[0].metadata["filename"])
+        if len(attempts) < 3:
+            raise RuntimeError("summarizer unavailable")
+
+    queue = SummaryJobQueue(workers=1, max_retries=2)
+    asyncio.run(_run_jobs(queue, [_document("a.pdf")], process_fn, "task"))
+
+    (job,) = queue.get_status("task")["documents"]
+    assert job["state"] == "DONE"
+    assert job["attempts"] == 3
+    assert job["error"] is None
+    assert no_backoff == [2.0, 4.0]
+    # Failed attempts that were retried are not counted
+    assert recorded_summaries == [(1, "done")]
+
+
+def test_job_fails_after_retries(no_backoff, recorded_summaries):
+    async def process_fn(documents):
+        raise RuntimeError("boom")
+
+    queue = SummaryJobQueue(workers=1, max_retries=1)
+    asyncio.run(_run_jobs(queue, [_document("a.pdf")], process_fn, "task"))
+
+    status = queue.get_status("task")
+    assert status["failed"] == 1
+    assert status["documents"][0]["error"] == "boom"
+    assert status["documents"][0]["attempts"] == 2
+    assert recorded_summaries == [(1, "failed")]
+
+
+def test_cached_summaries_are_counted(recorded_summaries):
+    async def process_fn(documents):
+        documents[0].metadata["summary_cached"] = True
+
+    queue = SummaryJobQueue(workers=1)
+    asyncio.run(_run_jobs(queue, [_document("a.pdf")], process_fn, "task"))
+    assert recorded_summaries == [(1, "cached")]
+
+
+def test_queue_works_across_event_loops():
+    processed = []
+
+    async def process_fn(documents):
+        processed.append(documents[0].metadata["filename"])
+
+    queue = SummaryJobQueue(workers=1)
+    asyncio.run(_run_jobs(queue, [_document("a.pdf")], process_fn, "first"))
+    asyncio.run(_run_jobs(queue, [_document("b.pdf")], process_fn, "second"))
+
+    assert processed == ["a.pdf", "b.pdf"]
+    assert queue.get_status("first")["done"] == 1
+    assert queue.get_status("second")["done"] == 1
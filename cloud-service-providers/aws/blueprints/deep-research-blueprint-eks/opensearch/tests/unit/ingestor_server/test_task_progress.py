@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the persisted ingestion task progress"""
+
+import threading
+
+import pytest
+
+from nvidia_rag.ingestor_server import task_progress
+from nvidia_rag.ingestor_server.task_progress import (
+    IngestionProgress,
+    TaskProgressStore,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TaskProgressStore(str(tmp_path / "progress.sqlite"))
+
+
+def test_progress_counters():
+    progress = IngestionProgress("docs")
+    progress.add_plan(total_files=4, total_batches=2, total_bytes=1000)
+    progress.record_stage("extraction", 1.5)
+    progress.record_stage("extraction", 2.0)
+    progress.batch_done(files_indexed=1, files_failed=1, chunks=10, size_bytes=400)
+
+    snapshot = progress.to_dict()
+    assert snapshot["collection_name"] == "docs"
+    assert snapshot["state"] == "RUNNING"
+    assert snapshot["batches_done"] == 1
+    assert snapshot["total_batches"] == 2
+    assert snapshot["files_indexed"] == 1
+    assert snapshot["files_failed"] == 1
+    assert snapshot["chunks_indexed"] == 10
+    assert snapshot["stage_seconds"] == {"extraction": 3.5}
+    assert snapshot["eta_seconds"] is not None
+
+
+def test_finished_progress_has_no_eta():
+    progress = IngestionProgress("docs")
+    progress.add_plan(1, 1, 100)
+    assert progress.to_dict()["eta_seconds"] is None
+    progress.batch_done(1, 0, 1, 100)
+    progress.finish("FINISHED")
+    snapshot = progress.to_dict()
+    assert snapshot["state"] == "FINISHED"
+    assert snapshot["finished_at"] is not None
+    assert snapshot["eta_seconds"] is None
+
+
+def test_store_round_trip(store):
+    assert store.get("task") is None
+    store.save("task", {"state": "RUNNING"})
+    store.save("task", {"state": "FINISHED"})
+    assert store.get("task") == {"state": "FINISHED"}
+    # Snapshots survive a new store on the same file
+    store.flush()
+    assert TaskProgressStore(store.path).get("task") == {"state": "FINISHED"}
+
+
+def test_saves_are_throttled(store, monkeypatch):
+    monkeypatch.setattr(task_progress, "TASK_PROGRESS_SAVE_INTERVAL", 3600)
+    progress = IngestionProgress("docs")
+    progress.bind("task", store)
+    assert store.get("task")["task_id"] == "task"
+
+    progress.batch_done(1, 0, 5, 100)
+    assert store.get("task")["files_indexed"] == 0
+    progress.finish("FINISHED")
+    assert store.get("task")["files_indexed"] == 1
+    assert store.get("task")["state"] == "FINISHED"
+
+
+def test_old_snapshots_are_pruned(store, monkeypatch):
+    store.save("task", {"state": "FINISHED"})
+    store.flush()
+    monkeypatch.setattr(task_progress, "TASK_PROGRESS_RETENTION", -1)
+    assert TaskProgressStore(store.path).get("task") is None
+
+
+def test_save_does_not_wait_for_the_database(store):
+    # Holds the database as a long running write would
+    with store._lock:
+        saver = threading.Thread(target=store.save, args=("task", {"state": "RUNNING"}))
+        saver.start()
+        saver.join(timeout=5)
+        assert not saver.is_alive()
+    assert store.get("task") == {"state": "RUNNING"}
+    store.flush()
+    assert TaskProgressStore(store.path).get("task") == {"state": "RUNNING"}
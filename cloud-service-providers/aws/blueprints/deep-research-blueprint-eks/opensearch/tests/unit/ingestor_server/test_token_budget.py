@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the summary token budgets"""
+
+import pytest
+
+from nvidia_rag.ingestor_server import token_budget
+from nvidia_rag.ingestor_server.token_budget import (
+    chars_to_tokens,
+    count_tokens,
+    get_token_budget,
+    pack_by_tokens,
+    split_by_tokens,
+)
+
+
+@pytest.fixture(autouse=True)
+def approximate_tokens(monkeypatch):
+    # Use the length based approximation, the encoding may not be downloadable
+    monkeypatch.setattr(token_budget, "_ENCODING", None)
+    monkeypatch.setattr(token_budget, "_ENCODING_LOADED", True)
+    monkeypatch.setattr(token_budget, "SUMMARY_CONTEXT_TOKENS", 0)
+
+
+def test_count_tokens_approximation():
+    assert count_tokens("") == 0
+    assert count_tokens("abcd") == 1
+    assert count_tokens("abcde") == 2
+    # Characters of other scripts count as one token each
+    assert count_tokens("abcd日本") == 3
+
+
+def test_chars_to_tokens():
+    assert chars_to_tokens(0) == 0
+    assert chars_to_tokens(1) == 1
+    assert chars_to_tokens(200) == 50
+    assert chars_to_tokens(201) == 51
+
+
+def test_budget_from_chunk_size():
+    assert get_token_budget("a" * 400, max_chunk_chars=8000) == 2000 - 100
+    assert get_token_budget("", 8000, reserved_tokens=500) == 1500
+
+
+def test_budget_from_context_window(monkeypatch):
+    monkeypatch.setattr(token_budget, "SUMMARY_CONTEXT_TOKENS", 10000)
+    monkeypatch.setattr(token_budget, "SUMMARY_MAX_OUTPUT_TOKENS", 1000)
+    assert get_token_budget("a" * 400, 8000, reserved_tokens=900) == (
+        9000 - 1000 - 100 - 900
+    )
+
+
+@pytest.mark.parametrize("context_tokens", [0, 1000])
+def test_budget_has_a_floor(monkeypatch, context_tokens):
+    monkeypatch.setattr(token_budget, "SUMMARY_CONTEXT_TOKENS", context_tokens)
+    assert get_token_budget("a" * 4000, 2000, reserved_tokens=5000) == 256
+
+
+def test_split_by_tokens():
+    text = " ".join(f"word{i:03d}" for i in range(200))
+    chunks = split_by_tokens(text, budget=20, overlap_tokens=5)
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk) <= 20 for chunk in chunks)
+    assert chunks[0].startswith("word000")
+    assert chunks[-1].endswith("word199")
+
+
+def test_pack_by_tokens():
+    texts = ["a" * 40, "b" * 40, "c" * 40, "d" * 200]
+    assert pack_by_tokens(texts, budget=20) == [texts[:2], [texts[2]], [texts[3]]]
+    assert pack_by_tokens([], budget=20) == []
@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the OpenSearch VDB"""
+
+from collections import defaultdict
+from typing import Any
+
+import pytest
+
+from nvidia_rag.utils.vdb.opensearch import opensearch_vdb
+from nvidia_rag.utils.vdb.opensearch.opensearch_vdb import _poll_with_backoff
+
+
+class FakeClock:
+    """Replaces the time module of opensearch_vdb, sleeping advances the clock"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    time = perf_counter = monotonic
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(opensearch_vdb, "time", clock)
+    return clock
+
+
+def make_record(source_name: str, text: str, page_number: int = 1) -> dict[str, Any]:
+    """An nv-ingest text record as passed to write_to_index()"""
+    return {
+        "document_type": "text",
+        "metadata": {
+            "content": text,
+            "embedding": [0.1, 0.2],
+            "source_metadata": {"source_name": source_name, "source_id": source_name},
+            "content_metadata": {"type": "text", "page_number": page_number},
+        },
+    }
+
+
+def stored_chunks(opensearch_client, index: str = "docs") -> dict[str, dict[str, Any]]:
+    return opensearch_client.documents.get(index, {})
+
+
+def test_write_to_index_keys_chunks_by_id(vdb, opensearch_client):
+    records = [
+        make_record("/data/a.pdf", "intro"),
+        make_record("/data/a.pdf", "body", 2),
+    ]
+    vdb.write_to_index(records)
+    chunks = stored_chunks(opensearch_client)
+    assert len(chunks) == 2
+    assert {chunk["metadata"]["chunk_id"] for chunk in chunks.values()} == set(chunks)
+    assert vdb.pop_written_chunk_counts(["/data/a.pdf"]) == {"/data/a.pdf": 2}
+
+    # Writing the same records again (a retried batch) stores nothing twice
+    vdb.write_to_index(records)
+    assert len(stored_chunks(opensearch_client)) == 2
+    assert vdb.pop_written_chunk_counts(["/data/a.pdf"]) == {"/data/a.pdf": 2}
+
+
+def test_write_to_index_keeps_same_text_on_different_pages(vdb, opensearch_client):
+    vdb.write_to_index(
+        [
+            make_record("/data/a.pdf", "Confidential", 1),
+            make_record("/data/a.pdf", "Confidential", 2),
+            make_record("/data/a.pdf", "Confidential", 2),
+        ]
+    )
+    chunks = stored_chunks(opensearch_client).values()
+    assert sorted(
+        chunk["metadata"]["content_metadata"]["page_number"] for chunk in chunks
+    ) == [1, 2]
+
+
+def test_write_to_index_without_custom_ids_skips_stored_chunks(
+    monkeypatch, vdb, opensearch_client
+):
+    monkeypatch.setenv("APP_VECTORSTORE_CUSTOM_IDS", "false")
+    records = [
+        make_record("/data/a.pdf", "intro"),
+        make_record("/data/a.pdf", "body", 2),
+    ]
+    vdb.write_to_index(records[:1])
+    vdb.write_to_index(records)
+    assert len(stored_chunks(opensearch_client)) == 2
+    assert vdb.pop_written_chunk_counts(["/data/a.pdf"]) == {"/data/a.pdf": 3}
+
+
+def test_poll_with_backoff_returns_once_done(clock):
+    results = iter([(False, 1), (False, 1), (True, 0)])
+    assert _poll_with_backoff(lambda: next(results), 10, 0.5, 4) == (True, 0)
+    assert clock.sleeps == [0.5, 1.0]
+
+
+def test_poll_with_backoff_stops_at_deadline(clock):
+    assert _poll_with_backoff(lambda: (False, 3), 10, 1, 4) == (False, 3)
+    # Delays double up to max_delay and the last one ends at the deadline
+    assert clock.sleeps == [1, 2, 4, 3]
+    assert clock.now == 10
+
+
+def test_wait_for_visibility_polls_until_chunks_are_searchable(
+    vdb, opensearch_client, clock
+):
+    opensearch_client.visibility_delay = 2
+    for source_name, chunk_count in [("/data/a.pdf", 2), ("/data/b.pdf", 1)]:
+        for _ in range(chunk_count):
+            opensearch_client.add(
+                "docs", {"metadata": {"source": {"source_name": source_name}}}
+            )
+    observed = vdb.wait_for_visibility(
+        "docs", {"/data/a.pdf": 2, "/data/b.pdf": 1}, timeout=30
+    )
+    assert observed == {"/data/a.pdf": 2, "/data/b.pdf": 1}
+    assert opensearch_client.search_calls == 3
+    assert len(clock.sleeps) == 2
+
+
+def test_wait_for_visibility_reports_missing_chunks_at_deadline(
+    vdb, opensearch_client, clock
+):
+    opensearch_client.add(
+        "docs", {"metadata": {"source": {"source_name": "/data/a.pdf"}}}
+    )
+    observed = vdb.wait_for_visibility("docs", {"/data/a.pdf": 2}, timeout=5)
+    assert observed == {"/data/a.pdf": 1}
+    assert clock.now == 5
+
+
+def test_documents_exist_looks_up_requested_names(monkeypatch, vdb, opensearch_client):
+    monkeypatch.setattr(opensearch_vdb, "SOURCE_COUNTS_BATCH_SIZE", 4)
+    vdb.write_to_index(
+        [make_record("/data/a.pdf", "a"), make_record("/data/c.pdf", "c")]
+    )
+    # Written before document names were stored, matched by source
+    opensearch_client.add(
+        "docs", {"metadata": {"source": {"source_name": "/uploads/legacy.pdf"}}}
+    )
+    opensearch_client.search_calls = 0
+    existing = vdb.documents_exist(
+        "docs",
+        ["a.pdf", "b.pdf", "c.pdf", "a.pdf", "legacy.pdf"],
+        ["/uploads/legacy.pdf"],
+    )
+    assert existing == {"a.pdf", "c.pdf", "legacy.pdf"}
+    # Four distinct names looked up two at a time
+    assert opensearch_client.search_calls == 2
+
+
+def test_diff_update_replaces_only_changed_chunks(vdb, opensearch_client):
+    vdb.write_to_index(
+        [
+            make_record("/data/a.pdf", "intro"),
+            make_record("/data/a.pdf", "old", 2),
+            make_record("/data/b.pdf", "other"),
+        ]
+    )
+    vdb.pop_written_chunk_counts(["/data/a.pdf", "/data/b.pdf"])
+    opensearch_client.bulk_calls.clear()
+
+    # nv-ingest runs the operator without options, the copy carries the flag
+    diff_update_op = vdb.with_diff_update()
+    diff_update_op.run(
+        [make_record("/data/a.pdf", "intro"), make_record("/data/a.pdf", "new", 2)]
+    )
+    assert not vdb.diff_update
+
+    texts = defaultdict(set)
+    for chunk in stored_chunks(opensearch_client).values():
+        texts[chunk["metadata"]["source"]["source_name"]].add(chunk["text"])
+    assert texts == {"/data/a.pdf": {"intro", "new"}, "/data/b.pdf": {"other"}}
+    # Only the new chunk is written, then the removed one is deleted
+    written, deleted = opensearch_client.bulk_calls
+    assert [line["text"] for line in written[1::2]] == ["new"]
+    assert len(deleted) == 1 and "delete" in deleted[0]
+    assert vdb.pop_written_chunk_counts(["/data/a.pdf"]) == {"/data/a.pdf": 2}
+
+
+def test_diff_update_lists_every_stored_chunk(vdb, opensearch_client):
+    # More stored chunks than a single scroll page returns
+    vdb.write_to_index(
+        [make_record("/data/a.pdf", f"old {page}", page) for page in range(1500)]
+    )
+    vdb.write_to_index([make_record("/data/a.pdf", "new")], diff_update=True)
+    assert [chunk["text"] for chunk in stored_chunks(opensearch_client).values()] == [
+        "new"
+    ]
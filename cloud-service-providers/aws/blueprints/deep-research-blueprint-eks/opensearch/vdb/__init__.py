@@ -35,11 +35,16 @@ def _get_vdb_op(
     Get VDBRag class object based on the environment variables.
     """
     # Get metadata configuration
-    csv_file_path, meta_source_field, meta_fields = get_metadata_configuration(
-        collection_name=collection_name,
-        custom_metadata=custom_metadata,
-        all_file_paths=all_file_paths,
-    )
+    if CONFIG.vector_store.name == "opensearch":
+        # OpenSearch joins custom metadata from an in-memory index keyed by
+        # filename, so the temporary CSV round trip is not needed
+        csv_file_path, meta_source_field, meta_fields = None, None, None
+    else:
+        csv_file_path, meta_source_field, meta_fields = get_metadata_configuration(
+            collection_name=collection_name,
+            custom_metadata=custom_metadata,
+            all_file_paths=all_file_paths,
+        )
 
     # Get VDBRag class object based on the environment variables.
     if CONFIG.vector_store.name == "milvus":
@@ -102,22 +107,15 @@ def _get_vdb_op(
         # OpenSearch backend (parity with Elasticsearch, with richer auth support)
         from nvidia_rag.utils.vdb.opensearch.opensearch_vdb import (
             OpenSearchVDB,
+            build_metadata_index,
         )
 
-        if csv_file_path is not None:
-            meta_dataframe = pandas_file_reader(csv_file_path)
-        else:
-            meta_dataframe = None
-
         return OpenSearchVDB(
             opensearch_url=vdb_endpoint or CONFIG.vector_store.url,
             index_name=collection_name,
             embedding_model=embedding_model,
-            meta_dataframe=meta_dataframe,
-            meta_source_field=meta_source_field,
-            meta_fields=meta_fields,
             hybrid=CONFIG.vector_store.search_type == "hybrid",
-            csv_file_path=csv_file_path,
+            metadata_index=build_metadata_index(custom_metadata),
         )
 
     else:
@@ -26,15 +26,21 @@ Connection options:
 Mirrors ElasticVDB structure for drop-in parity.
 """
 
+import asyncio
+import copy
+import hashlib
+import json
 import logging
 import os
+import threading
 import time
+from collections import Counter
 from typing import Any
 
 import pandas as pd
+from langchain_community.vectorstores import OpenSearchVectorSearch
 from langchain_core.documents import Document
 from langchain_core.runnables import RunnableAssign, RunnableLambda
-from langchain_community.vectorstores import OpenSearchVectorSearch
 
 try:
     from nv_ingest_client.util.milvus import cleanup_records
@@ -47,21 +53,150 @@ except Exception:  # pragma: no cover - optional dependency in some environments
     ):
         return records
 
+from opentelemetry import context as otel_context
+from opentelemetry import metrics, trace
+
 from nvidia_rag.utils.common import get_config
 from nvidia_rag.utils.vdb import DEFAULT_METADATA_SCHEMA_COLLECTION
 from nvidia_rag.utils.vdb.opensearch.os_queries import (
+    SOURCE_CHUNKS_MAX_HITS,
     create_metadata_collection_mapping,
+    get_chunk_ids_query,
     get_delete_docs_query,
     get_delete_metadata_schema_query,
+    get_document_names_query,
     get_metadata_schema_query,
+    get_source_chunks_query,
+    get_source_counts_query,
+    get_source_documents_query,
     get_unique_sources_query,
 )
 from nvidia_rag.utils.vdb.vdb_base import VDBRag
-from opentelemetry import context as otel_context
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 CONFIG = get_config()
 
+# Eventual-consistency polling: first delay and cap for the exponential backoff
+CONSISTENCY_INITIAL_DELAY = float(os.getenv("APP_VECTORSTORE_CONSISTENCY_INITIAL_DELAY", 0.5))
+CONSISTENCY_MAX_DELAY = float(os.getenv("APP_VECTORSTORE_CONSISTENCY_MAX_DELAY", 10))
+# Max sources per terms query when counting chunks
+SOURCE_COUNTS_BATCH_SIZE = 1000
+# Chunks per bulk request when writing to the index
+BULK_BATCH_SIZE = int(os.getenv("OS_BULK_BATCH_SIZE", 200))
+# Action lines of a bulk body, the other lines are documents
+_BULK_ACTIONS = {"index", "create", "update", "delete"}
+
+# Low-level clients are shared across OpenSearchVDB instances. The TTL bounds how
+# long frozen SigV4 credentials are reused, so IRSA credential rotation is honoured.
+CLIENT_CACHE_TTL = float(os.getenv("OS_CLIENT_CACHE_TTL", 300))
+_CLIENT_CACHE: dict[str, tuple[float, Any]] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Write path metrics, no-ops unless a meter provider is configured
+_METER = metrics.get_meter(__name__)
+_BULK_DURATION = _METER.create_histogram(
+    "rag_vdb_bulk_duration",
+    unit="s",
+    description="Latency of OpenSearch bulk requests, by operation",
+)
+_BULK_BYTES = _METER.create_counter(
+    "rag_vdb_bulk_bytes",
+    unit="By",
+    description="Request bytes sent with OpenSearch bulk requests, by operation",
+)
+_BULK_ITEMS = _METER.create_counter(
+    "rag_vdb_bulk_items",
+    description="Items sent with OpenSearch bulk requests, by operation",
+)
+_REFRESH_DURATION = _METER.create_histogram(
+    "rag_vdb_refresh_duration",
+    unit="s",
+    description="Latency of OpenSearch index refreshes",
+)
+
+
+def _poll_with_backoff(
+    probe,
+    timeout: float,
+    initial_delay: float = CONSISTENCY_INITIAL_DELAY,
+    max_delay: float = CONSISTENCY_MAX_DELAY,
+    description: str = "",
+):
+    """Call probe() until it reports done or the deadline passes.
+
+    probe returns a (done, value) tuple. Delays double after every attempt and
+    never overshoot the deadline, so callers return as soon as data is visible.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        done, value = probe()
+        remaining = deadline - time.monotonic()
+        if done or remaining <= 0:
+            return done, value
+        sleep_for = min(delay, max_delay, remaining)
+        logger.debug(
+            "Waiting for %s (attempt %d), next check in %.2fs", description, attempt, sleep_for
+        )
+        time.sleep(sleep_for)
+        delay *= 2
+
+
+def _chunk_content_hash(text: str | None, content_metadata: dict[str, Any] | None) -> str:
+    """Hash chunk content; chunks without text are keyed by their content metadata.
+
+    Text is hashed with its page number and location, so the same text on
+    different pages of a source (repeated headers, boilerplate, captions) stays
+    a separate chunk.
+    """
+    content_metadata = content_metadata or {}
+    if text:
+        payload = json.dumps(
+            [
+                text,
+                content_metadata.get("page_number"),
+                content_metadata.get("location"),
+            ],
+            default=str,
+        )
+    else:
+        payload = json.dumps(content_metadata, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _chunk_id(
+    source_name: str,
+    content_hash: str,
+    custom_metadata: dict[str, Any] | None = None,
+) -> str:
+    """Deterministic document id for a chunk: same source and content, same id.
+
+    The file's custom metadata is part of the id so that a metadata change
+    rewrites the chunks instead of being skipped as unchanged.
+    """
+    key = f"{source_name}\x00{content_hash}"
+    if custom_metadata:
+        key += "\x00" + json.dumps(custom_metadata, sort_keys=True, default=str)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def build_metadata_index(
+    custom_metadata: list[dict[str, Any]] | None,
+) -> dict[str, dict[str, Any]]:
+    """Index custom metadata by filename so records are enriched with dict lookups."""
+    metadata_index = {}
+    for custom_metadata_item in custom_metadata or []:
+        filename = custom_metadata_item.get("filename")
+        if filename:
+            metadata_index[os.path.basename(filename)] = {
+                **(custom_metadata_item.get("metadata") or {}),
+                "filename": filename,
+            }
+    return metadata_index
+
 
 class OpenSearchVDB(VDBRag):
     def __init__(
@@ -74,6 +209,8 @@ class OpenSearchVDB(VDBRag):
         meta_fields: list[str] | None = None,
         hybrid: bool = False,
         csv_file_path: str | None = None,
+        metadata_index: dict[str, dict[str, Any]] | None = None,
+        diff_update: bool = False,
     ):
         # Follow documented pattern: opensearch_url, index_name, embedding_model as primary params
         self.opensearch_url = opensearch_url  # matches documented URL pattern
@@ -86,6 +223,16 @@ class OpenSearchVDB(VDBRag):
         self.meta_source_field = meta_source_field
         self.meta_fields = meta_fields
         self.csv_file_path = csv_file_path
+        # Custom metadata keyed by filename, see build_metadata_index()
+        self.metadata_index = metadata_index
+        # Replace only changed chunks of the written sources when run by
+        # nv-ingest, see with_diff_update() and write_to_index()
+        self.diff_update = diff_update
+        # Chunks stored and chunks rejected by bulk requests per source by this
+        # instance, used to verify ingestion
+        self._written_chunk_counts: Counter = Counter()
+        self._failed_chunk_counts: Counter = Counter()
+        self._written_chunk_counts_lock = threading.Lock()
         
         # Lazy initialization - don't create vectorstore in __init__
         self._vectorstore = None
@@ -104,6 +251,17 @@ class OpenSearchVDB(VDBRag):
         # Reset vectorstore when collection changes
         self._vectorstore = None
 
+    def with_diff_update(self) -> "OpenSearchVDB":
+        """Return a copy of this operator whose run() writes with diff_update.
+
+        nv-ingest calls run(records) without options, so a diff update hands it
+        this copy instead of changing an operator other requests may share.
+        Chunk counts are shared with this operator.
+        """
+        diff_update_op = copy.copy(self)
+        diff_update_op.diff_update = True
+        return diff_update_op
+
     @property 
     def vectorstore(self) -> OpenSearchVectorSearch:
         """Lazy initialization of vectorstore to follow documented pattern"""
@@ -162,10 +320,11 @@ class OpenSearchVDB(VDBRag):
 
         if aws_sigv4:
             try:
-                from requests_aws4auth import AWS4Auth
-                import boto3
                 import re
 
+                import boto3
+                from requests_aws4auth import AWS4Auth
+
                 # Create boto3 session and get credentials (matches test_opensearch_sigv4.py)
                 session = boto3.Session()
                 creds = session.get_credentials().get_frozen_credentials()
@@ -208,6 +367,18 @@ class OpenSearchVDB(VDBRag):
         return None, {}
 
     def _make_low_level_client(self):
+        """Return the shared client for this URL, rebuilding it once the TTL expires."""
+        now = time.monotonic()
+        with _CLIENT_CACHE_LOCK:
+            cached = _CLIENT_CACHE.get(self.opensearch_url)
+            if cached is not None and now - cached[0] < CLIENT_CACHE_TTL:
+                return cached[1]
+        client = self._build_low_level_client()
+        with _CLIENT_CACHE_LOCK:
+            _CLIENT_CACHE[self.opensearch_url] = (now, client)
+        return client
+
+    def _build_low_level_client(self):
         # Build OpenSearch client with env-driven auth (Basic or SigV4)
         from opensearchpy import OpenSearch, RequestsHttpConnection
 
@@ -258,7 +429,16 @@ class OpenSearchVDB(VDBRag):
             logger.warning("OpenSearch exists failed: %s", e)
             return False
 
+    @tracer.start_as_current_span("opensearch.write_to_index")
     def write_to_index(self, records: list, **kwargs) -> None:
+        """Write nv-ingest records as chunks keyed by their chunk id.
+
+        With diff_update, chunks already stored for the written sources are kept
+        as they are, new chunks are added and chunks that no longer exist are
+        deleted once all new chunks are written.
+        """
+        metadata_index = kwargs.get("metadata_index", self.metadata_index)
+        diff_update = kwargs.get("diff_update", False)
         cleaned_records = cleanup_records(
             records=records,
             meta_dataframe=self.meta_dataframe,
@@ -266,45 +446,135 @@ class OpenSearchVDB(VDBRag):
             meta_fields=self.meta_fields,
         )
 
-        texts, embeddings, metadatas = [], [], []
+        texts, embeddings, metadatas, chunk_ids, source_names = [], [], [], [], []
+        seen_chunk_ids = set()
         for item in cleaned_records:
+            source = item.get("source")
+            source_name = (source or {}).get("source_name") or ""
+            content_metadata = item.get("content_metadata")
+            custom_metadata = None
+            if metadata_index:
+                custom_metadata = metadata_index.get(os.path.basename(source_name))
+                if custom_metadata:
+                    content_metadata = {**(content_metadata or {}), **custom_metadata}
+            content_hash = _chunk_content_hash(item.get("text"), content_metadata)
+            chunk_id = _chunk_id(source_name, content_hash, custom_metadata)
+            if chunk_id in seen_chunk_ids:
+                # Same text at the same position of the same source, store it once
+                continue
+            seen_chunk_ids.add(chunk_id)
             texts.append(item.get("text"))
             embeddings.append(item.get("vector"))
+            chunk_ids.append(chunk_id)
+            source_names.append(source_name)
             metadatas.append(
                 {
-                    "source": item.get("source"),
-                    "content_metadata": item.get("content_metadata"),
+                    "source": source,
+                    "document_name": os.path.basename(source_name),
+                    "content_metadata": content_metadata,
+                    "content_hash": content_hash,
+                    "chunk_id": chunk_id,
                 }
             )
 
         total = len(texts)
-        batch_size = 200
+        batch_size = BULK_BATCH_SIZE
         uploaded = 0
+        skipped = 0
+        failed = 0
 
         logger.info("Commencing OpenSearch ingestion for %s records…", total)
+        trace.get_current_span().set_attributes(
+            {
+                "rag.index_name": self.index_name,
+                "rag.record_count": total,
+                "rag.source_count": len(set(source_names)),
+            }
+        )
 
         # Ensure index exists with proper mapping
         self._ensure_index(self.index_name, CONFIG.embeddings.dimensions)
 
         client = self._make_low_level_client()
+        use_custom_ids = self._supports_custom_ids()
+
+        # Diff update: chunks already stored for these sources are left alone
+        # (including their embeddings) and only chunks that disappeared are deleted
+        stale_doc_ids = []
+        unchanged_chunk_ids = set()
+        if diff_update:
+            stored_chunks = self._get_source_chunks(client, self.index_name, sorted(set(source_names)))
+            new_chunk_ids = set(chunk_ids)
+            for doc_id, stored_chunk_id in stored_chunks:
+                if stored_chunk_id in new_chunk_ids:
+                    unchanged_chunk_ids.add(stored_chunk_id)
+                else:
+                    stale_doc_ids.append(doc_id)
+            logger.info(
+                "Diff update for %s source(s): %s unchanged, %s new, %s removed chunk(s)",
+                len(set(source_names)),
+                len(unchanged_chunk_ids),
+                total - len(unchanged_chunk_ids),
+                len(stale_doc_ids),
+            )
+
         for i in range(0, total, batch_size):
             end = min(i + batch_size, total)
+            if diff_update:
+                existing_chunk_ids = unchanged_chunk_ids
+            elif use_custom_ids:
+                existing_chunk_ids = set()
+            else:
+                # Without custom ids, skip chunks a previous attempt already stored.
+                # Best effort only: on OpenSearch Serverless the lookup sees just
+                # the chunks that are searchable yet, so chunks written moments
+                # ago (e.g. by a retried batch) can still be stored twice
+                existing_chunk_ids = self._get_existing_chunk_ids(
+                    client, self.index_name, chunk_ids[i:end]
+                )
             batch_actions = []
+            batch_sources = []
+            stored_counts = Counter()
+            failed_counts = Counter()
             for j in range(i, end):
-                batch_actions.append({
-                    "index": {"_index": self.index_name}
-                })
+                if chunk_ids[j] in existing_chunk_ids:
+                    skipped += 1
+                    stored_counts[source_names[j]] += 1
+                    continue
+                if use_custom_ids:
+                    # create is a no-op (409) for chunks already indexed
+                    batch_actions.append({
+                        "create": {"_index": self.index_name, "_id": chunk_ids[j]}
+                    })
+                else:
+                    batch_actions.append({
+                        "index": {"_index": self.index_name}
+                    })
                 batch_actions.append({
                     "text": texts[j],
                     "vector": embeddings[j],
                     "metadata": metadatas[j],
                 })
-            try:
-                # Use bulk API with newline-delimited JSON payload
-                client.bulk(body=batch_actions)
-            except Exception as e:
-                logger.error("OpenSearch bulk indexing failed: %s", e)
-                raise
+                batch_sources.append(source_names[j])
+            if batch_actions:
+                try:
+                    # Use bulk API with newline-delimited JSON payload
+                    response = self._bulk(client, batch_actions, "index")
+                except Exception as e:
+                    logger.error("OpenSearch bulk indexing failed: %s", e)
+                    raise
+                skipped += self._log_bulk_errors(response)
+                # Only chunks the bulk request accepted (or already had) count as written
+                failed_items = self._get_failed_bulk_items(response)
+                for position, source_name in enumerate(batch_sources):
+                    if position in failed_items:
+                        failed_counts[source_name] += 1
+                    else:
+                        stored_counts[source_name] += 1
+            failed += sum(failed_counts.values())
+            with self._written_chunk_counts_lock:
+                self._written_chunk_counts.update(stored_counts)
+                self._failed_chunk_counts.update(failed_counts)
             uploaded += end - i
             if uploaded % (5 * batch_size) == 0 or uploaded == total:
                 logger.info(
@@ -313,23 +583,253 @@ class OpenSearchVDB(VDBRag):
                     total,
                     self.index_name,
                 )
+        if skipped:
+            logger.info(
+                "Skipped %s chunk(s) already present in OpenSearch index %s",
+                skipped,
+                self.index_name,
+            )
+        if failed:
+            logger.error(
+                "%s of %s chunk(s) could not be written to OpenSearch index %s",
+                failed,
+                total,
+                self.index_name,
+            )
+            # Keep the previous chunks rather than leave a partly written update
+            stale_doc_ids = []
 
-        # Best-effort refresh (not available in OpenSearch Serverless)
+        # Remove chunks that no longer exist only after the new ones are written,
+        # so an updated document never disappears from search
+        for i in range(0, len(stale_doc_ids), batch_size):
+            delete_actions = [
+                {"delete": {"_index": self.index_name, "_id": doc_id}}
+                for doc_id in stale_doc_ids[i : i + batch_size]
+            ]
+            try:
+                response = self._bulk(client, delete_actions, "delete")
+            except Exception as e:
+                logger.error("OpenSearch bulk delete of stale chunks failed: %s", e)
+                raise
+            self._log_bulk_errors(response)
+
+        self._refresh_index(client)
+
+    def _refresh_index(self, client) -> None:
+        """Best-effort refresh (not available in OpenSearch Serverless)"""
         is_aoss = self._infer_aws_service_name() == "aoss"
         try:
+            start = time.perf_counter()
             client.indices.refresh(index=self.index_name)
+            _REFRESH_DURATION.record(time.perf_counter() - start)
             if not is_aoss:
                 logger.debug(f"Index {self.index_name} refreshed successfully")
         except Exception as e:
             if is_aoss:
-                # OpenSearch Serverless doesn't support refresh operation
-                # Add a small delay to allow for eventual consistency
+                # OpenSearch Serverless doesn't support refresh operation;
+                # callers wait for visibility with wait_for_visibility()
                 logger.debug("Index refresh not available for OpenSearch Serverless (expected): %s", e)
-                time.sleep(1)
             else:
                 # Regular OpenSearch should support refresh - log warning
                 logger.warning(f"Index refresh failed unexpectedly for OpenSearch Service: {e}")
 
+    def copy_document_chunks(
+        self,
+        source_collection: str,
+        source_value: str,
+        target_value: str,
+        expected_count: int | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Copy the stored chunks of a document to a new source in this collection.
+
+        Text, embeddings and content metadata are reused as they are, so a
+        byte-identical file is added without extraction or embedding. The source
+        is only copied once all expected_count chunks are searchable, a partly
+        visible source (OpenSearch Serverless is eventually consistent) or an
+        unknown chunk count is never copied. Returns the text and metadata of the
+        copied chunks, or None if the source could not be copied completely.
+        """
+        if not expected_count:
+            return None
+        visible_counts = self.wait_for_visibility(
+            source_collection, {source_value: expected_count}
+        )
+        if visible_counts.get(source_value, 0) < expected_count:
+            logger.info(
+                "Not copying %s from %s, %s of %s chunk(s) visible",
+                source_value,
+                source_collection,
+                visible_counts.get(source_value, 0),
+                expected_count,
+            )
+            return None
+        client = self._make_low_level_client()
+        try:
+            response = client.search(
+                index=source_collection, body=get_source_documents_query(source_value)
+            )
+        except Exception as e:
+            logger.warning("Reading chunks of %s from %s failed: %s", source_value, source_collection, e)
+            return None
+        hits = response.get("hits", {}).get("hits", [])
+        if len(hits) != expected_count or len(hits) >= SOURCE_CHUNKS_MAX_HITS:
+            return None
+
+        self._ensure_index(self.index_name, CONFIG.embeddings.dimensions)
+        use_custom_ids = self._supports_custom_ids()
+        actions = []
+        copied_documents = []
+        for hit in hits:
+            document = hit.get("_source", {})
+            metadata = dict(document.get("metadata") or {})
+            source = dict(metadata.get("source") or {})
+            source["source_name"] = target_value
+            if "source_id" in source:
+                source["source_id"] = target_value
+            content_hash = metadata.get("content_hash") or _chunk_content_hash(
+                document.get("text"), metadata.get("content_metadata")
+            )
+            chunk_id = _chunk_id(target_value, content_hash)
+            metadata.update(
+                source=source,
+                document_name=os.path.basename(target_value),
+                content_hash=content_hash,
+                chunk_id=chunk_id,
+            )
+            if use_custom_ids:
+                actions.append({"create": {"_index": self.index_name, "_id": chunk_id}})
+            else:
+                actions.append({"index": {"_index": self.index_name}})
+            actions.append({**document, "metadata": metadata})
+            copied_documents.append({"text": document.get("text"), "metadata": metadata})
+
+        for i in range(0, len(actions), 400):
+            try:
+                response = self._bulk(client, actions[i : i + 400], "copy")
+            except Exception as e:
+                logger.error("OpenSearch bulk copy of %s failed: %s", source_value, e)
+                return None
+            conflicts = self._log_bulk_errors(response)
+            errors = sum(
+                1
+                for item in response.get("items", [])
+                if next(iter(item.values()), {}).get("error")
+            )
+            if errors > conflicts:
+                return None
+        self._refresh_index(client)
+        with self._written_chunk_counts_lock:
+            self._written_chunk_counts[target_value] += len(copied_documents)
+        logger.info(
+            "Copied %s chunk(s) of %s from %s as %s",
+            len(copied_documents),
+            source_value,
+            source_collection,
+            target_value,
+        )
+        return copied_documents
+
+    def _supports_custom_ids(self) -> bool:
+        """OpenSearch Serverless vector collections reject caller-supplied _ids."""
+        override = os.getenv("APP_VECTORSTORE_CUSTOM_IDS")
+        if override:
+            return override.lower() == "true"
+        return self._infer_aws_service_name() != "aoss"
+
+    def _get_existing_chunk_ids(self, client, index_name: str, chunk_ids: list[str]) -> set[str]:
+        """Return which of the given chunk ids are already stored in the index."""
+        if not chunk_ids:
+            return set()
+        try:
+            response = client.search(
+                index=index_name, body=get_chunk_ids_query(chunk_ids)
+            )
+        except Exception as e:
+            logger.debug("Existing chunk lookup on %s failed (%s)", index_name, e)
+            return set()
+        return {
+            hit.get("_source", {}).get("metadata", {}).get("chunk_id")
+            for hit in response.get("hits", {}).get("hits", [])
+        }
+
+    def _get_source_chunks(self, client, index_name: str, source_values: list[str]) -> list[tuple[str, str | None]]:
+        """Return (document id, chunk id) for every stored chunk of the given sources.
+
+        Chunks are read with a scroll, so sources with more chunks than a single
+        search returns are listed completely. Chunks written before chunk ids
+        were introduced have no chunk id.
+        """
+        from opensearchpy.helpers import scan
+
+        stored_chunks = []
+        for i in range(0, len(source_values), SOURCE_COUNTS_BATCH_SIZE):
+            batch = source_values[i : i + SOURCE_COUNTS_BATCH_SIZE]
+            for hit in scan(
+                client, query=get_source_chunks_query(batch), index=index_name
+            ):
+                stored_chunks.append(
+                    (hit["_id"], hit.get("_source", {}).get("metadata", {}).get("chunk_id"))
+                )
+        return stored_chunks
+
+    @staticmethod
+    def _bulk(client, actions: list[dict[str, Any]], operation: str) -> dict[str, Any]:
+        """Send a bulk request and record its latency and size"""
+        # Serialized here (as the client would) to measure the request size
+        serializer = client.transport.serializer
+        body = "\n".join(serializer.dumps(action) for action in actions) + "\n"
+        attributes = {"operation": operation}
+        body_bytes = len(body.encode("utf-8"))
+        item_count = sum(1 for action in actions if action.keys() & _BULK_ACTIONS)
+        start = time.perf_counter()
+        try:
+            with tracer.start_as_current_span(
+                "opensearch.bulk",
+                attributes={
+                    "rag.operation": operation,
+                    "rag.item_count": item_count,
+                    "rag.body_bytes": body_bytes,
+                },
+            ):
+                return client.bulk(body=body)
+        finally:
+            _BULK_DURATION.record(time.perf_counter() - start, attributes)
+            _BULK_BYTES.add(body_bytes, attributes)
+            _BULK_ITEMS.add(item_count, attributes)
+
+    @staticmethod
+    def _get_failed_bulk_items(response: dict[str, Any]) -> set[int]:
+        """Positions of the bulk items that failed, already-present conflicts excluded."""
+        if not response or not response.get("errors"):
+            return set()
+        failed_items = set()
+        for position, item in enumerate(response.get("items", [])):
+            result = next(iter(item.values()), {})
+            if result.get("error") and result.get("status") != 409:
+                failed_items.add(position)
+        return failed_items
+
+    @staticmethod
+    def _log_bulk_errors(response: dict[str, Any]) -> int:
+        """Log failed bulk items and return how many were already-present conflicts."""
+        if not response or not response.get("errors"):
+            return 0
+        conflicts = 0
+        failures = []
+        for item in response.get("items", []):
+            result = next(iter(item.values()), {})
+            if result.get("status") == 409:
+                conflicts += 1
+            elif result.get("error"):
+                failures.append(result.get("error"))
+        if failures:
+            logger.error(
+                "OpenSearch bulk indexing failed for %s item(s), first error: %s",
+                len(failures),
+                failures[0],
+            )
+        return conflicts
+
     def retrieval(self, queries: list, **kwargs) -> list[dict[str, Any]]:
         raise NotImplementedError("retrieval must be implemented for OpenSearchVDB")
 
@@ -338,56 +838,64 @@ class OpenSearchVDB(VDBRag):
 
     def run(self, records: list) -> None:
         self.create_index()
-        self.write_to_index(records)
+        self.write_to_index(records, diff_update=self.diff_update)
 
     # ---------------- Health & Collections ----------------
-    async def check_health(self) -> dict[str, Any]:
+    async def check_health(self, include_index_stats: bool = False) -> dict[str, Any]:
+        """Check OpenSearch connectivity.
+
+        Index statistics require listing every index, so they are only
+        collected when include_index_stats is set. Results are cached by the
+        ingestor's health(), not here.
+        """
+        if not self.opensearch_url:
+            return {
+                "service": "OpenSearch",
+                "url": self.opensearch_url,
+                "status": "skipped",
+                "error": "No URL provided",
+            }
+
+        # Client calls are blocking; keep them off the event loop
+        return await asyncio.to_thread(self._probe_health, include_index_stats)
+
+    def _probe_health(self, include_index_stats: bool = False) -> dict[str, Any]:
         status = {
             "service": "OpenSearch",
             "url": self.opensearch_url,
             "status": "unknown",
             "error": None,
         }
-        if not self.opensearch_url:
-            status["status"] = "skipped"
-            status["error"] = "No URL provided"
-            return status
         try:
             start = time.time()
             client = self._make_low_level_client()
-            
+
+            # Index exists is the cheapest call available in both Service and Serverless
+            client.indices.exists(index="__connectivity_test__")
+
             # For OpenSearch Serverless, cluster health is not available
-            # Follow the same pattern as test_opensearch_sigv4.py
             cluster_health = {"status": "unknown"}
             try:
-                # Try cluster health for regular OpenSearch Service
                 cluster_health = client.cluster.health()
             except Exception:
                 # OpenSearch Serverless doesn't support cluster.health
                 # This is expected and not an error
                 logger.debug("Cluster health not available (expected for OpenSearch Serverless)")
-            
-            # Test connectivity with indices list (available in both Service and Serverless)
-            try:
-                indices = client.cat.indices(format="json")
-                indices_count = len(indices)
-            except Exception as e:
-                # If indices list fails, try a simpler connectivity test
-                logger.warning("Failed to list indices, trying basic connectivity: %s", e)
-                # Try index exists check as a basic connectivity test
-                client.indices.exists(index="__connectivity_test__")
-                indices_count = 0  # We don't know the count, but connection works
-            
+
             status["status"] = "healthy"
             status["latency_ms"] = round((time.time() - start) * 1000, 2)
-            status["indices"] = indices_count
             status["cluster_status"] = cluster_health.get("status", "unknown")
-            
-            # Log successful connection details
+
+            if include_index_stats:
+                try:
+                    status["indices"] = len(client.cat.indices(format="json"))
+                except Exception as e:
+                    logger.warning("Failed to list indices for health stats: %s", e)
+
             service_type = self._infer_aws_service_name()
             auth_type = "SigV4" if os.getenv("APP_VECTORSTORE_AWS_SIGV4", "true").lower() == "true" else "Basic"
-            logger.info(f"OpenSearch connection healthy (service: {service_type}, auth: {auth_type})")
-            
+            logger.debug(f"OpenSearch connection healthy (service: {service_type}, auth: {auth_type})")
+
         except Exception as e:
             status["status"] = "error"
             status["error"] = str(e)
@@ -478,152 +986,249 @@ class OpenSearchVDB(VDBRag):
     def get_documents(self, collection_name: str, retry_for_consistency: bool = None, bypass_validation: bool = False) -> list[dict[str, Any]]:
         metadata_schema = self.get_metadata_schema(collection_name)
         client = self._make_low_level_client()
-        
+
         # Check if this is OpenSearch Serverless for eventual consistency handling
         is_aoss = self._infer_aws_service_name() == "aoss"
-        
-        # For OpenSearch, enable retry when bypass_validation=True
-        # This covers the main validation case from ingestor server
+
+        # Validation calls wait for the full consistency window; plain listings on
+        # AOSS only get a short grace period for newly created collections
         if retry_for_consistency is None:
-            retry_for_consistency = bypass_validation  # Only retry extensively when validating
-        
-        # Smart retry settings based on service type and call context
-        # Service-specific defaults handle eventual consistency differences automatically
-        if bypass_validation:
-            # Validation call - use generous retries for eventual consistency
-            if is_aoss:
-                max_retries = 8    # OpenSearch Serverless: slower indexing
-                retry_delay = 15.0
-            else:
-                max_retries = 3    # OpenSearch Service: faster indexing with refresh
-                retry_delay = 2.0
+            retry_for_consistency = bypass_validation or is_aoss
+        if not retry_for_consistency:
+            timeout = 0.0
+        elif bypass_validation:
+            timeout = self._consistency_timeout()
         else:
-            # Initial check - use minimal retries to stay under client timeout
-            if is_aoss:
-                max_retries = 3    # Quick check for newly created collections
-                retry_delay = 5.0  # 3 × 5s = 15s max
-            else:
-                max_retries = 1    # Regular OpenSearch: immediate consistency with refresh
-                retry_delay = 1.0
-        
-        if bypass_validation and retry_for_consistency:
-            service_type = "OpenSearch Serverless" if is_aoss else "OpenSearch Service"
-            logger.info(
-                f"{service_type} validation call detected - enabling {max_retries} retries "
-                f"with {retry_delay}s delays for eventual consistency"
-            )
-        
-        for attempt in range(max_retries):
+            timeout = min(15.0, self._consistency_timeout()) if is_aoss else 0.0
+
+        def probe():
             try:
-                # Try aggregation query first
-                response = client.search(
-                    index=collection_name, body=get_unique_sources_query()
+                documents_list = self._list_documents(client, collection_name, metadata_schema)
+            except Exception as e:
+                logger.debug("Listing documents of %s failed (%s)", collection_name, e)
+                return False, []
+            return bool(documents_list), documents_list
+
+        _, documents_list = _poll_with_backoff(
+            probe, timeout, description=f"documents in {collection_name}"
+        )
+        return documents_list
+
+    def _list_documents(self, client, collection_name: str, metadata_schema: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """List unique documents with one aggregation, falling back to a simple search."""
+        try:
+            response = client.search(
+                index=collection_name, body=get_unique_sources_query()
+            )
+
+            # Check if aggregations exist in response
+            if "aggregations" not in response:
+                logger.debug("No aggregations in response, trying simple search")
+                raise KeyError("aggregations")
+
+            buckets = response.get("aggregations", {}).get("unique_sources", {}).get("buckets", [])
+            documents_list = []
+            for hit in buckets:
+                source_name = hit["key"]["source_name"]
+                metadata = (
+                    hit["top_hit"]["hits"]["hits"][0]["_source"]
+                    .get("metadata", {})
+                    .get("content_metadata", {})
                 )
-                
-                # Check if aggregations exist in response
-                if "aggregations" not in response:
-                    logger.debug("No aggregations in response, trying simple search")
-                    raise KeyError("aggregations")
-                
-                # Check if we actually have results
-                buckets = response.get("aggregations", {}).get("unique_sources", {}).get("buckets", [])
-                if not buckets and attempt < max_retries - 1:
-                    logger.debug(f"No aggregation results on attempt {attempt + 1}, retrying in {retry_delay}s for eventual consistency")
-                    time.sleep(retry_delay)
-                    continue
-                    
-                documents_list = []
-                for hit in buckets:
-                    source_name = hit["key"]["source_name"]
-                    metadata = (
-                        hit["top_hit"]["hits"]["hits"][0]["_source"]
-                        .get("metadata", {})
-                        .get("content_metadata", {})
-                    )
-                    metadata_dict = {}
-                    for metadata_item in metadata_schema:
-                        metadata_name = metadata_item.get("name")
-                        metadata_value = metadata.get(metadata_name, None)
-                        metadata_dict[metadata_name] = metadata_value
-                    documents_list.append(
-                        {
-                            "document_name": os.path.basename(source_name),
-                            "metadata": metadata_dict,
-                        }
-                    )
-                return documents_list
-                
-            except (KeyError, Exception) as e:
-                if attempt < max_retries - 1:
-                    logger.debug(f"Aggregation query failed on attempt {attempt + 1} ({e}), retrying in {retry_delay}s")
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    logger.debug("Aggregation query failed (%s), falling back to simple search", e)
-            
-        # Fallback to simple search for OpenSearch Serverless compatibility
-        for attempt in range(max_retries):
-            try:
-                response = client.search(
-                    index=collection_name,
-                    body={
-                        "size": 100,  # Limit results
-                        "query": {"match_all": {}},
-                        "_source": ["metadata"]
+                metadata_dict = {}
+                for metadata_item in metadata_schema:
+                    metadata_name = metadata_item.get("name")
+                    metadata_value = metadata.get(metadata_name, None)
+                    metadata_dict[metadata_name] = metadata_value
+                documents_list.append(
+                    {
+                        "document_name": os.path.basename(source_name),
+                        "metadata": metadata_dict,
                     }
                 )
-                
-                # Check if we have results
-                hits = response.get("hits", {}).get("hits", [])
-                if not hits and attempt < max_retries - 1:
-                    logger.debug(f"No simple search results on attempt {attempt + 1}, retrying in {retry_delay}s for eventual consistency")
-                    time.sleep(retry_delay)
-                    continue
-                
-                documents_list = []
-                seen_sources = set()
-                
-                for hit in hits:
-                    source_data = hit.get("_source", {})
-                    metadata = source_data.get("metadata", {})
-                    
-                    # Extract source name from different possible locations
-                    source_name = None
-                    if isinstance(metadata, dict):
-                        # Try different source field patterns
-                        source_name = (
-                            metadata.get("source", {}).get("source_name") if isinstance(metadata.get("source"), dict) else
-                            metadata.get("source_name") or
-                            metadata.get("content_metadata", {}).get("source") or
-                            "unknown_source"
-                        )
-                    
-                    if source_name and source_name not in seen_sources:
-                        seen_sources.add(source_name)
-                        
-                        metadata_dict = {}
-                        content_metadata = metadata.get("content_metadata", {}) if isinstance(metadata, dict) else {}
-                        
-                        for metadata_item in metadata_schema:
-                            metadata_name = metadata_item.get("name")
-                            metadata_value = content_metadata.get(metadata_name, None) if isinstance(content_metadata, dict) else None
-                            metadata_dict[metadata_name] = metadata_value
-                            
-                        documents_list.append({
-                            "document_name": os.path.basename(str(source_name)),
-                            "metadata": metadata_dict,
-                        })
-                
-                return documents_list
-                
-            except Exception as fallback_e:
-                if attempt < max_retries - 1:
-                    logger.debug(f"Simple search failed on attempt {attempt + 1} ({fallback_e}), retrying in {retry_delay}s")
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    logger.warning("Both aggregation and simple search failed: %s", fallback_e)
-                    return []
+            return documents_list
+
+        except Exception as e:
+            logger.debug("Aggregation query failed (%s), falling back to simple search", e)
+
+        # Fallback to simple search for OpenSearch Serverless compatibility
+        response = client.search(
+            index=collection_name,
+            body={
+                "size": 100,  # Limit results
+                "query": {"match_all": {}},
+                "_source": ["metadata"]
+            }
+        )
+
+        hits = response.get("hits", {}).get("hits", [])
+        documents_list = []
+        seen_sources = set()
+
+        for hit in hits:
+            source_data = hit.get("_source", {})
+            metadata = source_data.get("metadata", {})
+
+            # Extract source name from different possible locations
+            source_name = None
+            if isinstance(metadata, dict):
+                # Try different source field patterns
+                source_name = (
+                    metadata.get("source", {}).get("source_name") if isinstance(metadata.get("source"), dict) else
+                    metadata.get("source_name") or
+                    metadata.get("content_metadata", {}).get("source") or
+                    "unknown_source"
+                )
+
+            if source_name and source_name not in seen_sources:
+                seen_sources.add(source_name)
+
+                metadata_dict = {}
+                content_metadata = metadata.get("content_metadata", {}) if isinstance(metadata, dict) else {}
+
+                for metadata_item in metadata_schema:
+                    metadata_name = metadata_item.get("name")
+                    metadata_value = content_metadata.get(metadata_name, None) if isinstance(content_metadata, dict) else None
+                    metadata_dict[metadata_name] = metadata_value
+
+                documents_list.append({
+                    "document_name": os.path.basename(str(source_name)),
+                    "metadata": metadata_dict,
+                })
+
+        return documents_list
+
+    def pop_written_chunk_counts(self, source_values: list[str]) -> dict[str, int]:
+        """Return and forget the number of chunks stored for the given sources."""
+        with self._written_chunk_counts_lock:
+            return {
+                source: self._written_chunk_counts.pop(source)
+                for source in source_values
+                if source in self._written_chunk_counts
+            }
+
+    def get_written_chunk_counts(self, source_values: list[str]) -> dict[str, int]:
+        """Return the number of chunks stored for the given sources, without forgetting them."""
+        with self._written_chunk_counts_lock:
+            return {
+                source: self._written_chunk_counts[source]
+                for source in source_values
+                if source in self._written_chunk_counts
+            }
+
+    def pop_failed_chunk_counts(self, source_values: list[str]) -> dict[str, int]:
+        """Return and forget the number of chunks bulk requests rejected for the given sources."""
+        with self._written_chunk_counts_lock:
+            return {
+                source: self._failed_chunk_counts.pop(source)
+                for source in source_values
+                if source in self._failed_chunk_counts
+            }
+
+    def documents_exist(
+        self,
+        collection_name: str,
+        document_names: list[str],
+        source_values: list[str] | None = None,
+    ) -> set[str]:
+        """Return which of the given document names are stored in the collection.
+
+        Only the requested names are looked up, so the cost does not grow with
+        the size of the collection. source_values (full source paths) also match
+        chunks written before document names were stored.
+        """
+        document_names = list(dict.fromkeys(document_names))
+        source_values = list(dict.fromkeys(source_values or []))
+        requested = set(document_names)
+        client = self._make_low_level_client()
+        existing = set()
+        batch_size = SOURCE_COUNTS_BATCH_SIZE // 2
+        for i in range(0, max(len(document_names), len(source_values)), batch_size):
+            names_batch = document_names[i : i + batch_size]
+            sources_batch = source_values[i : i + batch_size]
+            response = client.search(
+                index=collection_name,
+                body=get_document_names_query(names_batch, sources_batch),
+            )
+            buckets = response.get("aggregations", {}).get("document_sources", {}).get("buckets", [])
+            existing.update(
+                os.path.basename(bucket["key"])
+                for bucket in buckets
+                if os.path.basename(bucket["key"]) in requested
+            )
+        return existing
+
+    def _consistency_timeout(self) -> float:
+        """Deadline for eventual-consistency waits, overridable via env."""
+        override = os.getenv("APP_VECTORSTORE_CONSISTENCY_TIMEOUT")
+        if override:
+            return float(override)
+        # OpenSearch Serverless makes writes searchable in ~10-60s, Service after refresh
+        return 120.0 if self._infer_aws_service_name() == "aoss" else 10.0
+
+    def _count_chunks_by_source(self, client, collection_name: str, source_values: list[str]) -> dict[str, int]:
+        """Count indexed chunks per source for only the given sources."""
+        counts = {}
+        for i in range(0, len(source_values), SOURCE_COUNTS_BATCH_SIZE):
+            batch = source_values[i : i + SOURCE_COUNTS_BATCH_SIZE]
+            response = client.search(
+                index=collection_name, body=get_source_counts_query(batch)
+            )
+            buckets = response.get("aggregations", {}).get("source_counts", {}).get("buckets", [])
+            for bucket in buckets:
+                counts[bucket["key"]] = bucket["doc_count"]
+        return counts
+
+    def wait_for_visibility(
+        self,
+        collection_name: str,
+        expected_counts: dict[str, int],
+        timeout: float | None = None,
+    ) -> dict[str, int]:
+        """Wait until every source has at least its expected number of searchable chunks.
+
+        Only sources that are still short are re-queried on each poll, and the
+        poll interval backs off exponentially until the deadline. Returns the
+        last observed chunk count per source.
+        """
+        if timeout is None:
+            timeout = self._consistency_timeout()
+        client = self._make_low_level_client()
+        observed = dict.fromkeys(expected_counts, 0)
+
+        def probe():
+            pending = [
+                source for source, count in expected_counts.items() if observed[source] < count
+            ]
+            try:
+                observed.update(self._count_chunks_by_source(client, collection_name, pending))
+            except Exception as e:
+                logger.debug("Chunk count query on %s failed (%s)", collection_name, e)
+            still_pending = [
+                source for source in pending if observed[source] < expected_counts[source]
+            ]
+            return not still_pending, len(still_pending)
+
+        start = time.time()
+        visible, pending_count = _poll_with_backoff(
+            probe, timeout, description=f"chunks in {collection_name}"
+        )
+        if visible:
+            logger.info(
+                "All %d source(s) visible in %s after %.2fs",
+                len(expected_counts),
+                collection_name,
+                time.time() - start,
+            )
+        else:
+            logger.warning(
+                "%d of %d source(s) not fully visible in %s after %.2fs",
+                pending_count,
+                len(expected_counts),
+                collection_name,
+                time.time() - start,
+            )
+        return observed
 
     def delete_documents(self, collection_name: str, source_values: list[str]) -> bool:
         client = self._make_low_level_client()
@@ -0,0 +1,707 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Offline ingestion benchmark for NvidiaRAGIngestor.
+
+Runs the real ingestion pipeline (validation, batching, result decoding, the
+OpenSearchVDB write path, citation uploads and verification) against local
+stand-ins for nv-ingest, OpenSearch and MinIO, so ingestion throughput can be
+measured without GPUs or a live domain. Every combination of the swept
+settings ingests the same synthetic files into a fresh collection and reports
+files/s, chunks/s, peak RSS and the time spent per stage.
+
+The stand-ins only keep object names, ids and sources, not the written
+content, so the peak RSS is that of the ingestor. Stage times need the
+opentelemetry-sdk package (part of the ingest extra).
+
+Run it from the rag-blueprint-eks directory after integrating the OpenSearch
+files (Task 8-OS) and installing the ingest extra of the rag package:
+
+    python opensearch/benchmarks/ingestion_benchmark.py \\
+        --files 200 --files-per-batch 8,16,32 --concurrent-batches 1,4,8 \\
+        --bulk-batch-size 200,500 --latency-per-page 0.05
+
+1. SyntheticNvIngestor: nv-ingest stand-in producing elements per page after a simulated latency
+2. InMemoryOpenSearchClient: Low-level OpenSearch client stand-in for bulk, refresh and index calls
+3. InMemoryOpenSearchVDB: OpenSearchVDB writing to the in-memory client
+4. InMemoryMinio: MinIO operator stand-in
+5. run_benchmark: Ingest the synthetic files once per swept configuration
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import math
+import os
+import random
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+
+from nvidia_rag.utils.vdb.opensearch import opensearch_vdb
+from nvidia_rag.utils.vdb.opensearch.opensearch_vdb import OpenSearchVDB
+
+try:
+    from opentelemetry import metrics
+    from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider
+    from opentelemetry.sdk.metrics.export import (
+        AggregationTemporality,
+        InMemoryMetricReader,
+    )
+except ImportError:  # pragma: no cover - optional dependency
+    InMemoryMetricReader = None
+
+_WORDS = (
+    "ingestion retrieval vector index chunk document table chart page "
+    "embedding search cluster latency throughput batch summary citation"
+).split()
+_SOURCE_NAME_PATTERN = re.compile(r'"source_name":"((?:[^"\\]|\\.)*)"')
+
+
+class SyntheticNvIngestor:
+    """
+    Stand-in for the nv-ingest Ingestor returned by get_nv_ingest_ingestor.
+
+    Every page of a file yields text elements (and optionally tables with a
+    location, which become citations). Extraction takes latency_per_page
+    seconds per page on a cluster that works on extract_parallelism pages at
+    a time, shared by all concurrent batches. The results are then written to
+    the vector DB as nv-ingest does.
+    """
+
+    def __init__(
+        self,
+        filepaths: list[str],
+        vdb_op,
+        settings: argparse.Namespace,
+        cluster: ThreadPoolExecutor,
+        vectors: list[list[float]],
+    ):
+        self.filepaths = filepaths
+        self.vdb_op = vdb_op
+        self.settings = settings
+        self.cluster = cluster
+        self.vectors = vectors
+
+    def ingest(self, return_failures: bool = True, show_progress: bool = False):
+        results = []
+        failures = []
+        pages = {
+            filepath: max(
+                1, math.ceil(os.path.getsize(filepath) / self.settings.page_chars)
+            )
+            for filepath in self.filepaths
+        }
+        if self.settings.latency_per_page > 0:
+            # Each page occupies one slot of the shared extraction cluster
+            list(
+                self.cluster.map(
+                    time.sleep,
+                    itertools.repeat(
+                        self.settings.latency_per_page, sum(pages.values())
+                    ),
+                )
+            )
+        for filepath in self.filepaths:
+            if _is_failed_file(filepath, self.settings.failure_rate):
+                failures.append((filepath, "Synthetic extraction failure"))
+                continue
+            results.append(self._file_elements(filepath, pages[filepath]))
+        if self.vdb_op is not None and results:
+            self.vdb_op.run(results)
+        return (results, failures) if return_failures else results
+
+    def _file_elements(self, filepath: str, page_count: int) -> list[dict[str, Any]]:
+        settings = self.settings
+        source_metadata = {
+            "source_id": filepath,
+            "source_name": filepath,
+            "source_type": os.path.splitext(filepath)[1].lstrip("."),
+        }
+        rng = random.Random(filepath)
+        filler = " ".join(rng.choice(_WORDS) for _ in range(settings.chunk_chars // 8))
+        elements = []
+        for page_number in range(1, page_count + 1):
+            for element_number in range(settings.elements_per_page):
+                text = f"{os.path.basename(filepath)} page {page_number} element {element_number}: {filler}"
+                elements.append(
+                    {
+                        "document_type": "text",
+                        "metadata": {
+                            "content": text[: settings.chunk_chars],
+                            "embedding": self.vectors[
+                                len(elements) % len(self.vectors)
+                            ],
+                            "source_metadata": source_metadata,
+                            "content_metadata": {
+                                "type": "text",
+                                "page_number": page_number,
+                                "subtype": "",
+                            },
+                        },
+                    }
+                )
+            if rng.random() < settings.tables_per_page:
+                location = [10.0, 10.0 + page_number, 500.0, 300.0]
+                elements.append(
+                    {
+                        "document_type": "structured",
+                        "metadata": {
+                            "content": "A" * settings.table_bytes,
+                            "embedding": self.vectors[
+                                len(elements) % len(self.vectors)
+                            ],
+                            "source_metadata": source_metadata,
+                            "content_metadata": {
+                                "type": "structured",
+                                "page_number": page_number,
+                                "subtype": "table",
+                                "location": location,
+                            },
+                            "table_metadata": {
+                                "table_content": f"| page | {page_number} |\n{filler[:200]}",
+                                "table_location": location,
+                                "table_location_max_dimensions": [1000, 1000],
+                            },
+                        },
+                    }
+                )
+        return elements
+
+
+class _InMemoryIndices:
+    def __init__(self, client: "InMemoryOpenSearchClient"):
+        self.client = client
+
+    def exists(self, index: str) -> bool:
+        return index in self.client.indexes
+
+    def create(self, index: str, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        with self.client.lock:
+            self.client.indexes.setdefault(index, {})
+        return {"acknowledged": True, "index": index}
+
+    def refresh(self, index: str) -> dict[str, Any]:
+        time.sleep(self.client.refresh_latency)
+        return {"_shards": {"failed": 0}}
+
+
+class InMemoryOpenSearchClient:
+    """
+    Stand-in for the low-level OpenSearch client.
+
+    Bulk requests cost bulk_latency seconds plus bulk_seconds_per_mb per MB of
+    body. Written chunks become searchable visibility_delay seconds after the
+    bulk request, like the refresh interval of OpenSearch Serverless. Only the
+    id, source and visibility time of a chunk are kept.
+    """
+
+    def __init__(
+        self,
+        bulk_latency: float = 0.0,
+        bulk_seconds_per_mb: float = 0.0,
+        refresh_latency: float = 0.0,
+        visibility_delay: float = 0.0,
+    ):
+        self.bulk_latency = bulk_latency
+        self.bulk_seconds_per_mb = bulk_seconds_per_mb
+        self.refresh_latency = refresh_latency
+        self.visibility_delay = visibility_delay
+        # index -> chunk id -> (source name, time the chunk becomes searchable)
+        self.indexes: dict[str, dict[str, tuple[str, float]]] = {}
+        self.lock = threading.Lock()
+        self.indices = _InMemoryIndices(self)
+        self.transport = SimpleNamespace(serializer=SimpleNamespace(dumps=_dumps))
+        self.bulk_requests = 0
+        self.bulk_bytes = 0
+        self._next_id = itertools.count()
+
+    def bulk(self, body: str) -> dict[str, Any]:
+        body_bytes = len(body.encode("utf-8"))
+        time.sleep(self.bulk_latency + self.bulk_seconds_per_mb * body_bytes / 1e6)
+        visible_at = time.time() + self.visibility_delay
+        items = []
+        lines = iter(body.splitlines())
+        with self.lock:
+            self.bulk_requests += 1
+            self.bulk_bytes += body_bytes
+            for action_line in lines:
+                action, meta = next(iter(json.loads(action_line).items()))
+                documents = self.indexes.setdefault(meta["_index"], {})
+                doc_id = meta.get("_id") or f"auto-{next(self._next_id)}"
+                if action == "delete":
+                    documents.pop(doc_id, None)
+                    items.append({action: {"_id": doc_id, "status": 200}})
+                    continue
+                source_match = _SOURCE_NAME_PATTERN.search(next(lines))
+                source_name = (
+                    json.loads(f'"{source_match.group(1)}"') if source_match else ""
+                )
+                if action == "create" and doc_id in documents:
+                    items.append(
+                        {
+                            action: {
+                                "_id": doc_id,
+                                "status": 409,
+                                "error": {"type": "version_conflict_engine_exception"},
+                            }
+                        }
+                    )
+                    continue
+                documents[doc_id] = (source_name, visible_at)
+                items.append({action: {"_id": doc_id, "status": 201}})
+        return {
+            "errors": any("error" in next(iter(item.values())) for item in items),
+            "items": items,
+        }
+
+    def count_by_source(
+        self, index: str, sources: list[str] | None = None, visible_only: bool = True
+    ) -> dict[str, int]:
+        now = time.time()
+        wanted = set(sources) if sources is not None else None
+        counts: dict[str, int] = {}
+        with self.lock:
+            for source_name, visible_at in self.indexes.get(index, {}).values():
+                if visible_only and visible_at > now:
+                    continue
+                if wanted is None or source_name in wanted:
+                    counts[source_name] = counts.get(source_name, 0) + 1
+        return counts
+
+
+def _dumps(data: Any) -> str:
+    # Same output as the opensearch-py JSONSerializer for plain JSON types
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class InMemoryOpenSearchVDB(OpenSearchVDB):
+    """OpenSearchVDB whose requests go to an InMemoryOpenSearchClient"""
+
+    def __init__(self, client: InMemoryOpenSearchClient, index_name: str):
+        super().__init__(opensearch_url="memory://benchmark", index_name=index_name)
+        self._client = client
+
+    def _make_low_level_client(self):
+        return self._client
+
+    def _infer_aws_service_name(self) -> str:
+        return "es"
+
+    def _supports_custom_ids(self) -> bool:
+        return True
+
+    def check_collection_exists(self, collection_name: str) -> bool:
+        return True
+
+    def get_metadata_schema(self, collection_name: str) -> list[dict[str, Any]]:
+        return []
+
+    def documents_exist(
+        self,
+        collection_name: str,
+        document_names: list[str],
+        source_values: list[str] | None = None,
+    ) -> set[str]:
+        stored = {
+            os.path.basename(source)
+            for source in self._client.count_by_source(
+                collection_name, visible_only=False
+            )
+        }
+        return stored & set(document_names)
+
+    def _count_chunks_by_source(
+        self, client, collection_name: str, source_values: list[str]
+    ) -> dict[str, int]:
+        return client.count_by_source(collection_name, source_values)
+
+
+class InMemoryMinio:
+    """Stand-in for the MinIO operator, each request costs latency seconds"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        self._objects: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _make_bucket(self, bucket_name: str) -> None:
+        return None
+
+    def put_payload(self, payload: dict[str, Any], object_name: str) -> None:
+        self.put_payloads_bulk([payload], [object_name])
+
+    def put_payloads_bulk(
+        self, payloads: list[dict[str, Any]], object_names: list[str]
+    ) -> None:
+        time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            self._objects.update(object_names)
+
+    def get_payload(self, object_name: str) -> dict[str, Any]:
+        time.sleep(self.latency)
+        return {}
+
+    # Server-side copies (citation_dedup.copy_payload) go through the client
+    default_bucket_name = "benchmark"
+
+    @property
+    def client(self) -> "InMemoryMinio":
+        return self
+
+    def copy_object(self, bucket_name: str, object_name: str, source: Any) -> None:
+        time.sleep(self.latency)
+        with self._lock:
+            self.requests += 1
+            self._objects.add(object_name)
+
+    def list_payloads(self, prefix: str = "") -> list[str]:
+        time.sleep(self.latency)
+        with self._lock:
+            return [name for name in self._objects if name.startswith(prefix)]
+
+    def delete_payloads(self, object_names: list[str]) -> None:
+        time.sleep(self.latency)
+        with self._lock:
+            self._objects.difference_update(object_names)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
+class _PeakRssSampler:
+    """Sample the resident set size of the process in a background thread"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = _current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "_PeakRssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _current_rss())
+
+
+def _current_rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak of the whole process, in KB on Linux and bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _is_failed_file(filepath: str, failure_rate: float) -> bool:
+    return failure_rate > 0 and random.Random(filepath).random() < failure_rate
+
+
+def _install_metric_reader():
+    """Collect the ingestion metrics in memory, None without opentelemetry-sdk"""
+    if InMemoryMetricReader is None:
+        return None
+    reader = InMemoryMetricReader(
+        preferred_temporality={
+            Counter: AggregationTemporality.DELTA,
+            Histogram: AggregationTemporality.DELTA,
+        }
+    )
+    metrics.set_meter_provider(MeterProvider(metric_readers=[reader]))
+    return reader
+
+
+def _collect_stage_seconds(reader) -> dict[str, float]:
+    """Seconds per stage (and per bulk operation) recorded since the last collection"""
+    stage_seconds: dict[str, float] = {}
+    if reader is None:
+        return stage_seconds
+    data = reader.get_metrics_data()
+    for resource_metrics in data.resource_metrics if data else []:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                if metric.name == "rag_ingestion_stage_duration":
+                    key = "stage"
+                elif metric.name == "rag_vdb_bulk_duration":
+                    key = "operation"
+                elif metric.name == "rag_vdb_refresh_duration":
+                    key = None
+                else:
+                    continue
+                for point in metric.data.data_points:
+                    name = point.attributes.get(key) if key else "refresh"
+                    if metric.name == "rag_vdb_bulk_duration":
+                        name = f"bulk_{name}"
+                    stage_seconds[name] = stage_seconds.get(name, 0.0) + point.sum
+    return stage_seconds
+
+
+def _write_files(directory: str, count: int, size_kb: int) -> list[str]:
+    os.makedirs(directory, exist_ok=True)
+    filepaths = []
+    for number in range(count):
+        filepath = os.path.join(directory, f"benchmark_{number:06d}.txt")
+        rng = random.Random(number)
+        with open(filepath, "w") as f:
+            words = []
+            while len(words) * 8 < size_kb * 1024:
+                words.append(rng.choice(_WORDS))
+            f.write(" ".join(words)[: size_kb * 1024])
+        filepaths.append(filepath)
+    return filepaths
+
+
+def _parse_ints(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+async def run_benchmark(settings: argparse.Namespace) -> list[dict[str, Any]]:
+    """Ingest the synthetic files once per combination of the swept settings"""
+    work_dir = tempfile.mkdtemp(prefix="nvidia_rag_benchmark_")
+    # Isolated journal and fingerprint stores, identical files must be extracted
+    os.environ.setdefault(
+        "INGESTION_JOURNAL_PATH", os.path.join(work_dir, "journal.sqlite")
+    )
+    os.environ.setdefault("DUPLICATE_CONTENT_POLICY", "off")
+    reader = _install_metric_reader()
+
+    minio = InMemoryMinio(settings.minio_latency)
+    # The ingestor connects to nv-ingest and MinIO on import, so both are
+    # replaced before main is imported
+    from nvidia_rag.ingestor_server import nvingest
+    from nvidia_rag.utils import minio_operator
+
+    nvingest.get_nv_ingest_client = lambda *args, **kwargs: None
+    minio_operator.get_minio_operator = lambda *args, **kwargs: minio
+    from nvidia_rag.ingestor_server import main as ingestor_main
+
+    ingestor_main.MINIO_OPERATOR = minio
+    if settings.static_batches:
+        ingestor_main.ENABLE_NV_INGEST_DYNAMIC_BATCHING = False
+
+    filepaths = _write_files(
+        os.path.join(work_dir, "files"), settings.files, settings.file_size_kb
+    )
+    total_bytes = sum(os.path.getsize(filepath) for filepath in filepaths)
+    rng = random.Random(0)
+    dimensions = ingestor_main.CONFIG.embeddings.dimensions
+    vectors = [
+        [round(rng.uniform(-1, 1), 6) for _ in range(dimensions)] for _ in range(16)
+    ]
+    cluster = ThreadPoolExecutor(max_workers=settings.extract_parallelism)
+
+    reports = []
+    sweep = itertools.product(
+        settings.files_per_batch, settings.concurrent_batches, settings.bulk_batch_size
+    )
+    for run_number, (files_per_batch, concurrent_batches, bulk_batch_size) in enumerate(
+        sweep, 1
+    ):
+        ingestor_main.NV_INGEST_FILES_PER_BATCH = files_per_batch
+        ingestor_main.NV_INGEST_CONCURRENT_BATCHES = concurrent_batches
+        opensearch_vdb.BULK_BATCH_SIZE = bulk_batch_size
+        client = InMemoryOpenSearchClient(
+            bulk_latency=settings.bulk_latency,
+            bulk_seconds_per_mb=settings.bulk_seconds_per_mb,
+            refresh_latency=settings.refresh_latency,
+            visibility_delay=settings.visibility_delay,
+        )
+        collection_name = f"benchmark_{run_number}"
+        vdb_op = InMemoryOpenSearchVDB(client, collection_name)
+        ingestor_main.get_nv_ingest_ingestor = lambda filepaths, vdb_op=None, **kwargs: (
+            SyntheticNvIngestor(filepaths, vdb_op, settings, cluster, vectors)
+        )
+        ingestor = ingestor_main.NvidiaRAGIngestor(vdb_op=vdb_op)
+
+        gc.collect()
+        _collect_stage_seconds(reader)
+        minio_requests = minio.requests
+        with _PeakRssSampler() as rss:
+            start_time = time.time()
+            response = await ingestor.upload_documents(
+                filepaths=filepaths, blocking=True
+            )
+            elapsed = time.time() - start_time
+        chunks = sum(
+            client.count_by_source(collection_name, visible_only=False).values()
+        )
+        report = {
+            "files_per_batch": files_per_batch,
+            "concurrent_batches": concurrent_batches,
+            "bulk_batch_size": bulk_batch_size,
+            "seconds": round(elapsed, 3),
+            "files": len(response.get("documents", [])),
+            "failed_files": len(response.get("failed_documents", [])),
+            "chunks": chunks,
+            "files_per_second": round(len(response.get("documents", [])) / elapsed, 2),
+            "chunks_per_second": round(chunks / elapsed, 1),
+            "mb_per_second": round(total_bytes / 1e6 / elapsed, 2),
+            "peak_rss_mb": round(rss.peak / 1e6, 1),
+            "bulk_requests": client.bulk_requests,
+            "bulk_mb": round(client.bulk_bytes / 1e6, 2),
+            "minio_requests": minio.requests - minio_requests,
+            "stage_seconds": {
+                stage: round(seconds, 3)
+                for stage, seconds in sorted(_collect_stage_seconds(reader).items())
+            },
+        }
+        reports.append(report)
+        _print_report(report)
+        del client.indexes[collection_name]
+
+    cluster.shutdown()
+    return reports
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(
+        f"files/batch={report['files_per_batch']:<4} batches={report['concurrent_batches']:<3} "
+        f"bulk={report['bulk_batch_size']:<5} {report['seconds']:>8.2f}s "
+        f"{report['files_per_second']:>8.2f} files/s {report['chunks_per_second']:>10.1f} chunks/s "
+        f"peak RSS {report['peak_rss_mb']:>8.1f} MB"
+    )
+    if report["stage_seconds"]:
+        print(
+            "    stages: "
+            + ", ".join(
+                f"{stage}={seconds:.2f}s"
+                for stage, seconds in report["stage_seconds"].items()
+            )
+        )
+    sys.stdout.flush()
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    sweep = parser.add_argument_group("swept settings (comma separated)")
+    sweep.add_argument(
+        "--files-per-batch",
+        type=_parse_ints,
+        default=[16],
+        help="NV_INGEST_FILES_PER_BATCH values",
+    )
+    sweep.add_argument(
+        "--concurrent-batches",
+        type=_parse_ints,
+        default=[4],
+        help="NV_INGEST_CONCURRENT_BATCHES values",
+    )
+    sweep.add_argument(
+        "--bulk-batch-size",
+        type=_parse_ints,
+        default=[opensearch_vdb.BULK_BATCH_SIZE],
+        help="OS_BULK_BATCH_SIZE values (chunks per bulk request)",
+    )
+    workload = parser.add_argument_group("workload")
+    workload.add_argument(
+        "--files", type=int, default=100, help="Number of synthetic files"
+    )
+    workload.add_argument(
+        "--file-size-kb", type=int, default=64, help="Size of each file"
+    )
+    workload.add_argument(
+        "--page-chars", type=int, default=3000, help="Characters per synthetic page"
+    )
+    workload.add_argument(
+        "--elements-per-page", type=int, default=2, help="Text chunks per page"
+    )
+    workload.add_argument(
+        "--chunk-chars", type=int, default=2000, help="Characters per text chunk"
+    )
+    workload.add_argument(
+        "--tables-per-page",
+        type=float,
+        default=0.1,
+        help="Probability of a table (a citation) per page",
+    )
+    workload.add_argument(
+        "--table-bytes", type=int, default=20000, help="Citation content size"
+    )
+    workload.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of files nv-ingest reports as failed",
+    )
+    workload.add_argument(
+        "--static-batches",
+        action="store_true",
+        help="Fixed size batches instead of cost based packing",
+    )
+    stand_ins = parser.add_argument_group("stand-in latencies (seconds)")
+    stand_ins.add_argument(
+        "--latency-per-page",
+        type=float,
+        default=0.02,
+        help="Extraction time per page on one cluster slot",
+    )
+    stand_ins.add_argument(
+        "--extract-parallelism",
+        type=int,
+        default=32,
+        help="Pages the nv-ingest stand-in extracts at once",
+    )
+    stand_ins.add_argument(
+        "--bulk-latency", type=float, default=0.02, help="Per bulk request"
+    )
+    stand_ins.add_argument(
+        "--bulk-seconds-per-mb", type=float, default=0.01, help="Per MB of bulk body"
+    )
+    stand_ins.add_argument(
+        "--refresh-latency", type=float, default=0.01, help="Per index refresh"
+    )
+    stand_ins.add_argument(
+        "--visibility-delay",
+        type=float,
+        default=0.0,
+        help="Delay until written chunks are searchable",
+    )
+    stand_ins.add_argument(
+        "--minio-latency", type=float, default=0.005, help="Per MinIO request"
+    )
+    parser.add_argument("--output", help="Write the reports as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    settings = _parse_args(argv)
+    reports = asyncio.run(run_benchmark(settings))
+    if settings.output:
+        with open(settings.output, "w") as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
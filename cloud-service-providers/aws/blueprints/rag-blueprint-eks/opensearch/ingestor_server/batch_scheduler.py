@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Size-aware batch scheduling for NV-Ingest ingestion.
+
+Costs are expressed in page units: one unit is roughly the extraction work of
+one PDF page. Page counts are only used when they are already known (the file
+manifest counts PDF pages while it hashes the file), otherwise the cost is
+estimated from the file size, so scheduling never reads file contents.
+
+1. estimate_file_cost: Estimate the extraction cost of a file from its type, size and page count
+2. estimate_file_costs: Estimate the cost of many files concurrently
+3. pack_batches: Pack files into batches of roughly equal cost, most expensive batch first
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Target cost of a single batch, roughly 16 files of 25 pages
+NV_INGEST_BATCH_TARGET_COST = float(os.getenv("NV_INGEST_BATCH_TARGET_COST", 400))
+# Threads used to stat files without a known size while estimating costs
+COST_ESTIMATION_WORKERS = int(os.getenv("NV_INGEST_COST_ESTIMATION_WORKERS", 8))
+
+# Bytes per page unit for files without a known page count
+_BYTES_PER_UNIT = {
+    "pdf": 100 * 1024,
+    "docx": 60 * 1024,
+    "pptx": 200 * 1024,
+    "mp3": 500 * 1024,
+    "wav": 2 * 1024 * 1024,
+}
+# Plain text formats skip OCR and page elements, so they are cheap per byte
+_TEXT_BYTES_PER_UNIT = 200 * 1024
+_IMAGE_EXTENSIONS = {"bmp", "jpeg", "jpg", "png", "tiff", "svg"}
+# Fixed per-file overhead (job submission, result handling)
+_FILE_OVERHEAD = 0.5
+
+
+def estimate_file_cost(
+    filepath: str, size_bytes: int | None = None, page_count: int | None = None
+) -> float:
+    """Estimate the extraction cost of a file in page units."""
+    try:
+        if size_bytes is None:
+            size_bytes = os.path.getsize(filepath)
+    except OSError:
+        return _FILE_OVERHEAD
+    extension = os.path.splitext(filepath)[1].lower().lstrip(".")
+
+    if extension in _IMAGE_EXTENSIONS:
+        return _FILE_OVERHEAD + 1
+
+    if page_count:
+        return _FILE_OVERHEAD + page_count
+
+    bytes_per_unit = _BYTES_PER_UNIT.get(extension, _TEXT_BYTES_PER_UNIT)
+    return _FILE_OVERHEAD + max(1.0, size_bytes / bytes_per_unit)
+
+
+def estimate_file_costs(
+    filepaths: list[str],
+    sizes: dict[str, int] | None = None,
+    page_counts: dict[str, int] | None = None,
+) -> dict[str, float]:
+    """Estimate the cost of many files concurrently, keyed by filepath."""
+    sizes = sizes or {}
+    page_counts = page_counts or {}
+    with ThreadPoolExecutor(max_workers=COST_ESTIMATION_WORKERS) as executor:
+        costs = executor.map(
+            lambda filepath: estimate_file_cost(
+                filepath, sizes.get(filepath), page_counts.get(filepath)
+            ),
+            filepaths,
+        )
+        return dict(zip(filepaths, costs, strict=True))
+
+
+def pack_batches(
+    file_costs: dict[str, float],
+    max_files_per_batch: int,
+    target_cost: float = NV_INGEST_BATCH_TARGET_COST,
+) -> list[list[str]]:
+    """
+    Pack files into batches of roughly target_cost, most expensive batch first.
+
+    Files are taken in decreasing cost order and a batch is closed once the next
+    file would exceed the target or the file limit, so a large file gets a batch
+    of its own while small files are grouped together. Handing out expensive
+    batches first keeps a long batch from starting last and stalling the run.
+    """
+    batches = []
+    batch_costs = []
+    current_batch = []
+    current_cost = 0.0
+    for filepath, cost in sorted(
+        file_costs.items(), key=lambda item: item[1], reverse=True
+    ):
+        if current_batch and (
+            current_cost + cost > target_cost
+            or len(current_batch) >= max_files_per_batch
+        ):
+            batches.append(current_batch)
+            batch_costs.append(current_cost)
+            current_batch, current_cost = [], 0.0
+        current_batch.append(filepath)
+        current_cost += cost
+    if current_batch:
+        batches.append(current_batch)
+        batch_costs.append(current_cost)
+
+    if batches:
+        logger.info(
+            "Packed %d file(s) into %d batch(es), estimated cost per batch %.1f-%.1f pages",
+            len(file_costs),
+            len(batches),
+            min(batch_costs),
+            max(batch_costs),
+        )
+    ordered = sorted(
+        zip(batch_costs, batches, strict=True), key=lambda item: item[0], reverse=True
+    )
+    return [batch for _, batch in ordered]
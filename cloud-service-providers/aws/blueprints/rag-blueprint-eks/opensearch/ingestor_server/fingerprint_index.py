@@ -0,0 +1,295 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content fingerprint (sha256) index of ingested files.
+
+The index maps the sha256 of every ingested file to its document per
+collection, together with the ingestion settings it was extracted with and its
+number of chunks, and can be searched across all collections. Uploads use it to
+handle byte-identical files before extraction, according to
+DUPLICATE_CONTENT_POLICY:
+    off     ingest every file (default)
+    alias   copy the chunks of the identical document instead of extracting
+    reject  fail files whose content is already in the collection
+
+To opt in, set DUPLICATE_CONTENT_POLICY=alias (or reject) on the ingestor and
+keep FINGERPRINT_INDEX_PATH on a persistent volume. Only documents ingested with
+the same split, extraction and embedding settings are aliased, and only once
+all of their chunks are searchable.
+
+The hashes come from FileManifest.content_hashes, so each file is read once.
+
+1. get_settings_key: Key of the settings that shape the chunks of a document
+2. FingerprintIndex: SQLite index of file content hashes per collection
+3. plan_duplicates: Decide which files are aliased or rejected
+4. get_fingerprint_index: Get the process wide index, None if disabled
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+from nvidia_rag.ingestor_server.ingestion_journal import INGESTION_STATE_PATH
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_CONTENT_POLICY = os.getenv("DUPLICATE_CONTENT_POLICY", "off").lower()
+# Shares the database file with the ingestion journal unless set
+FINGERPRINT_INDEX_PATH = os.getenv("FINGERPRINT_INDEX_PATH", INGESTION_STATE_PATH)
+
+
+class Fingerprint(NamedTuple):
+    """An ingested file with the given content"""
+
+    collection_name: str
+    document_name: str
+    source_id: str
+    has_custom_metadata: bool
+    # Chunks stored for the document, 0 if unknown
+    chunk_count: int
+
+
+def get_settings_key(**settings) -> str:
+    """Key of the split, extraction and embedding settings a document was ingested with"""
+    return hashlib.sha256(
+        json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:32]
+
+
+class FingerprintIndex:
+    """sha256 of ingested files per collection, backed by SQLite"""
+
+    def __init__(self, path: str = FINGERPRINT_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_fingerprints (
+                    collection_name TEXT NOT NULL,
+                    document_name TEXT NOT NULL,
+                    source_id TEXT NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    has_custom_metadata INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (collection_name, document_name)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS file_fingerprints_sha256 "
+                "ON file_fingerprints (sha256)"
+            )
+            columns = {
+                row[1]
+                for row in self._connection.execute(
+                    "PRAGMA table_info(file_fingerprints)"
+                )
+            }
+            # Entries recorded before settings and chunk counts were tracked
+            # never match a lookup for aliasing
+            if "settings_key" not in columns:
+                self._connection.execute(
+                    "ALTER TABLE file_fingerprints "
+                    "ADD COLUMN settings_key TEXT NOT NULL DEFAULT ''"
+                )
+            if "chunk_count" not in columns:
+                self._connection.execute(
+                    "ALTER TABLE file_fingerprints "
+                    "ADD COLUMN chunk_count INTEGER NOT NULL DEFAULT 0"
+                )
+
+    def lookup(self, sha256: str, settings_key: str | None = None) -> list[Fingerprint]:
+        """
+        Get all ingested files with the given content, in any collection. With a
+        settings key, only files ingested with the same settings are returned.
+        """
+        query = (
+            "SELECT collection_name, document_name, source_id, has_custom_metadata, "
+            "chunk_count FROM file_fingerprints WHERE sha256 = ?"
+        )
+        parameters = [sha256]
+        if settings_key is not None:
+            query += " AND settings_key = ?"
+            parameters.append(settings_key)
+        with self._lock:
+            rows = self._connection.execute(
+                query + " ORDER BY updated_at DESC", parameters
+            ).fetchall()
+        return [
+            Fingerprint(
+                collection, document, source, bool(has_custom_metadata), chunk_count
+            )
+            for collection, document, source, has_custom_metadata, chunk_count in rows
+        ]
+
+    def record(
+        self,
+        collection_name: str,
+        entries: list[tuple[str, str, bool, int]],
+        settings_key: str = "",
+    ) -> None:
+        """Record ingested files as (source_id, sha256, has_custom_metadata, chunk_count)"""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO file_fingerprints "
+                "(collection_name, document_name, source_id, sha256, "
+                "has_custom_metadata, updated_at, settings_key, chunk_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        collection_name,
+                        os.path.basename(source_id),
+                        source_id,
+                        sha256,
+                        int(has_custom_metadata),
+                        now,
+                        settings_key,
+                        chunk_count,
+                    )
+                    for source_id, sha256, has_custom_metadata, chunk_count in entries
+                ],
+            )
+
+    def forget(
+        self, collection_name: str, document_names: list[str] | None = None
+    ) -> None:
+        """Drop fingerprints of deleted documents, or of a whole collection"""
+        with self._lock, self._connection:
+            if document_names is None:
+                self._connection.execute(
+                    "DELETE FROM file_fingerprints WHERE collection_name = ?",
+                    (collection_name,),
+                )
+            else:
+                self._connection.executemany(
+                    "DELETE FROM file_fingerprints "
+                    "WHERE collection_name = ? AND document_name = ?",
+                    [(collection_name, name) for name in document_names],
+                )
+
+
+def plan_duplicates(
+    index: FingerprintIndex,
+    collection_name: str,
+    content_hashes: dict[str, str],
+    custom_metadata_names: set[str],
+    settings_key: str = "",
+    policy: str = DUPLICATE_CONTENT_POLICY,
+) -> tuple[dict[str, tuple[str, str, int | None]], dict[str, str]]:
+    """
+    Decide how to handle files whose content is already ingested.
+
+    Returns the aliases, filepath -> (collection, source, chunk count) to copy
+    the chunks from, and the rejections, filepath -> error message. Only
+    documents ingested with the same settings and a known chunk count are
+    aliased. A file whose identical twin comes earlier in the same upload is
+    aliased to that twin, whose chunk count is only known once it has been
+    ingested (None). Files with custom metadata are neither aliased nor used as
+    alias source, since their chunks carry their own metadata.
+    """
+    aliases = {}
+    rejections = {}
+    if policy not in ["alias", "reject"]:
+        return aliases, rejections
+
+    upload_sources = {}
+    for filepath, sha256 in content_hashes.items():
+        document_name = os.path.basename(filepath)
+        has_custom_metadata = document_name in custom_metadata_names
+        matches = [
+            match
+            for match in index.lookup(
+                sha256, settings_key if policy == "alias" else None
+            )
+            if not (
+                match.collection_name == collection_name
+                and match.document_name == document_name
+            )
+        ]
+
+        if policy == "reject":
+            twin = next(
+                (
+                    match.document_name
+                    for match in matches
+                    if match.collection_name == collection_name
+                ),
+                upload_sources.get(sha256, (None, None, None))[1],
+            )
+            if twin is not None:
+                rejections[filepath] = (
+                    f"Document {document_name} has the same content as document "
+                    f"{os.path.basename(twin)} in collection {collection_name}."
+                )
+            else:
+                upload_sources[sha256] = (collection_name, filepath, None)
+            continue
+
+        if has_custom_metadata:
+            continue
+        # Prefer a copy within the collection, then any other collection
+        candidates = sorted(
+            (
+                match
+                for match in matches
+                if not match.has_custom_metadata and match.chunk_count > 0
+            ),
+            key=lambda match: match.collection_name != collection_name,
+        )
+        if candidates:
+            aliases[filepath] = (
+                candidates[0].collection_name,
+                candidates[0].source_id,
+                candidates[0].chunk_count,
+            )
+        elif sha256 in upload_sources:
+            aliases[filepath] = upload_sources[sha256]
+        else:
+            upload_sources[sha256] = (collection_name, filepath, None)
+
+    return aliases, rejections
+
+
+_FINGERPRINT_INDEX = None
+_FINGERPRINT_INDEX_LOCK = threading.Lock()
+
+
+def get_fingerprint_index() -> FingerprintIndex | None:
+    """Get the process wide fingerprint index, None if it is disabled or unusable"""
+    global _FINGERPRINT_INDEX
+    if DUPLICATE_CONTENT_POLICY not in ["alias", "reject"]:
+        return None
+    with _FINGERPRINT_INDEX_LOCK:
+        if _FINGERPRINT_INDEX is None:
+            try:
+                _FINGERPRINT_INDEX = FingerprintIndex()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    f"Fingerprint index disabled, could not open "
+                    f"{FINGERPRINT_INDEX_PATH}: {e}"
+                )
+                return None
+        return _FINGERPRINT_INDEX
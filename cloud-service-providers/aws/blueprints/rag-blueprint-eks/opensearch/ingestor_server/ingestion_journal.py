@@ -0,0 +1,344 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk checkpoint journal for document ingestion.
+
+Records the last completed stage of every file of a running upload in SQLite,
+so that when the upload is interrupted (e.g. by a pod restart) and submitted
+again, files it fully ingested are skipped and files it left halfway are
+cleaned up and re-ingested. Entries are forgotten once their upload completes,
+so only files of interrupted uploads are ever resumed.
+
+The journal is opt-in (ENABLE_INGESTION_JOURNAL) and needs INGESTION_JOURNAL_PATH
+on a persistent volume, a path in the container's filesystem would not survive
+the restart it is meant for.
+
+Files are matched by the sha256 of their content (FileManifest.content_hash).
+Every upload registers as an owner of the files it ingests and keeps a
+heartbeat while it runs; a file only counts as interrupted once its owner is
+released or its heartbeat is older than JOURNAL_OWNER_TIMEOUT, so the files of
+a concurrent upload are never cleaned up under it.
+
+1. JournalEntry: Journaled state of one document
+2. IngestionJournal: Per-file stage tracking backed by SQLite
+3. get_ingestion_journal: Get the process wide journal, None if disabled
+"""
+
+import logging
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import NamedTuple
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+ENABLE_INGESTION_JOURNAL = (
+    os.getenv("ENABLE_INGESTION_JOURNAL", "false").lower() == "true"
+)
+# Database file on a persistent volume, required when the journal is enabled
+INGESTION_JOURNAL_PATH = os.getenv("INGESTION_JOURNAL_PATH", "")
+# Default database file of the fingerprint index and the task progress store,
+# which share the journal's file when it is set
+INGESTION_STATE_PATH = INGESTION_JOURNAL_PATH or os.path.join(
+    tempfile.gettempdir(), "nvidia_rag_ingestion_journal.sqlite"
+)
+
+# Stages in the order they complete
+STAGE_FAILED = "FAILED"
+STAGE_VALIDATED = "VALIDATED"
+STAGE_INDEXED = "INDEXED"
+STAGE_CITATIONS = "CITATIONS"
+STAGE_SUMMARIZED = "SUMMARIZED"
+_STAGE_RANK = {
+    STAGE_FAILED: 0,
+    STAGE_VALIDATED: 1,
+    STAGE_INDEXED: 2,
+    STAGE_CITATIONS: 3,
+    STAGE_SUMMARIZED: 4,
+}
+
+# Seconds between heartbeats of the running uploads, and without a heartbeat
+# after which an upload is considered gone
+JOURNAL_HEARTBEAT_INTERVAL = float(os.getenv("JOURNAL_HEARTBEAT_INTERVAL", 30))
+JOURNAL_OWNER_TIMEOUT = float(os.getenv("JOURNAL_OWNER_TIMEOUT", 120))
+
+
+class JournalEntry(NamedTuple):
+    """Journaled state of one document"""
+
+    stage: str
+    # Content hash of the journaled file
+    fingerprint: str
+    owner: str | None
+    # Whether the upload that owns the document is still running
+    owner_active: bool
+
+
+class IngestionJournal:
+    """
+    Per-file ingestion checkpoints, keyed by collection and document name.
+
+    Stages only move forward within a run; start_files() resets files that are
+    (re)submitted for ingestion.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingestion_journal (
+                    collection_name TEXT NOT NULL,
+                    document_name TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    error TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (collection_name, document_name)
+                )
+                """
+            )
+            columns = {
+                row[1]
+                for row in self._connection.execute(
+                    "PRAGMA table_info(ingestion_journal)"
+                )
+            }
+            if "owner" not in columns:
+                # Journals written before uploads were tracked have no owner
+                self._connection.execute(
+                    "ALTER TABLE ingestion_journal ADD COLUMN owner TEXT"
+                )
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingestion_owners (
+                    owner TEXT PRIMARY KEY,
+                    heartbeat_at REAL NOT NULL
+                )
+                """
+            )
+        # Owners of the uploads running in this process
+        self._active_owners: set[str] = set()
+        self._heartbeat_thread = None
+        self._heartbeat_stop = threading.Event()
+
+    def new_owner(self) -> str:
+        """Register a running upload and keep its heartbeat until release_owner()"""
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex}"
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO ingestion_owners VALUES (?, ?)",
+                (owner, time.time()),
+            )
+            self._active_owners.add(owner)
+            if self._heartbeat_thread is None:
+                self._heartbeat_thread = threading.Thread(
+                    target=self._heartbeat,
+                    name="ingestion-journal-heartbeat",
+                    daemon=True,
+                )
+                self._heartbeat_thread.start()
+        return owner
+
+    def release_owner(self, owner: str) -> None:
+        """Mark an upload as finished, its unfinished files count as interrupted"""
+        with self._lock, self._connection:
+            self._active_owners.discard(owner)
+            self._connection.execute(
+                "DELETE FROM ingestion_owners WHERE owner = ?", (owner,)
+            )
+
+    def _heartbeat(self) -> None:
+        while not self._heartbeat_stop.wait(JOURNAL_HEARTBEAT_INTERVAL):
+            try:
+                with self._lock, self._connection:
+                    now = time.time()
+                    self._connection.executemany(
+                        "UPDATE ingestion_owners SET heartbeat_at = ? WHERE owner = ?",
+                        [(now, owner) for owner in self._active_owners],
+                    )
+                    # Drop owners of uploads that died without releasing them
+                    self._connection.execute(
+                        "DELETE FROM ingestion_owners WHERE heartbeat_at < ?",
+                        (now - 10 * JOURNAL_OWNER_TIMEOUT,),
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Ingestion journal heartbeat failed: {e}")
+
+    def get_entries(
+        self, collection_name: str, document_names: list[str]
+    ) -> dict[str, JournalEntry]:
+        """
+        Get the journaled state of documents, keyed by document name. Callers
+        compare the fingerprint before resuming a document.
+        """
+        entries = {}
+        names = list(dict.fromkeys(document_names))
+        with self._lock:
+            stale_before = time.time() - JOURNAL_OWNER_TIMEOUT
+            for i in range(0, len(names), 500):
+                chunk = names[i : i + 500]
+                rows = self._connection.execute(
+                    "SELECT j.document_name, j.fingerprint, j.stage, j.owner, "
+                    "o.heartbeat_at FROM ingestion_journal j "
+                    "LEFT JOIN ingestion_owners o ON o.owner = j.owner "
+                    f"WHERE j.collection_name = ? AND j.document_name IN ({
+                        ','.join('?' * len(chunk))
+                    })",
+                    [collection_name, *chunk],
+                ).fetchall()
+                for document_name, fingerprint, stage, owner, heartbeat_at in rows:
+                    owner_active = owner in self._active_owners or (
+                        heartbeat_at is not None and heartbeat_at >= stale_before
+                    )
+                    entries[document_name] = JournalEntry(
+                        stage, fingerprint, owner, owner_active
+                    )
+        return entries
+
+    def start_files(
+        self, collection_name: str, fingerprints: dict[str, str], owner: str
+    ) -> None:
+        """Record documents as validated and about to be ingested by an upload"""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO ingestion_journal "
+                "(collection_name, document_name, fingerprint, stage, error, "
+                "updated_at, owner) VALUES (?, ?, ?, ?, NULL, ?, ?)",
+                [
+                    (
+                        collection_name,
+                        document_name,
+                        fingerprint,
+                        STAGE_VALIDATED,
+                        now,
+                        owner,
+                    )
+                    for document_name, fingerprint in fingerprints.items()
+                ],
+            )
+
+    def mark_stage(
+        self, collection_name: str, document_names: list[str], stage: str
+    ) -> None:
+        """Advance documents to a stage, documents already past it are left as is"""
+        if not document_names:
+            return
+        rank = _STAGE_RANK[stage]
+        now = time.time()
+        with self._lock, self._connection:
+            for document_name in document_names:
+                row = self._connection.execute(
+                    "SELECT stage FROM ingestion_journal "
+                    "WHERE collection_name = ? AND document_name = ?",
+                    (collection_name, document_name),
+                ).fetchone()
+                if row is None or _STAGE_RANK.get(row[0], 0) >= rank:
+                    continue
+                self._connection.execute(
+                    "UPDATE ingestion_journal SET stage = ?, updated_at = ? "
+                    "WHERE collection_name = ? AND document_name = ?",
+                    (stage, now, collection_name, document_name),
+                )
+
+    def mark_failed(self, collection_name: str, errors: dict[str, str]) -> None:
+        """Record documents that failed ingestion with their error message"""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "UPDATE ingestion_journal SET stage = ?, error = ?, updated_at = ? "
+                "WHERE collection_name = ? AND document_name = ?",
+                [
+                    (STAGE_FAILED, error, now, collection_name, document_name)
+                    for document_name, error in errors.items()
+                ],
+            )
+
+    def forget(
+        self, collection_name: str, document_names: list[str] | None = None
+    ) -> None:
+        """
+        Drop journal entries of ingested or deleted documents, or of a whole
+        collection
+        """
+        with self._lock, self._connection:
+            if document_names is None:
+                self._connection.execute(
+                    "DELETE FROM ingestion_journal WHERE collection_name = ?",
+                    (collection_name,),
+                )
+            else:
+                self._connection.executemany(
+                    "DELETE FROM ingestion_journal "
+                    "WHERE collection_name = ? AND document_name = ?",
+                    [(collection_name, name) for name in document_names],
+                )
+
+    @staticmethod
+    def is_in_progress(entry: JournalEntry, citations_required: bool) -> bool:
+        """Whether a running upload is still working on the document"""
+        return (
+            entry.owner_active
+            and entry.stage != STAGE_FAILED
+            and not IngestionJournal.is_complete(entry.stage, citations_required)
+        )
+
+    @staticmethod
+    def is_complete(stage: str, citations_required: bool) -> bool:
+        """Whether a file at this stage needs no further ingestion work"""
+        required = STAGE_CITATIONS if citations_required else STAGE_INDEXED
+        return _STAGE_RANK.get(stage, 0) >= _STAGE_RANK[required]
+
+
+_INGESTION_JOURNAL = None
+_INGESTION_JOURNAL_LOCK = threading.Lock()
+_INGESTION_JOURNAL_WARNED = False
+
+
+def get_ingestion_journal() -> IngestionJournal | None:
+    """Get the process wide ingestion journal, None if it is disabled or unusable"""
+    global _INGESTION_JOURNAL, _INGESTION_JOURNAL_WARNED
+    if not ENABLE_INGESTION_JOURNAL:
+        return None
+    with _INGESTION_JOURNAL_LOCK:
+        if _INGESTION_JOURNAL is None:
+            if not INGESTION_JOURNAL_PATH:
+                if not _INGESTION_JOURNAL_WARNED:
+                    _INGESTION_JOURNAL_WARNED = True
+                    logger.warning(
+                        "Ingestion journal disabled, set INGESTION_JOURNAL_PATH "
+                        "to a file on a persistent volume to enable it"
+                    )
+                return None
+            try:
+                _INGESTION_JOURNAL = IngestionJournal(INGESTION_JOURNAL_PATH)
+                logger.info(f"Ingestion journal at {INGESTION_JOURNAL_PATH}")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    f"Ingestion journal disabled, could not open "
+                    f"{INGESTION_JOURNAL_PATH}: {e}"
+                )
+                return None
+        return _INGESTION_JOURNAL
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batched cleanup of MinIO objects for document and collection deletes.
+
+Objects of many documents are found with one listing of the collection prefix,
+partitioned by document in memory, and deleted in concurrent batches.
+
+1. list_prefixes: List several prefixes concurrently
+2. list_document_objects: Object names of documents in a collection, by document
+3. delete_objects: Delete objects in concurrent batches
+"""
+
+import bisect
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from nvidia_rag.utils.minio_operator import (
+    get_unique_thumbnail_id_collection_prefix,
+    get_unique_thumbnail_id_file_name_prefix,
+)
+
+logger = logging.getLogger(__name__)
+
+MINIO_CLEANUP_WORKERS = int(os.getenv("MINIO_CLEANUP_WORKERS", 8))
+# Objects per delete_payloads call (S3 multi-object deletes take at most 1000)
+MINIO_DELETE_BATCH_SIZE = int(os.getenv("MINIO_DELETE_BATCH_SIZE", 1000))
+# Up to this many documents, each document prefix is listed on its own instead
+# of listing the whole collection once
+MINIO_CLEANUP_SCAN_THRESHOLD = int(os.getenv("MINIO_CLEANUP_SCAN_THRESHOLD", 8))
+
+
+def list_prefixes(minio_operator, prefixes: list[str]) -> dict[str, list[str]]:
+    """List the object names under each prefix, concurrently"""
+    if len(prefixes) <= 1:
+        return {prefix: minio_operator.list_payloads(prefix) for prefix in prefixes}
+    with ThreadPoolExecutor(max_workers=MINIO_CLEANUP_WORKERS) as executor:
+        listings = executor.map(minio_operator.list_payloads, prefixes)
+        return dict(zip(prefixes, listings, strict=True))
+
+
+def list_document_objects(
+    minio_operator, collection_name: str, document_names: list[str]
+) -> dict[str, list[str]]:
+    """
+    Get the object names stored for each document of a collection.
+
+    For more than MINIO_CLEANUP_SCAN_THRESHOLD documents the collection prefix
+    is listed once and the names are partitioned by document prefix.
+    """
+    document_prefixes = {
+        document_name: get_unique_thumbnail_id_file_name_prefix(
+            collection_name, document_name
+        )
+        for document_name in dict.fromkeys(document_names)
+    }
+    if len(document_prefixes) <= MINIO_CLEANUP_SCAN_THRESHOLD:
+        listings = list_prefixes(minio_operator, list(document_prefixes.values()))
+        return {
+            document_name: listings[prefix]
+            for document_name, prefix in document_prefixes.items()
+        }
+
+    object_names = sorted(
+        minio_operator.list_payloads(
+            get_unique_thumbnail_id_collection_prefix(collection_name)
+        )
+    )
+    document_objects = {}
+    for document_name, prefix in document_prefixes.items():
+        start = bisect.bisect_left(object_names, prefix)
+        end = start
+        while end < len(object_names) and object_names[end].startswith(prefix):
+            end += 1
+        document_objects[document_name] = object_names[start:end]
+    return document_objects
+
+
+def delete_objects(minio_operator, object_names: list[str]) -> int:
+    """Delete objects in concurrent batches, returning the number of deleted names"""
+    object_names = list(dict.fromkeys(object_names))
+    batches = [
+        object_names[i : i + MINIO_DELETE_BATCH_SIZE]
+        for i in range(0, len(object_names), MINIO_DELETE_BATCH_SIZE)
+    ]
+    if len(batches) <= 1:
+        for batch in batches:
+            minio_operator.delete_payloads(batch)
+    else:
+        with ThreadPoolExecutor(max_workers=MINIO_CLEANUP_WORKERS) as executor:
+            # list() re-raises the first failed batch
+            list(executor.map(minio_operator.delete_payloads, batches))
+    logger.debug(f"Deleted {len(object_names)} object(s) from MinIO")
+    return len(object_names)
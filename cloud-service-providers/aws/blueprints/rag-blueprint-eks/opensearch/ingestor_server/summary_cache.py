@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Summary cache in MinIO, keyed by the content hash of the extracted text.
+
+The key also covers the summarizer version (model, prompts and chunking), so
+a changed prompt or model never serves a stale summary. Cache objects use a
+"/" delimited layout, which cannot collide with the "<collection>_" objects of
+citations and summaries since collection names never contain "/":
+
+    summary-cache/entries/<key>                          cached summary
+    summary-cache/refs/<key>/<collection>/<document>     documents using it
+    summary-cache/docs/<collection>/<document>/<key>     key used by a document
+
+Entries are reference counted by the documents whose summary they hold. A
+document references one key at a time, and deleting documents or collections
+releases their references and removes the entries nobody references anymore,
+so no summary outlives the documents it was generated for. update_documents
+keeps the references while it replaces a document, which lets an unchanged
+document reuse its summary.
+
+1. get_summary_version: Hash of everything besides the text that shapes a summary
+2. get_summary_cache_key: Cache key of a document text for a summary version
+3. get_cached_summary: Read a cached summary for a document, None on a miss
+4. put_cached_summary: Store the summary of a document in the cache
+5. add_summary_reference: Make a document reference a cache entry
+6. release_summary_cache: Release the references of deleted documents or collections
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any
+
+from nvidia_rag.ingestor_server.minio_cleanup import delete_objects, list_prefixes
+
+logger = logging.getLogger(__name__)
+
+ENABLE_SUMMARY_CACHE = os.getenv("ENABLE_SUMMARY_CACHE", "true").lower() == "true"
+SUMMARY_CACHE_PREFIX = "summary-cache/"
+_ENTRIES_PREFIX = f"{SUMMARY_CACHE_PREFIX}entries/"
+_REFS_PREFIX = f"{SUMMARY_CACHE_PREFIX}refs/"
+_DOCS_PREFIX = f"{SUMMARY_CACHE_PREFIX}docs/"
+
+
+def get_summary_version(**settings: Any) -> str:
+    """Hash the settings (model, prompts, chunking, strategy) that shape a summary"""
+    return hashlib.sha256(
+        json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def get_summary_cache_key(document_text: str, summary_version: str) -> str:
+    content_hash = hashlib.sha256(document_text.encode("utf-8")).hexdigest()
+    return f"{content_hash}_{summary_version}"
+
+
+def _get_entry_name(cache_key: str) -> str:
+    return f"{_ENTRIES_PREFIX}{cache_key}"
+
+
+def _get_reference_names(
+    cache_key: str, collection_name: str, document_name: str
+) -> tuple[str, str]:
+    return (
+        f"{_REFS_PREFIX}{cache_key}/{collection_name}/{document_name}",
+        f"{_DOCS_PREFIX}{collection_name}/{document_name}/{cache_key}",
+    )
+
+
+def get_cached_summary(
+    minio_operator, cache_key: str, collection_name: str, document_name: str
+) -> str | None:
+    """Read a cached summary for a document, None if it is not cached"""
+    try:
+        payload = minio_operator.get_payload(_get_entry_name(cache_key))
+    except Exception as e:
+        logger.debug(f"Summary cache miss for {cache_key}: {e}")
+        return None
+    summary = (payload or {}).get("summary")
+    if summary is not None:
+        add_summary_reference(minio_operator, cache_key, collection_name, document_name)
+    return summary
+
+
+def put_cached_summary(
+    minio_operator,
+    cache_key: str,
+    summary: str,
+    collection_name: str,
+    document_name: str,
+) -> None:
+    """Store the summary of a document in the cache"""
+    minio_operator.put_payload(
+        payload={"summary": summary, "cache_key": cache_key},
+        object_name=_get_entry_name(cache_key),
+    )
+    add_summary_reference(minio_operator, cache_key, collection_name, document_name)
+
+
+def add_summary_reference(
+    minio_operator, cache_key: str, collection_name: str, document_name: str
+) -> None:
+    """Make a document reference a cache entry, replacing its previous reference"""
+    document_prefix = f"{_DOCS_PREFIX}{collection_name}/{document_name}/"
+    previous_keys = {
+        object_name[len(document_prefix) :]
+        for object_name in minio_operator.list_payloads(document_prefix)
+    } - {cache_key}
+    for object_name in _get_reference_names(cache_key, collection_name, document_name):
+        minio_operator.put_payload(payload={}, object_name=object_name)
+    if previous_keys:
+        _release_references(
+            minio_operator,
+            [(key, collection_name, document_name) for key in previous_keys],
+        )
+
+
+def release_summary_cache(
+    minio_operator, collection_name: str, document_names: list[str] | None = None
+) -> int:
+    """
+    Release the cache references of deleted documents, or of a whole collection,
+    and delete the entries no document references anymore. Returns the number
+    of deleted entries.
+    """
+    if document_names is None:
+        prefixes = [f"{_DOCS_PREFIX}{collection_name}/"]
+    else:
+        prefixes = [
+            f"{_DOCS_PREFIX}{collection_name}/{document_name}/"
+            for document_name in dict.fromkeys(document_names)
+        ]
+    references = []
+    for object_name in (
+        object_name
+        for object_names in list_prefixes(minio_operator, prefixes).values()
+        for object_name in object_names
+    ):
+        # docs/<collection>/<document>/<key>
+        _, document_name, cache_key = object_name[len(_DOCS_PREFIX) :].split("/", 2)
+        references.append((cache_key, collection_name, document_name))
+    return _release_references(minio_operator, references)
+
+
+def _release_references(minio_operator, references: list[tuple[str, str, str]]) -> int:
+    if not references:
+        return 0
+    delete_objects(
+        minio_operator,
+        [
+            object_name
+            for reference in references
+            for object_name in _get_reference_names(*reference)
+        ],
+    )
+    cache_keys = list(dict.fromkeys(cache_key for cache_key, _, _ in references))
+    remaining_references = list_prefixes(
+        minio_operator, [f"{_REFS_PREFIX}{cache_key}/" for cache_key in cache_keys]
+    )
+    unreferenced_entries = [
+        _get_entry_name(cache_key)
+        for cache_key in cache_keys
+        if not remaining_references[f"{_REFS_PREFIX}{cache_key}/"]
+    ]
+    deleted = delete_objects(minio_operator, unreferenced_entries)
+    logger.debug(
+        f"Released {len(references)} summary cache reference(s), "
+        f"deleted {deleted} unreferenced entr(ies)"
+    )
+    return deleted
@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bounded work queue for document summary generation.
+
+Summary jobs are processed by a fixed pool of workers with retries. The queue
+depth is bounded, so a large upload waits for the summarizer instead of
+flooding it, and the state of every job is kept for status reporting. Queue
+and workers belong to the event loop that submits the jobs, so library users
+calling asyncio.run() repeatedly get a fresh pool per loop while job states
+stay shared.
+
+1. SummaryJobQueue: Queue and worker pool for summary jobs
+2. get_summary_job_queue: Get the process wide summary job queue
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain_core.documents import Document
+from opentelemetry import context as otel_context
+from opentelemetry import trace
+
+from nvidia_rag.ingestor_server.ingestion_metrics import (
+    add_queue_depth,
+    record_summaries,
+)
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+SUMMARY_QUEUE_WORKERS = int(os.getenv("SUMMARY_QUEUE_WORKERS", 4))
+# Maximum number of queued documents before submit() waits
+SUMMARY_QUEUE_SIZE = int(os.getenv("SUMMARY_QUEUE_SIZE", 256))
+SUMMARY_MAX_RETRIES = int(os.getenv("SUMMARY_MAX_RETRIES", 2))
+# Number of finished jobs whose state is kept for status()
+SUMMARY_JOB_HISTORY = int(os.getenv("SUMMARY_JOB_HISTORY", 10000))
+
+STATE_QUEUED = "QUEUED"
+STATE_RUNNING = "RUNNING"
+STATE_DONE = "DONE"
+STATE_FAILED = "FAILED"
+
+
+class SummaryJobQueue:
+    """
+    Summarize documents from a bounded queue with a pool of async workers.
+
+    Each job is one document and the coroutine function that summarizes and
+    stores it; a failing job is retried with exponential backoff. Summaries are
+    counted once per job, when it is done or has failed its last attempt.
+    """
+
+    def __init__(
+        self,
+        workers: int = SUMMARY_QUEUE_WORKERS,
+        queue_size: int = SUMMARY_QUEUE_SIZE,
+        max_retries: int = SUMMARY_MAX_RETRIES,
+    ):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_retries = max_retries
+        # Queue and worker tasks per event loop
+        self._loop_queues: dict[
+            asyncio.AbstractEventLoop, tuple[asyncio.Queue, list[asyncio.Task]]
+        ] = {}
+        self._jobs: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+
+    def _start(self) -> asyncio.Queue:
+        """Get the queue of the running event loop, starting its workers"""
+        loop = asyncio.get_running_loop()
+        for closed_loop in [other for other in self._loop_queues if other.is_closed()]:
+            del self._loop_queues[closed_loop]
+        if loop not in self._loop_queues:
+            self._loop_queues[loop] = (asyncio.Queue(maxsize=self.queue_size), [])
+        queue, worker_tasks = self._loop_queues[loop]
+        worker_tasks[:] = [task for task in worker_tasks if not task.done()]
+        for _ in range(self.workers - len(worker_tasks)):
+            worker_tasks.append(asyncio.create_task(self._worker(queue)))
+        return queue
+
+    async def submit(
+        self,
+        documents: list[Document],
+        process_fn: Callable[[list[Document]], Awaitable[None]],
+        task_id: str | None = None,
+    ) -> None:
+        """Queue documents for summarization, waiting while the queue is full"""
+        queue = self._start()
+        # Trace context of the submitter, the job spans are its children
+        context = otel_context.get_current()
+        for document in documents:
+            key = (
+                task_id or "",
+                document.metadata["collection_name"],
+                document.metadata["filename"],
+            )
+            self._set_state(key, STATE_QUEUED, attempts=0, error=None)
+            await queue.put((key, document, process_fn, context))
+            add_queue_depth("summary", 1)
+
+    def get_status(self, task_id: str) -> dict[str, Any] | None:
+        """Summary job states of a task, None if it queued no summaries"""
+        jobs = [
+            {"document_name": key[2], "collection_name": key[1], **job}
+            for key, job in self._jobs.items()
+            if key[0] == task_id
+        ]
+        if not jobs:
+            return None
+        counts = dict.fromkeys(
+            [STATE_QUEUED, STATE_RUNNING, STATE_DONE, STATE_FAILED], 0
+        )
+        for job in jobs:
+            counts[job["state"]] += 1
+        return {
+            "total": len(jobs),
+            "queued": counts[STATE_QUEUED],
+            "running": counts[STATE_RUNNING],
+            "done": counts[STATE_DONE],
+            "failed": counts[STATE_FAILED],
+            "queue_depth": sum(
+                queue.qsize() for queue, _ in list(self._loop_queues.values())
+            ),
+            "documents": jobs,
+        }
+
+    def _set_state(self, key: tuple[str, str, str], state: str, **fields: Any) -> None:
+        job = self._jobs.pop(key, {})
+        job.update(state=state, updated_at=time.time(), **fields)
+        self._jobs[key] = job
+        while len(self._jobs) > SUMMARY_JOB_HISTORY:
+            oldest_key = next(iter(self._jobs))
+            if self._jobs[oldest_key]["state"] in [STATE_QUEUED, STATE_RUNNING]:
+                break
+            self._jobs.popitem(last=False)
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            key, document, process_fn, context = await queue.get()
+            add_queue_depth("summary", -1)
+            try:
+                with tracer.start_as_current_span(
+                    "summary_job",
+                    context=context,
+                    attributes={
+                        "rag.collection_name": key[1],
+                        "rag.document_name": key[2],
+                    },
+                ):
+                    await self._run_with_retries(key, document, process_fn)
+            finally:
+                queue.task_done()
+
+    async def _run_with_retries(
+        self,
+        key: tuple[str, str, str],
+        document: Document,
+        process_fn: Callable[[list[Document]], Awaitable[None]],
+    ) -> None:
+        delay = 2.0
+        for attempt in range(1, self.max_retries + 2):
+            self._set_state(key, STATE_RUNNING, attempts=attempt)
+            try:
+                await process_fn([document])
+                self._set_state(key, STATE_DONE, error=None)
+                record_summaries(
+                    1, "cached" if document.metadata.get("summary_cached") else "done"
+                )
+                return
+            except Exception as e:
+                if attempt > self.max_retries:
+                    logger.error(
+                        f"Summary generation for {key[2]} failed after {attempt} attempt(s): {e}",
+                        exc_info=logger.getEffectiveLevel() <= logging.DEBUG,
+                    )
+                    self._set_state(key, STATE_FAILED, error=str(e))
+                    record_summaries(1, "failed")
+                    return
+                logger.warning(
+                    f"Summary generation for {key[2]} failed (attempt {attempt}), "
+                    f"retrying in {delay:.0f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+
+_SUMMARY_JOB_QUEUE = None
+
+
+def get_summary_job_queue() -> SummaryJobQueue:
+    """Get the process wide summary job queue"""
+    global _SUMMARY_JOB_QUEUE
+    if _SUMMARY_JOB_QUEUE is None:
+        _SUMMARY_JOB_QUEUE = SummaryJobQueue()
+    return _SUMMARY_JOB_QUEUE
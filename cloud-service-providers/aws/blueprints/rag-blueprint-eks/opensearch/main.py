@@ -32,7 +32,7 @@ Private methods:
 5. __ingest_document_summary: Drives summary generation and ingestion if enabled.
 6. __prepare_summary_documents: Prepare summary documents for ingestion.
 7. __generate_summary_for_documents: Generate summary for documents.
-8. __put_document_summary_to_minio: Put document summaries to minio.
+8. __put_document_summary_to_minio: Queue document summaries for upload to minio.
 """
 
 import asyncio
@@ -40,6 +40,8 @@ import json
 import logging
 import os
 import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -48,16 +50,73 @@ from uuid import uuid4
 from langchain_core.documents import Document
 from langchain_core.output_parsers.string import StrOutputParser
 from langchain_core.prompts.chat import ChatPromptTemplate
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from nv_ingest_client.primitives.tasks.extract import _DEFAULT_EXTRACTOR_MAP
 from nv_ingest_client.util.file_processing.extract import EXTENSION_TO_DOCUMENT_TYPE
 from nv_ingest_client.util.vdb.adt_vdb import VDB
+from opentelemetry import trace
 
+from nvidia_rag.ingestor_server.batch_scheduler import (
+    estimate_file_costs,
+    pack_batches,
+)
+from nvidia_rag.ingestor_server.citation_dedup import (
+    ENABLE_MINIO_CITATION_DEDUP,
+    CitationDeduplicator,
+    copy_payload,
+)
+from nvidia_rag.ingestor_server.file_manifest import FileManifest
+from nvidia_rag.ingestor_server.fingerprint_index import (
+    get_fingerprint_index,
+    get_settings_key,
+    plan_duplicates,
+)
+from nvidia_rag.ingestor_server.ingestion_journal import (
+    STAGE_CITATIONS,
+    STAGE_INDEXED,
+    STAGE_SUMMARIZED,
+    IngestionJournal,
+    get_ingestion_journal,
+)
+from nvidia_rag.ingestor_server.ingestion_metrics import (
+    add_in_flight_batches,
+    record_files,
+    record_stage_duration,
+    stage_timer,
+)
+from nvidia_rag.ingestor_server.minio_cleanup import (
+    delete_objects,
+    list_document_objects,
+    list_prefixes,
+)
+from nvidia_rag.ingestor_server.minio_uploader import MinioUploadStage
 from nvidia_rag.ingestor_server.nvingest import (
     get_nv_ingest_client,
     get_nv_ingest_ingestor,
 )
+from nvidia_rag.ingestor_server.result_columns import ResultColumns
+from nvidia_rag.ingestor_server.summary_cache import (
+    ENABLE_SUMMARY_CACHE,
+    add_summary_reference,
+    get_cached_summary,
+    get_summary_cache_key,
+    get_summary_version,
+    put_cached_summary,
+    release_summary_cache,
+)
+from nvidia_rag.ingestor_server.summary_queue import get_summary_job_queue
 from nvidia_rag.ingestor_server.task_handler import INGESTION_TASK_HANDLER
+from nvidia_rag.ingestor_server.task_progress import (
+    IngestionProgress,
+    get_task_progress_store,
+)
+from nvidia_rag.ingestor_server.token_budget import (
+    SUMMARY_MAX_OUTPUT_TOKENS,
+    chars_to_tokens,
+    count_tokens,
+    get_token_budget,
+    pack_by_tokens,
+    split_by_tokens,
+)
 from nvidia_rag.utils.common import get_config
 from nvidia_rag.utils.llm import get_llm, get_prompts
 from nvidia_rag.utils.metadata_validation import (
@@ -69,13 +128,13 @@ from nvidia_rag.utils.minio_operator import (
     get_minio_operator,
     get_unique_thumbnail_id,
     get_unique_thumbnail_id_collection_prefix,
-    get_unique_thumbnail_id_file_name_prefix,
 )
 from nvidia_rag.utils.vdb import _get_vdb_op
 from nvidia_rag.utils.vdb.vdb_base import VDBRag
 
 # Initialize global objects
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 CONFIG = get_config()
 NV_INGEST_CLIENT_INSTANCE = get_nv_ingest_client()
@@ -104,6 +163,65 @@ ENABLE_NV_INGEST_PARALLEL_BATCH_MODE = (
     os.getenv("ENABLE_NV_INGEST_PARALLEL_BATCH_MODE", "true").lower() == "true"
 )
 NV_INGEST_CONCURRENT_BATCHES = int(os.getenv("NV_INGEST_CONCURRENT_BATCHES", 4))
+# Pack batches by estimated extraction cost instead of a fixed file count
+ENABLE_NV_INGEST_DYNAMIC_BATCHING = (
+    os.getenv("ENABLE_NV_INGEST_DYNAMIC_BATCHING", "true").lower() == "true"
+)
+
+# Dependency health results are reused for this many seconds so that frequent
+# Kubernetes probes don't fan out to every dependency on each request
+HEALTH_CHECK_CACHE_TTL = float(os.getenv("HEALTH_CHECK_CACHE_TTL", 10))
+# Results per vector store type and endpoint, as (checked_at, results)
+_DEPENDENCY_HEALTH_CACHE: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
+
+def _get_health_cache_key(vdb_op: VDBRag) -> tuple[str, str]:
+    """Key of the cached dependency health of a vector store operator"""
+    endpoint = next(
+        (
+            getattr(vdb_op, attribute)
+            for attribute in ["opensearch_url", "es_url", "vdb_endpoint"]
+            if getattr(vdb_op, attribute, None)
+        ),
+        CONFIG.vector_store.url,
+    )
+    return type(vdb_op).__name__, str(endpoint)
+
+# Document summarization: concurrent LLM calls and long document strategy
+# ("refine" or "map_reduce")
+SUMMARY_MAX_CONCURRENCY = int(os.getenv("SUMMARY_MAX_CONCURRENCY", 4))
+SUMMARY_STRATEGY = os.getenv("SUMMARY_STRATEGY", "refine").lower()
+
+# Summary LLM semaphore and upload stage per event loop, asyncio primitives
+# can't be shared across the loops of repeated asyncio.run() calls
+_SUMMARY_LOOP_STATE: dict[
+    asyncio.AbstractEventLoop, tuple[asyncio.Semaphore, MinioUploadStage]
+] = {}
+
+
+def _get_summary_loop_state() -> tuple[asyncio.Semaphore, MinioUploadStage]:
+    loop = asyncio.get_running_loop()
+    for closed_loop in [other for other in _SUMMARY_LOOP_STATE if other.is_closed()]:
+        del _SUMMARY_LOOP_STATE[closed_loop]
+    if loop not in _SUMMARY_LOOP_STATE:
+        _SUMMARY_LOOP_STATE[loop] = (
+            asyncio.Semaphore(SUMMARY_MAX_CONCURRENCY),
+            MinioUploadStage(
+                NvidiaRAGIngestor._upload_payloads_to_minio, name="Summary"
+            ),
+        )
+    return _SUMMARY_LOOP_STATE[loop]
+
+
+def _get_summary_llm_semaphore() -> asyncio.Semaphore:
+    """Semaphore bounding concurrent summarizer LLM calls across all summary jobs"""
+    return _get_summary_loop_state()[0]
+
+
+def _get_summary_uploader() -> MinioUploadStage:
+    """Upload stage shared by all summary jobs, started on first use"""
+    return _get_summary_loop_state()[1]
+
 
 LIBRARY_MODE = "library"
 SERVER_MODE = "server"
@@ -143,7 +261,12 @@ class NvidiaRAGIngestor:
                 )
 
     async def health(self, check_dependencies: bool = False) -> dict[str, Any]:
-        """Check the health of the Ingestion server."""
+        """Check the health of the Ingestion server.
+
+        Dependency results are reused for HEALTH_CHECK_CACHE_TTL seconds per
+        vector store endpoint. The dependency checks themselves are run by
+        nvidia_rag.ingestor_server.health.
+        """
         response_message = "Service is up."
         health_results = {}
         health_results["message"] = response_message
@@ -153,7 +276,19 @@ class NvidiaRAGIngestor:
         if check_dependencies:
             from nvidia_rag.ingestor_server.health import check_all_services_health
 
-            dependencies_results = await check_all_services_health(vdb_op)
+            cache_key = _get_health_cache_key(vdb_op)
+            cached = _DEPENDENCY_HEALTH_CACHE.get(cache_key)
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < HEALTH_CHECK_CACHE_TTL
+            ):
+                dependencies_results = cached[1]
+            else:
+                dependencies_results = await check_all_services_health(vdb_op)
+                _DEPENDENCY_HEALTH_CACHE[cache_key] = (
+                    time.monotonic(),
+                    dependencies_results,
+                )
             health_results.update(dependencies_results)
         return health_results
 
@@ -225,7 +360,32 @@ class NvidiaRAGIngestor:
             split_options (Dict[str, Any], optional): Options for splitting documents. Defaults to chunk_size and chunk_overlap from settings.
             custom_metadata (List[Dict[str, Any]], optional): Custom metadata to add to documents. Defaults to empty list.
         """
+        return await self.__submit_ingestion(
+            filepaths=filepaths,
+            blocking=blocking,
+            collection_name=collection_name,
+            vdb_endpoint=vdb_endpoint,
+            split_options=split_options,
+            custom_metadata=custom_metadata,
+            generate_summary=generate_summary,
+        )
 
+    async def __submit_ingestion(
+        self,
+        filepaths: list[str],
+        blocking: bool = False,
+        collection_name: str = None,
+        vdb_endpoint: str = CONFIG.vector_store.url,
+        split_options: dict[str, Any] = None,
+        custom_metadata: list[dict[str, Any]] = None,
+        generate_summary: bool = False,
+        diff_update: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Validate the target collection and run ingestion, in the background
+        unless blocking is set. With diff_update, documents that already exist
+        are updated in place instead of being rejected.
+        """
         vdb_op, collection_name = self.__prepare_vdb_op_and_collection_name(
             vdb_endpoint=vdb_endpoint,
             collection_name=collection_name,
@@ -248,9 +408,10 @@ class NvidiaRAGIngestor:
 
         try:
             if not blocking:
+                progress = IngestionProgress(collection_name)
 
                 def _task():
-                    return self.__ingest_docs(
+                    return self.__traced_ingest_docs(
                         filepaths=filepaths,
                         collection_name=collection_name,
                         vdb_endpoint=vdb_endpoint,
@@ -258,15 +419,18 @@ class NvidiaRAGIngestor:
                         split_options=split_options,
                         custom_metadata=custom_metadata,
                         generate_summary=generate_summary,
+                        diff_update=diff_update,
+                        progress=progress,
                     )
 
                 task_id = INGESTION_TASK_HANDLER.submit_task(_task)
+                progress.bind(task_id, get_task_progress_store())
                 return {
                     "message": "Ingestion started in background",
                     "task_id": task_id,
                 }
             else:
-                response_dict = await self.__ingest_docs(
+                response_dict = await self.__traced_ingest_docs(
                     filepaths=filepaths,
                     collection_name=collection_name,
                     vdb_endpoint=vdb_endpoint,
@@ -274,6 +438,7 @@ class NvidiaRAGIngestor:
                     split_options=split_options,
                     custom_metadata=custom_metadata,
                     generate_summary=generate_summary,
+                    diff_update=diff_update,
                 )
             return response_dict
 
@@ -286,6 +451,23 @@ class NvidiaRAGIngestor:
                 "failed_documents": [],
             }
 
+    async def __traced_ingest_docs(self, **kwargs: Any) -> dict[str, Any]:
+        """Run __ingest_docs in an "ingest_documents" span"""
+        with tracer.start_as_current_span(
+            "ingest_documents",
+            attributes={
+                "rag.collection_name": kwargs.get("collection_name") or "",
+                "rag.file_count": len(kwargs["filepaths"]),
+                "rag.diff_update": bool(kwargs.get("diff_update")),
+            },
+        ) as span:
+            response = await self.__ingest_docs(**kwargs)
+            span.set_attribute("rag.documents_uploaded", len(response["documents"]))
+            span.set_attribute(
+                "rag.documents_failed", len(response["failed_documents"])
+            )
+            return response
+
     async def __ingest_docs(
         self,
         filepaths: list[str],
@@ -295,6 +477,8 @@ class NvidiaRAGIngestor:
         split_options: dict[str, Any] = None,
         custom_metadata: list[dict[str, Any]] = None,
         generate_summary: bool = False,
+        diff_update: bool = False,
+        progress: IngestionProgress = None,
     ) -> dict[str, Any]:
         """
         Main function called by ingestor server to ingest
@@ -305,13 +489,20 @@ class NvidiaRAGIngestor:
             - collection_name: str - Name of the collection in the vector database
             - split_options: Dict[str, Any] - Options for splitting documents
             - custom_metadata: List[Dict[str, Any]] - Custom metadata to be added to documents
+            - diff_update: bool - Update existing documents in place, chunk by chunk
+            - progress: IngestionProgress - Progress of the task running this ingestion
         """
         logger.info("Performing ingestion in collection_name: %s", collection_name)
         logger.debug("Filepaths for ingestion: %s", filepaths)
+        if progress is None:
+            progress = IngestionProgress(collection_name)
+        validation_start_time = time.time()
 
         failed_validation_documents = []
         validation_errors = []
         original_file_count = len(filepaths)
+        journal = get_ingestion_journal()
+        journal_owner = None
 
         try:
             # Always run validation if there's a schema, even without custom_metadata
@@ -328,6 +519,9 @@ class NvidiaRAGIngestor:
                     custom_metadata=custom_metadata,
                     filepaths=filepaths,
                 )
+            if diff_update:
+                # A per-request copy, the operator may be shared with other requests
+                vdb_op = vdb_op.with_diff_update()
 
             if not validation_status:
                 failed_filenames = set()
@@ -357,21 +551,114 @@ class NvidiaRAGIngestor:
                     if item.get("filename") not in failed_filenames
                 ]
 
-            # Get all documents in the collection (only if we have files to process)
+            # Stat every file once, concurrently; validation, batching and the
+            # response read from the manifest
+            manifest = await asyncio.to_thread(FileManifest.build, filepaths)
+            trace.get_current_span().set_attribute(
+                "rag.total_bytes", manifest.total_size(filepaths)
+            )
+
+            # Find incoming files already in the collection (only if we have files to process)
             existing_documents = set()
-            if filepaths:
-                get_docs_response = self.get_documents(
-                    collection_name, bypass_validation=True
+            if filepaths and not diff_update:
+                if hasattr(vdb_op, "documents_exist"):
+                    # Look up only the incoming names instead of listing the collection
+                    existing_documents = await asyncio.to_thread(
+                        vdb_op.documents_exist,
+                        collection_name,
+                        [os.path.basename(file) for file in filepaths],
+                        filepaths,
+                    )
+                else:
+                    get_docs_response = self.get_documents(
+                        collection_name, bypass_validation=True
+                    )
+                    existing_documents = {
+                        doc.get("document_name")
+                        for doc in get_docs_response["documents"]
+                    }
+
+            # Resume from the ingestion journal. Entries are forgotten once an
+            # upload completes, so a journaled file belongs to a running or an
+            # interrupted upload. Files a running upload is still ingesting are
+            # rejected. Of the files an interrupted upload left with unchanged
+            # content, those it completed and stored are skipped and those it
+            # left halfway are cleaned up and ingested again.
+            resumed_filepaths = []
+            if journal is not None and filepaths and not diff_update:
+                journal_entries = await asyncio.to_thread(
+                    journal.get_entries,
+                    collection_name,
+                    [os.path.basename(file) for file in filepaths],
                 )
-                existing_documents = {
-                    doc.get("document_name") for doc in get_docs_response["documents"]
-                }
+                # Only files left by an interrupted upload are hashed
+                resume_hashes = await asyncio.to_thread(
+                    manifest.content_hashes,
+                    [
+                        file
+                        for file in filepaths
+                        if os.path.basename(file) in journal_entries
+                        and not journal_entries[os.path.basename(file)].owner_active
+                    ],
+                )
+                interrupted_filepaths = []
+                for file in filepaths:
+                    filename = os.path.basename(file)
+                    entry = journal_entries.get(filename)
+                    if entry is None:
+                        continue
+                    if IngestionJournal.is_in_progress(entry, CONFIG.enable_citations):
+                        logger.error(
+                            f"Document {file} is being ingested by another upload"
+                        )
+                        failed_validation_documents.append(
+                            {
+                                "document_name": filename,
+                                "error_message": f"Document {filename} is being ingested by another upload. Retry once it completes.",
+                            }
+                        )
+                        existing_documents.discard(filename)
+                    elif resume_hashes.get(file) != entry.fingerprint:
+                        # Owned by a running upload or changed since
+                        continue
+                    elif (
+                        IngestionJournal.is_complete(
+                            entry.stage, CONFIG.enable_citations
+                        )
+                        and filename in existing_documents
+                    ):
+                        resumed_filepaths.append(file)
+                    else:
+                        interrupted_filepaths.append(file)
+                if resumed_filepaths:
+                    logger.info(
+                        "Skipping %d file(s) already ingested by an interrupted upload",
+                        len(resumed_filepaths),
+                    )
+                    resumed_set = set(resumed_filepaths)
+                    filepaths = [file for file in filepaths if file not in resumed_set]
+                if interrupted_filepaths:
+                    logger.info(
+                        "Re-ingesting %d file(s) left halfway by an interrupted upload",
+                        len(interrupted_filepaths),
+                    )
+                    await asyncio.to_thread(
+                        vdb_op.delete_documents, collection_name, interrupted_filepaths
+                    )
+                    existing_documents -= {
+                        os.path.basename(file) for file in interrupted_filepaths
+                    }
 
             for file in filepaths:
-                await self.validate_directory_traversal_attack(file)
-                filename = os.path.basename(file)
+                file_entry = manifest.get(file)
+                if not file_entry.resolvable:
+                    # Same check as validate_directory_traversal_attack
+                    raise ValueError(
+                        f"File not found or a directory traversal attack detected! Filepath: {file}"
+                    )
+                filename = file_entry.document_name
                 # Check if the provided filepaths are valid
-                if not os.path.exists(file):
+                if not file_entry.exists:
                     logger.error(f"File {file} does not exist. Ingestion failed.")
                     failed_validation_documents.append(
                         {
@@ -380,7 +667,7 @@ class NvidiaRAGIngestor:
                         }
                     )
 
-                if not os.path.isfile(file):
+                if not file_entry.is_file:
                     failed_validation_documents.append(
                         {
                             "document_name": filename,
@@ -422,8 +709,73 @@ class NvidiaRAGIngestor:
                         }
                     )
 
+            # Byte-identical files are rejected, or aliased to the chunks of the
+            # identical document, before anything is extracted
+            fingerprint_index = None if diff_update else get_fingerprint_index()
+            content_hashes = {}
+            aliases = {}
+            settings_key = ""
+            if fingerprint_index is not None:
+                # Identical files only share chunks if they were split, extracted
+                # and embedded the same way
+                settings_key = get_settings_key(
+                    split_options=split_options
+                    or {
+                        "chunk_size": CONFIG.nv_ingest.chunk_size,
+                        "chunk_overlap": CONFIG.nv_ingest.chunk_overlap,
+                    },
+                    nv_ingest={
+                        name: getattr(self._config.nv_ingest, name, None)
+                        for name in (
+                            "pdf_extract_method",
+                            "text_depth",
+                            "extract_text",
+                            "extract_tables",
+                            "extract_charts",
+                            "extract_images",
+                            "extract_infographics",
+                        )
+                    },
+                    embeddings={
+                        "model_name": getattr(CONFIG.embeddings, "model_name", None),
+                        "dimensions": CONFIG.embeddings.dimensions,
+                    },
+                )
+                failed_names = {
+                    failed_document.get("document_name")
+                    for failed_document in failed_validation_documents
+                }
+                content_hashes = await asyncio.to_thread(
+                    manifest.content_hashes,
+                    [
+                        file
+                        for file in filepaths
+                        if os.path.basename(file) not in failed_names
+                    ],
+                )
+                aliases, rejections = await asyncio.to_thread(
+                    plan_duplicates,
+                    fingerprint_index,
+                    collection_name,
+                    content_hashes,
+                    {item.get("filename") for item in custom_metadata},
+                    settings_key,
+                )
+                for file, error_message in rejections.items():
+                    logger.error(error_message)
+                    failed_validation_documents.append(
+                        {
+                            "document_name": os.path.basename(file),
+                            "error_message": error_message,
+                        }
+                    )
+
             # Check if all provided files have failed (consolidated check)
-            if len(failed_validation_documents) == original_file_count:
+            if (
+                len(failed_validation_documents) == original_file_count
+                and not resumed_filepaths
+            ):
+                progress.finish("FAILED")
                 return {
                     "message": "Document upload job failed. All files failed to validate. Check logs for details.",
                     "total_documents": original_file_count,
@@ -448,32 +800,129 @@ class NvidiaRAGIngestor:
                 logger.error(f"Validation errors: {failed_validation_documents}")
 
             logger.info("Filepaths for ingestion after validation: %s", filepaths)
+            if journal is not None and filepaths:
+                journal_owner = await asyncio.to_thread(journal.new_owner)
+                # Shared with the fingerprint index, the manifest hashes a file once
+                journal_hashes = await asyncio.to_thread(
+                    manifest.content_hashes, filepaths
+                )
+                await asyncio.to_thread(
+                    journal.start_files,
+                    collection_name,
+                    {
+                        os.path.basename(file): content_hash
+                        for file, content_hash in journal_hashes.items()
+                    },
+                    journal_owner,
+                )
 
             # Peform ingestion using nvingest for all files that have not failed
             # Check if the provided collection_name exists in vector-DB
 
+            validation_time = time.time() - validation_start_time
+            progress.record_stage("validation", validation_time)
+            record_stage_duration("validation", validation_time)
             start_time = time.time()
-            results, failures = await self.__nvingest_upload_doc(
-                filepaths=filepaths,
+            extract_filepaths = [file for file in filepaths if file not in aliases]
+            ingested_sources, failures = await self.__nvingest_upload_doc(
+                filepaths=extract_filepaths,
                 collection_name=collection_name,
                 vdb_op=vdb_op,
                 split_options=split_options,
                 generate_summary=generate_summary,
+                progress=progress,
+                manifest=manifest,
             )
+            if aliases:
+                # Files that could not be aliased are extracted after all
+                fallback_filepaths = await self.__alias_documents(
+                    aliases,
+                    extract_filepaths,
+                    ingested_sources,
+                    collection_name,
+                    vdb_op,
+                    generate_summary=generate_summary,
+                    summary_task_id=progress.task_id,
+                )
+                if fallback_filepaths:
+                    _, fallback_failures = await self.__nvingest_upload_doc(
+                        filepaths=fallback_filepaths,
+                        collection_name=collection_name,
+                        vdb_op=vdb_op,
+                        split_options=split_options,
+                        generate_summary=generate_summary,
+                        progress=progress,
+                        manifest=manifest,
+                    )
+                    failures = list(failures) + list(fallback_failures)
 
             logger.info(
                 "== Overall Ingestion completed successfully in %s seconds ==",
                 time.time() - start_time,
             )
 
+            # Chunk counts are recorded with the fingerprints, verification
+            # consumes them
+            written_chunk_counts = (
+                vdb_op.get_written_chunk_counts(filepaths)
+                if fingerprint_index is not None
+                and hasattr(vdb_op, "get_written_chunk_counts")
+                else {}
+            )
+
             # Get failed documents
+            verification_start_time = time.time()
             failed_documents = await self.__get_failed_documents(
-                failures, filepaths, collection_name
+                failures, filepaths, collection_name, vdb_op, manifest=manifest
             )
-            failures_filepaths = [
+            verification_time = time.time() - verification_start_time
+            progress.record_stage("verification", verification_time)
+            record_stage_duration("verification", verification_time)
+            failures_filepaths = {
                 failed_document.get("document_name")
                 for failed_document in failed_documents
-            ]
+            }
+            if journal is not None and failed_documents:
+                await asyncio.to_thread(
+                    journal.mark_failed,
+                    collection_name,
+                    {
+                        failed_document.get("document_name"): failed_document.get(
+                            "error_message"
+                        )
+                        for failed_document in failed_documents
+                    },
+                )
+            if fingerprint_index is not None:
+                custom_metadata_names = {item.get("filename") for item in custom_metadata}
+                await asyncio.to_thread(
+                    fingerprint_index.record,
+                    collection_name,
+                    [
+                        (
+                            file,
+                            content_hashes[file],
+                            os.path.basename(file) in custom_metadata_names,
+                            written_chunk_counts.get(file, 0),
+                        )
+                        for file in filepaths
+                        if file in content_hashes
+                        and os.path.basename(file) not in failures_filepaths
+                    ],
+                    settings_key,
+                )
+            filepaths = filepaths + resumed_filepaths
+            if journal is not None:
+                # Ingested files are final, only failed ones stay journaled
+                await asyncio.to_thread(
+                    journal.forget,
+                    collection_name,
+                    [
+                        os.path.basename(file)
+                        for file in filepaths
+                        if os.path.basename(file) not in failures_filepaths
+                    ],
+                )
 
             filename_to_metadata_map = {
                 custom_metadata_item.get("filename"): custom_metadata_item.get(
@@ -486,18 +935,18 @@ class NvidiaRAGIngestor:
                 {
                     # Generate a document_id from filename
                     "document_id": str(uuid4()),
-                    "document_name": os.path.basename(filepath),
-                    "size_bytes": os.path.getsize(filepath),
+                    "document_name": file_entry.document_name,
+                    "size_bytes": file_entry.size_bytes,
                     "metadata": {
-                        **filename_to_metadata_map.get(os.path.basename(filepath), {}),
+                        **filename_to_metadata_map.get(file_entry.document_name, {}),
                         "filename": filename_to_metadata_map.get(
-                            os.path.basename(filepath), {}
+                            file_entry.document_name, {}
                         ).get("filename")
-                        or os.path.basename(filepath),
+                        or file_entry.document_name,
                     },
                 }
-                for filepath in filepaths
-                if os.path.basename(filepath) not in failures_filepaths
+                for file_entry in map(manifest.get, filepaths)
+                if file_entry.document_name not in failures_filepaths
             ]
 
             # Get current timestamp in ISO format
@@ -524,34 +973,75 @@ class NvidiaRAGIngestor:
                     except Exception as e:
                         logger.error(f"Error deleting {file}: {e}")
 
+            progress.finish("FINISHED")
             return response_data
 
         except Exception as e:
+            progress.finish("FAILED")
             logger.exception(
                 "Ingestion failed due to error: %s",
                 e,
                 exc_info=logger.getEffectiveLevel() <= logging.DEBUG,
             )
             raise e
+        finally:
+            if journal_owner is not None:
+                # Unfinished files of this upload may now be resumed by another
+                await asyncio.to_thread(journal.release_owner, journal_owner)
 
-    async def __ingest_document_summary(
-        self, results: list[list[dict[str, str | dict]]], collection_name: str
-    ) -> None:
+    async def __ingest_document_summary(self, documents: list[Document]) -> None:
         """
         Generates and ingests document summaries for a list of files.
 
         Args:
-            filepaths (List[str]): List of paths to documents to generate summaries for
+            documents (List[Document]): Full-text documents prepared from the nv-ingest results
         """
 
         logger.info("Document summary ingestion started")
         start_time = time.time()
-        # Prepare summary documents
-        documents = await self.__prepare_summary_documents(results, collection_name)
+        pending_uploads = []
+
+        async def store_summary(document: Document) -> None:
+            # Each summary is written to minio as soon as it is generated
+            pending_uploads.append(
+                await self.__put_document_summary_to_minio([document])
+            )
+
         # Generate summary for each document
-        documents = await self.__generate_summary_for_documents(documents)
-        # # Add document summary to minio
-        await self.__put_document_summary_to_minio(documents)
+        summarized_documents = await self.__generate_summary_for_documents(
+            documents, on_summary=store_summary
+        )
+        upload_results = await asyncio.gather(*pending_uploads, return_exceptions=True)
+        stored = sum(
+            result for result in upload_results if not isinstance(result, BaseException)
+        )
+        record_stage_duration("summarization", time.time() - start_time)
+        # Summaries are counted by the job queue, once its retries are settled
+        if len(summarized_documents) < len(documents):
+            raise RuntimeError(
+                f"Summary generation failed for {
+                    len(documents) - len(summarized_documents)
+                } document(s)"
+            )
+        if stored < len(summarized_documents):
+            raise RuntimeError(
+                f"Failed to store {len(summarized_documents) - stored} summary(ies) to minio"
+            )
+        documents = summarized_documents
+        journal = get_ingestion_journal()
+        if journal is not None:
+            summarized_names = defaultdict(list)
+            for document in documents:
+                summarized_names[document.metadata["collection_name"]].append(
+                    document.metadata["filename"]
+                )
+            for summary_collection_name, names in summarized_names.items():
+                await asyncio.to_thread(
+                    journal.mark_stage,
+                    summary_collection_name,
+                    names,
+                    STAGE_SUMMARIZED,
+                )
         end_time = time.time()
         logger.info(
             f"Document summary ingestion completed! Time taken: {end_time - start_time} seconds"
@@ -566,8 +1056,17 @@ class NvidiaRAGIngestor:
         split_options: dict[str, Any] = None,
         custom_metadata: list[dict[str, Any]] = None,
         generate_summary: bool = False,
+        diff_update: bool = False,
     ) -> dict[str, Any]:
-        """Upload a document to the vector store. If the document already exists, it will be replaced."""
+        """Upload a document to the vector store. If the document already exists, it will be replaced.
+
+        With diff_update, existing documents are not deleted first. The new
+        extraction is compared chunk by chunk with what is stored: unchanged
+        chunks are kept, new chunks are added and removed chunks are deleted.
+        Only supported by vector store operators that provide
+        with_diff_update() (OpenSearch); others fall back to delete and
+        re-upload.
+        """
 
         # Set default values for mutable arguments
         if split_options is None:
@@ -578,20 +1077,45 @@ class NvidiaRAGIngestor:
         if custom_metadata is None:
             custom_metadata = []
 
+        if diff_update:
+            vdb_op, _ = self.__prepare_vdb_op_and_collection_name(
+                vdb_endpoint=vdb_endpoint,
+                collection_name=collection_name,
+                bypass_validation=True,
+            )
+            if hasattr(vdb_op, "with_diff_update"):
+                return await self.__submit_ingestion(
+                    filepaths=filepaths,
+                    blocking=blocking,
+                    collection_name=collection_name,
+                    vdb_endpoint=vdb_endpoint,
+                    split_options=split_options,
+                    custom_metadata=custom_metadata,
+                    generate_summary=generate_summary,
+                    diff_update=True,
+                )
+            logger.warning(
+                "Diff update is not supported by the %s vector store operator. "
+                "Falling back to delete and re-upload.",
+                type(vdb_op).__name__,
+            )
+
         for file in filepaths:
             file_name = os.path.basename(file)
 
             # Delete the existing document
 
+            # The document is replaced, so its cached summary stays referenced
             if self.mode == SERVER_MODE:
-                response = self.delete_documents(
+                response = self.__delete_documents(
                     [file_name],
                     collection_name=collection_name,
                     include_upload_path=True,
+                    keep_summary_cache=True,
                 )
             else:
-                response = self.delete_documents(
-                    [file], collection_name=collection_name
+                response = self.__delete_documents(
+                    [file], collection_name=collection_name, keep_summary_cache=True
                 )
 
             if response["total_documents"] == 0:
@@ -619,9 +1143,34 @@ class NvidiaRAGIngestor:
 
     @staticmethod
     async def status(task_id: str) -> dict[str, Any]:
-        """Get the status of an ingestion task."""
+        """Get the status of an ingestion task.
+
+        The response carries the latest recorded progress of the task (batches,
+        files and chunks done, throughput, stage times and ETA) under "progress"
+        and the state of its summary jobs under "summary". Progress is persisted,
+        so it is still reported after an ingestor restart, when the task handler
+        no longer knows the task.
+        """
 
         logger.info(f"Getting status of task {task_id}")
+        response = NvidiaRAGIngestor.__get_task_state(task_id)
+        summary_status = get_summary_job_queue().get_status(task_id)
+        if summary_status is not None:
+            response["summary"] = summary_status
+        store = get_task_progress_store()
+        progress = store.get(task_id) if store is not None else None
+        if progress is not None:
+            if response["state"] == "UNKNOWN" and progress["state"] == "RUNNING":
+                response["result"] = {
+                    "message": "Task was interrupted, e.g. by a restart of the "
+                    "ingestor. Resubmit the upload to resume it."
+                }
+            response["progress"] = progress
+        return response
+
+    @staticmethod
+    def __get_task_state(task_id: str) -> dict[str, Any]:
+        """Get the state and result of an ingestion task from the task handler."""
         try:
             if INGESTION_TASK_HANDLER.get_task_status(task_id) == "PENDING":
                 logger.info(f"Task {task_id} is pending")
@@ -805,28 +1354,40 @@ class NvidiaRAGIngestor:
             )
 
             response = vdb_op.delete_collections(collection_names)
-            # Delete citation metadata from Minio
+            journal = get_ingestion_journal()
+            fingerprint_index = get_fingerprint_index()
             for collection in collection_names:
-                collection_prefix = get_unique_thumbnail_id_collection_prefix(
-                    collection
-                )
-                delete_object_names = get_minio_operator_instance().list_payloads(
-                    collection_prefix
-                )
-                get_minio_operator_instance().delete_payloads(delete_object_names)
-
-            # Delete document summary from Minio
+                if journal is not None:
+                    journal.forget(collection)
+                if fingerprint_index is not None:
+                    fingerprint_index.forget(collection)
+            # Delete citation metadata and document summaries from Minio. All
+            # prefixes are listed concurrently and the objects deleted in batches.
+            prefixes = []
             for collection in collection_names:
-                collection_prefix = get_unique_thumbnail_id_collection_prefix(
-                    f"summary_{collection}"
-                )
-                delete_object_names = get_minio_operator_instance().list_payloads(
-                    collection_prefix
+                prefixes.append(get_unique_thumbnail_id_collection_prefix(collection))
+                prefixes.append(
+                    get_unique_thumbnail_id_collection_prefix(f"summary_{collection}")
                 )
-                if len(delete_object_names):
-                    get_minio_operator_instance().delete_payloads(delete_object_names)
-                    logger.info(
-                        f"Deleted all document summaries from Minio for collection: {collection}"
+            listings = list_prefixes(get_minio_operator_instance(), prefixes)
+            deleted = delete_objects(
+                get_minio_operator_instance(),
+                [
+                    object_name
+                    for object_names in listings.values()
+                    for object_name in object_names
+                ],
+            )
+            logger.info(
+                f"Deleted {deleted} citation and summary object(s) from Minio "
+                f"for collections: {collection_names}"
+            )
+            for collection in collection_names:
+                try:
+                    release_summary_cache(get_minio_operator_instance(), collection)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to release cached summaries of collection {collection}: {e}"
                     )
 
             return response
@@ -943,6 +1504,26 @@ class NvidiaRAGIngestor:
         Returns:
             Dict[str, Any]: Response containing a list of deleted documents with metadata.
         """
+        return self.__delete_documents(
+            document_names,
+            collection_name=collection_name,
+            vdb_endpoint=vdb_endpoint,
+            include_upload_path=include_upload_path,
+        )
+
+    def __delete_documents(
+        self,
+        document_names: list[str],
+        collection_name: str = None,
+        vdb_endpoint: str = CONFIG.vector_store.url,
+        include_upload_path: bool = False,
+        keep_summary_cache: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Delete documents from the vector index, MinIO and the ingestion stores.
+        With keep_summary_cache the documents keep their cached summaries, for
+        documents that are replaced right away.
+        """
         settings = get_config()
 
         try:
@@ -971,6 +1552,13 @@ class NvidiaRAGIngestor:
             ]
 
             if vdb_op.delete_documents(collection_name, source_values):
+                deleted_names = [os.path.basename(doc) for doc in document_names]
+                journal = get_ingestion_journal()
+                if journal is not None:
+                    journal.forget(collection_name, deleted_names)
+                fingerprint_index = get_fingerprint_index()
+                if fingerprint_index is not None:
+                    fingerprint_index.forget(collection_name, deleted_names)
                 # Generate response dictionary
                 documents = [
                     {
@@ -980,29 +1568,40 @@ class NvidiaRAGIngestor:
                     }
                     for doc in document_names
                 ]
-                # Delete citation metadata from Minio
-                for doc in document_names:
-                    filename_prefix = get_unique_thumbnail_id_file_name_prefix(
-                        collection_name, doc
-                    )
-                    delete_object_names = get_minio_operator_instance().list_payloads(
-                        filename_prefix
-                    )
-                    get_minio_operator_instance().delete_payloads(delete_object_names)
-
-                # Delete document summary from Minio
-                for doc in document_names:
-                    filename_prefix = get_unique_thumbnail_id_file_name_prefix(
-                        f"summary_{collection_name}", doc
-                    )
-                    delete_object_names = get_minio_operator_instance().list_payloads(
-                        filename_prefix
-                    )
-                    if len(delete_object_names):
-                        get_minio_operator_instance().delete_payloads(
-                            delete_object_names
+                # Delete citation metadata and document summaries from Minio
+                citation_object_names = [
+                    object_name
+                    for object_names in list_document_objects(
+                        get_minio_operator_instance(), collection_name, document_names
+                    ).values()
+                    for object_name in object_names
+                ]
+                summary_object_names = [
+                    object_name
+                    for object_names in list_document_objects(
+                        get_minio_operator_instance(),
+                        f"summary_{collection_name}",
+                        document_names,
+                    ).values()
+                    for object_name in object_names
+                ]
+                delete_objects(
+                    get_minio_operator_instance(),
+                    citation_object_names + summary_object_names,
+                )
+                logger.info(
+                    f"Deleted {len(citation_object_names)} citation and "
+                    f"{len(summary_object_names)} summary object(s) from Minio"
+                )
+                if not keep_summary_cache:
+                    try:
+                        release_summary_cache(
+                            get_minio_operator_instance(), collection_name, deleted_names
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            f"Failed to release cached summaries of {deleted_names}: {e}"
                         )
-                        logger.info(f"Deleted summary for doc: {doc} from Minio")
                 return {
                     "message": "Files deleted successfully",
                     "total_documents": len(documents),
@@ -1022,66 +1621,285 @@ class NvidiaRAGIngestor:
             "documents": [],
         }
 
-    def __put_content_to_minio(
+    def __get_citation_payloads(
         self,
-        results: list[list[dict[str, str | dict]]],
+        columns: ResultColumns,
         collection_name: str,
-    ) -> None:
+    ) -> tuple[list[dict[str, Any]], list[str]]:
         """
-        Put nv-ingest image/table/chart content to minio
+        Collect nv-ingest image/table/chart content to be stored in minio
         """
-        if not CONFIG.enable_citations:
-            logger.info(f"Skipping minio insertion for collection: {collection_name}")
-            return  # Don't perform minio insertion if captioning is disabled
-
         payloads = []
         object_names = []
 
-        for result in results:
-            for result_element in result:
-                if result_element.get("document_type") in ["image", "structured"]:
-                    # Pull content from result_element
-                    content = result_element.get("metadata").get("content")
-                    file_name = os.path.basename(
-                        result_element.get("metadata")
-                        .get("source_metadata")
-                        .get("source_id")
-                    )
-                    page_number = (
-                        result_element.get("metadata")
-                        .get("content_metadata")
-                        .get("page_number")
-                    )
-                    location = (
-                        result_element.get("metadata")
-                        .get("content_metadata")
-                        .get("location")
-                    )
+        for file_name, page_number, location, content in columns.iter_citations():
+            # Get unique_thumbnail_id
+            unique_thumbnail_id = get_unique_thumbnail_id(
+                collection_name=collection_name,
+                file_name=file_name,
+                page_number=page_number,
+                location=location,
+            )
 
-                    if location is not None:
-                        # Get unique_thumbnail_id
-                        unique_thumbnail_id = get_unique_thumbnail_id(
-                            collection_name=collection_name,
-                            file_name=file_name,
-                            page_number=page_number,
-                            location=location,
-                        )
+            payloads.append({"content": content})
+            object_names.append(unique_thumbnail_id)
 
-                        payloads.append({"content": content})
-                        object_names.append(unique_thumbnail_id)
+        return payloads, object_names
 
+    @staticmethod
+    def _upload_payloads_to_minio(
+        payloads: list[dict[str, Any]], object_names: list[str]
+    ) -> None:
+        """Blocking upload of payloads to minio, used by the upload stage workers"""
         if os.getenv("ENABLE_MINIO_BULK_UPLOAD", "True") in ["True", "true"]:
-            logger.info(f"Bulk uploading {len(payloads)} payloads to MinIO")
+            logger.debug(f"Bulk uploading {len(payloads)} payloads to MinIO")
             get_minio_operator_instance().put_payloads_bulk(
                 payloads=payloads, object_names=object_names
             )
         else:
-            logger.info(f"Sequentially uploading {len(payloads)} payloads to MinIO")
+            logger.debug(f"Sequentially uploading {len(payloads)} payloads to MinIO")
             for payload, object_name in zip(payloads, object_names, strict=False):
                 get_minio_operator_instance().put_payload(
                     payload=payload, object_name=object_name
                 )
 
+    @staticmethod
+    def _copy_payload_in_minio(source_object_name: str, object_name: str) -> None:
+        """Blocking server-side copy of a stored payload, used by the upload stage workers"""
+        copy_payload(get_minio_operator_instance(), source_object_name, object_name)
+
+    async def __alias_documents(
+        self,
+        aliases: dict[str, tuple[str, str, int | None]],
+        extracted_filepaths: list[str],
+        ingested_sources: dict[str, int],
+        collection_name: str,
+        vdb_op: VDBRag,
+        generate_summary: bool = False,
+        summary_task_id: str = None,
+    ) -> list[str]:
+        """
+        Add byte-identical files by copying the chunks, citations and summary of
+        the identical document instead of extracting them.
+
+        A document is only copied once all of its recorded chunks are
+        searchable. Aliases whose source has no summary get one generated from
+        the copied chunks.
+
+        Returns the files that could not be aliased and still need extraction.
+        """
+        if not hasattr(vdb_op, "copy_document_chunks"):
+            return list(aliases)
+
+        extracted = set(extracted_filepaths)
+        ingested_names = {os.path.basename(source) for source in ingested_sources}
+        journal = get_ingestion_journal()
+        aliased_names = []
+        fallback_filepaths = []
+        summary_documents = []
+        for filepath, (source_collection, source_value, expected_count) in (
+            aliases.items()
+        ):
+            if source_value in extracted:
+                if os.path.basename(source_value) not in ingested_names:
+                    # The identical file of this upload failed extraction
+                    fallback_filepaths.append(filepath)
+                    continue
+                # Chunks the identical file of this upload stored
+                expected_count = vdb_op.get_written_chunk_counts([source_value]).get(
+                    source_value
+                )
+            copied_documents = await asyncio.to_thread(
+                vdb_op.copy_document_chunks,
+                source_collection,
+                source_value,
+                filepath,
+                expected_count,
+            )
+            if not copied_documents:
+                fallback_filepaths.append(filepath)
+                continue
+            if CONFIG.enable_citations:
+                try:
+                    await asyncio.to_thread(
+                        self.__copy_citations,
+                        source_collection,
+                        source_value,
+                        collection_name,
+                        filepath,
+                        [document["metadata"] for document in copied_documents],
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Failed to copy citations of %s to %s: %s",
+                        source_value,
+                        filepath,
+                        e,
+                        exc_info=logger.getEffectiveLevel() <= logging.DEBUG,
+                    )
+            if generate_summary:
+                summary_copied = await asyncio.to_thread(
+                    self.__copy_summary,
+                    source_collection,
+                    source_value,
+                    collection_name,
+                    filepath,
+                )
+                if not summary_copied:
+                    summary_documents.append(
+                        self.__get_alias_summary_document(
+                            copied_documents, collection_name, filepath
+                        )
+                    )
+            aliased_names.append(os.path.basename(filepath))
+
+        if journal is not None:
+            await asyncio.to_thread(
+                journal.mark_stage, collection_name, aliased_names, STAGE_CITATIONS
+            )
+        if summary_documents:
+            await get_summary_job_queue().submit(
+                summary_documents,
+                self.__ingest_document_summary,
+                task_id=summary_task_id,
+            )
+        logger.info(
+            "Aliased %d of %d byte-identical file(s) without extraction",
+            len(aliases) - len(fallback_filepaths),
+            len(aliases),
+        )
+        return fallback_filepaths
+
+    def __copy_citations(
+        self,
+        source_collection: str,
+        source_value: str,
+        collection_name: str,
+        filepath: str,
+        chunk_metadatas: list[dict[str, Any]],
+    ) -> None:
+        """
+        Copy minio citation content of a document to an alias
+        """
+        minio_operator = get_minio_operator_instance()
+
+        def _get_payload(object_name: str) -> dict[str, Any] | None:
+            try:
+                return minio_operator.get_payload(object_name)
+            except Exception as e:
+                logger.debug(f"No payload {object_name} to copy: {e}")
+                return None
+
+        payloads = []
+        object_names = []
+        for metadata in chunk_metadatas:
+            content_metadata = metadata.get("content_metadata") or {}
+            location = content_metadata.get("location")
+            if content_metadata.get("type") not in ["image", "structured"] or (
+                location is None
+            ):
+                continue
+            payload = _get_payload(
+                get_unique_thumbnail_id(
+                    collection_name=source_collection,
+                    file_name=os.path.basename(source_value),
+                    page_number=content_metadata.get("page_number"),
+                    location=location,
+                )
+            )
+            if payload:
+                payloads.append(payload)
+                object_names.append(
+                    get_unique_thumbnail_id(
+                        collection_name=collection_name,
+                        file_name=os.path.basename(filepath),
+                        page_number=content_metadata.get("page_number"),
+                        location=location,
+                    )
+                )
+
+        if payloads:
+            self._upload_payloads_to_minio(payloads, object_names)
+
+    def __copy_summary(
+        self,
+        source_collection: str,
+        source_value: str,
+        collection_name: str,
+        filepath: str,
+    ) -> bool:
+        """
+        Copy the minio summary of a document to an alias. Returns False if the
+        document has no summary to copy.
+        """
+        minio_operator = get_minio_operator_instance()
+        try:
+            summary = minio_operator.get_payload(
+                get_unique_thumbnail_id(
+                    collection_name=f"summary_{source_collection}",
+                    file_name=os.path.basename(source_value),
+                    page_number=0,
+                    location=[],
+                )
+            )
+        except Exception as e:
+            logger.debug(f"No summary of {source_value} to copy: {e}")
+            return False
+        if not summary:
+            return False
+        if summary.get("summary_cache_key"):
+            try:
+                add_summary_reference(
+                    minio_operator,
+                    summary["summary_cache_key"],
+                    collection_name,
+                    os.path.basename(filepath),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to reference cached summary of {filepath}: {e}")
+        self._upload_payloads_to_minio(
+            [
+                {
+                    **summary,
+                    "file_name": os.path.basename(filepath),
+                    "collection_name": collection_name,
+                }
+            ],
+            [
+                get_unique_thumbnail_id(
+                    collection_name=f"summary_{collection_name}",
+                    file_name=os.path.basename(filepath),
+                    page_number=0,
+                    location=[],
+                )
+            ],
+        )
+        return True
+
+    @staticmethod
+    def __get_alias_summary_document(
+        copied_documents: list[dict[str, Any]], collection_name: str, filepath: str
+    ) -> Document:
+        """Full-text document of an alias for summarization, from its copied chunks"""
+        ordered_documents = sorted(
+            copied_documents,
+            key=lambda document: (
+                (document["metadata"].get("content_metadata") or {}).get(
+                    "page_number"
+                )
+                or 0
+            ),
+        )
+        return Document(
+            page_content=" ".join(
+                document["text"] for document in ordered_documents if document["text"]
+            ),
+            metadata={
+                "filename": os.path.basename(filepath),
+                "collection_name": collection_name,
+            },
+        )
+
     async def __nvingest_upload_doc(
         self,
         filepaths: list[str],
@@ -1089,17 +1907,31 @@ class NvidiaRAGIngestor:
         vdb_op: VDBRag = None,
         split_options: dict[str, Any] = None,
         generate_summary: bool = False,
-    ) -> tuple[list[list[dict[str, str | dict]]], list[dict[str, Any]]]:
+        progress: IngestionProgress = None,
+        manifest: FileManifest = None,
+    ) -> tuple[dict[str, int], list[dict[str, Any]]]:
         """
         Wrapper function to ingest documents in chunks using NV-ingest
 
+        Batches are pulled from a shared iterator by a fixed pool of workers.
+        Each batch's nv-ingest results are handed to the vector DB, MinIO and
+        summary consumers and then released, so only per-file outcomes are kept
+        and memory does not grow with the size of the upload.
+
         Arguments:
             - filepaths: List[str] - List of absolute filepaths
             - collection_name: str - Name of the collection in the vector database
-            - vdb_endpoint: str - URL of the vector database endpoint
+            - vdb_op: VDBRag - Vector database operator used for the ingestion
             - split_options: SplitOptions - Options for splitting documents
-            - custom_metadata: List[CustomMetadata] - Custom metadata to be added to documents
+            - progress: IngestionProgress - Progress updated as batches complete
+            - manifest: FileManifest - Stat results of the files, built if not given
+
+        Returns:
+            - Dict[str, int] - Number of extracted elements per ingested source
+            - List[Dict[str, Any]] - Failures reported by nv-ingest
         """
+        if manifest is None:
+            manifest = await asyncio.to_thread(FileManifest.build, filepaths)
         if not ENABLE_NV_INGEST_BATCH_MODE:
             # Single batch mode
             logger.info(
@@ -1107,15 +1939,8 @@ class NvidiaRAGIngestor:
                 collection_name,
                 len(filepaths),
             )
-            results, failures = await self.__nv_ingest_ingestion(
-                filepaths=filepaths,
-                collection_name=collection_name,
-                vdb_op=vdb_op,
-                split_options=split_options,
-                generate_summary=generate_summary,
-            )
-            return results, failures
-
+            batches = [filepaths]
+            concurrency = 1
         else:
             # BATCH_MODE
             logger.info(
@@ -1124,98 +1949,142 @@ class NvidiaRAGIngestor:
                 } "
                 f"with {len(filepaths)} files =="
             )
-
-            # Process batches sequentially
-            if not ENABLE_NV_INGEST_PARALLEL_BATCH_MODE:
+            if ENABLE_NV_INGEST_DYNAMIC_BATCHING:
+                # Split up batches of large files so no single batch keeps one
+                # worker busy long after the others ran dry
+                file_costs = await asyncio.to_thread(
+                    estimate_file_costs,
+                    filepaths,
+                    manifest.sizes(filepaths),
+                    manifest.page_counts(filepaths),
+                )
+                batches = pack_batches(
+                    file_costs, max_files_per_batch=NV_INGEST_FILES_PER_BATCH
+                )
+            else:
+                batches = [
+                    filepaths[i : i + NV_INGEST_FILES_PER_BATCH]
+                    for i in range(0, len(filepaths), NV_INGEST_FILES_PER_BATCH)
+                ]
+            if ENABLE_NV_INGEST_PARALLEL_BATCH_MODE:
+                concurrency = NV_INGEST_CONCURRENT_BATCHES
+                logger.info(
+                    f"Processing batches in parallel with concurrency: {concurrency}"
+                )
+            else:
+                concurrency = 1
                 logger.info("Processing batches sequentially")
-                all_results = []
-                all_failures = []
-                for i in range(0, len(filepaths), NV_INGEST_FILES_PER_BATCH):
-                    sub_filepaths = filepaths[i : i + NV_INGEST_FILES_PER_BATCH]
-                    batch_num = i // NV_INGEST_FILES_PER_BATCH + 1
-                    logger.info(
-                        f"=== Batch Processing Status - Collection: {collection_name} - "
-                        f"Processing batch {batch_num} of {len(filepaths) // NV_INGEST_FILES_PER_BATCH + 1} - "
-                        f"Documents in current batch: {len(sub_filepaths)} ==="
-                    )
-                    results, failures = await self.__nv_ingest_ingestion(
-                        filepaths=sub_filepaths,
-                        collection_name=collection_name,
-                        vdb_op=vdb_op,
-                        batch_number=batch_num,
-                        split_options=split_options,
-                        generate_summary=generate_summary,
-                    )
-                    all_results.extend(results)
-                    all_failures.extend(failures)
-
-                if (
-                    hasattr(vdb_op, "csv_file_path")
-                    and vdb_op.csv_file_path is not None
-                ):
-                    os.remove(vdb_op.csv_file_path)
-                    logger.debug(
-                        f"Deleted temporary custom metadata csv file: {vdb_op.csv_file_path} "
-                        f"for collection: {collection_name}"
-                    )
 
-                return all_results, all_failures
+        if progress is None:
+            progress = IngestionProgress(collection_name)
+        progress.add_plan(len(filepaths), len(batches), manifest.total_size(filepaths))
+
+        ingested_sources = {}
+        all_failures = []
+        pending_batches = iter(enumerate(batches, start=1))
+
+        # Citation content is uploaded by its own worker pool while the next
+        # batches are extracted
+        citation_uploader = None
+        if CONFIG.enable_citations:
+            upload_fn = self._upload_payloads_to_minio
+            if ENABLE_MINIO_CITATION_DEDUP:
+                # Images and tables repeated across the upload are sent once
+                upload_fn = CitationDeduplicator(
+                    upload_fn, self._copy_payload_in_minio
+                ).upload
+            citation_uploader = MinioUploadStage(upload_fn, name="Citation")
+        else:
+            logger.info(f"Skipping minio insertion for collection: {collection_name}")
 
-            else:
-                # Process batches in parallel with worker pool of 4
+        async def batch_worker():
+            # Workers share one iterator, so at most `concurrency` batches
+            # (and their nv-ingest results) are alive at any time
+            for batch_num, sub_filepaths in pending_batches:
                 logger.info(
-                    f"Processing batches in parallel with concurrency: {
-                        NV_INGEST_CONCURRENT_BATCHES
-                    }"
+                    f"=== Processing Batch - Collection: {collection_name} - "
+                    f"Batch {batch_num} of {len(batches)} - "
+                    f"Documents in batch: {len(sub_filepaths)} ==="
                 )
-                all_results = []
-                all_failures = []
-                tasks = []
-                semaphore = asyncio.Semaphore(
-                    NV_INGEST_CONCURRENT_BATCHES
-                )  # Limit concurrent tasks
-
-                async def process_batch(sub_filepaths, batch_num):
-                    async with semaphore:
-                        logger.info(
-                            f"=== Processing Batch - Collection: {collection_name} - "
-                            f"Batch {batch_num} of {len(filepaths) // NV_INGEST_FILES_PER_BATCH + 1} - "
-                            f"Documents in batch: {len(sub_filepaths)} ==="
-                        )
-                        return await self.__nv_ingest_ingestion(
+                batch_start_time = time.time()
+                batch_size_bytes = manifest.total_size(sub_filepaths)
+                add_in_flight_batches(1)
+                try:
+                    with tracer.start_as_current_span(
+                        "ingestion_batch",
+                        attributes={
+                            "rag.batch_number": batch_num,
+                            "rag.file_count": len(sub_filepaths),
+                            "rag.total_bytes": batch_size_bytes,
+                        },
+                    ) as span:
+                        batch_sources, failures = await self.__nv_ingest_ingestion(
                             filepaths=sub_filepaths,
                             collection_name=collection_name,
                             vdb_op=vdb_op,
                             batch_number=batch_num,
                             split_options=split_options,
                             generate_summary=generate_summary,
+                            citation_uploader=citation_uploader,
+                            summary_task_id=progress.task_id,
+                            manifest=manifest,
                         )
+                        span.set_attribute("rag.files_indexed", len(batch_sources))
+                        span.set_attribute("rag.files_failed", len(failures))
+                        span.set_attribute(
+                            "rag.chunk_count", sum(batch_sources.values())
+                        )
+                finally:
+                    add_in_flight_batches(-1)
+                ingested_sources.update(batch_sources)
+                all_failures.extend(failures)
+                progress.record_stage("extraction", time.time() - batch_start_time)
+                progress.batch_done(
+                    files_indexed=len(batch_sources),
+                    files_failed=len(failures),
+                    chunks=sum(batch_sources.values()),
+                    size_bytes=batch_size_bytes,
+                )
+                record_files(
+                    indexed=len(batch_sources),
+                    failed=len(failures),
+                    size_bytes=batch_size_bytes,
+                    chunks=sum(batch_sources.values()),
+                )
 
-                for i in range(0, len(filepaths), NV_INGEST_FILES_PER_BATCH):
-                    sub_filepaths = filepaths[i : i + NV_INGEST_FILES_PER_BATCH]
-                    batch_num = i // NV_INGEST_FILES_PER_BATCH + 1
-                    task = process_batch(sub_filepaths, batch_num)
-                    tasks.append(task)
-
-                # Wait for all tasks to complete
-                batch_results = await asyncio.gather(*tasks)
-
-                # Combine results from all batches
-                for results, failures in batch_results:
-                    all_results.extend(results)
-                    all_failures.extend(failures)
-
-                if (
-                    hasattr(vdb_op, "csv_file_path")
-                    and vdb_op.csv_file_path is not None
-                ):
-                    os.remove(vdb_op.csv_file_path)
-                    logger.debug(
-                        f"Deleted temporary custom metadata csv file: {vdb_op.csv_file_path} "
-                        f"for collection: {collection_name}"
+        workers = [
+            asyncio.create_task(batch_worker())
+            for _ in range(min(concurrency, len(batches)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # A failed batch leaves its sibling workers running; stop them
+            # before closing the citation uploader they submit to
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if citation_uploader is not None:
+                drain_start_time = time.time()
+                failed_uploads = await citation_uploader.close()
+                drain_time = time.time() - drain_start_time
+                progress.record_stage("citation_upload", drain_time)
+                record_stage_duration("citation_upload", drain_time)
+                if failed_uploads:
+                    logger.error(
+                        "%d citation object(s) could not be stored, citations would be "
+                        "incomplete for collection: %s",
+                        failed_uploads,
+                        collection_name,
                     )
+            if hasattr(vdb_op, "csv_file_path") and vdb_op.csv_file_path is not None:
+                os.remove(vdb_op.csv_file_path)
+                logger.debug(
+                    f"Deleted temporary custom metadata csv file: {vdb_op.csv_file_path} "
+                    f"for collection: {collection_name}"
+                )
 
-                return all_results, all_failures
+        return ingested_sources, all_failures
 
     async def __nv_ingest_ingestion(
         self,
@@ -1225,13 +2094,19 @@ class NvidiaRAGIngestor:
         batch_number: int = 0,
         split_options: dict[str, Any] = None,
         generate_summary: bool = False,
-    ) -> tuple[list[list[dict[str, str | dict]]], list[dict[str, Any]]]:
+        citation_uploader: MinioUploadStage = None,
+        summary_task_id: str = None,
+        manifest: FileManifest = None,
+    ) -> tuple[dict[str, int], list[dict[str, Any]]]:
         """
         This methods performs following steps:
         - Perform extraction and splitting using NV-ingest ingestor
         - Prepare langchain documents from the nv-ingest results
         - Embeds and add documents to Vectorstore collection
 
+        Returns the number of extracted elements per source and the failures;
+        the nv-ingest results are decoded into ResultColumns and released.
+
         Arguments:
             - filepaths: List[str] - List of absolute filepaths
             - collection_name: str - Name of the collection in the vector database
@@ -1239,21 +2114,25 @@ class NvidiaRAGIngestor:
             - batch_number: int - Batch number for the ingestion process
             - split_options: SplitOptions - Options for splitting documents
             - custom_metadata: List[CustomMetadata] - Custom metadata to be added to documents
+            - manifest: FileManifest - Stat results of the files, built if not given
         """
         if split_options is None:
             split_options = {
                 "chunk_size": CONFIG.nv_ingest.chunk_size,
                 "chunk_overlap": CONFIG.nv_ingest.chunk_overlap,
             }
+        if manifest is None:
+            manifest = await asyncio.to_thread(FileManifest.build, filepaths)
 
-        filtered_filepaths = await self.__remove_unsupported_files(filepaths)
+        filtered_filepaths = await self.__remove_unsupported_files(filepaths, manifest)
         if CONFIG.nv_ingest.pdf_extract_method not in ["None", "none"]:
-            filtered_filepaths = await self.__remove_non_pdf_files(filtered_filepaths)
+            filtered_filepaths = await self.__remove_non_pdf_files(
+                filtered_filepaths, manifest
+            )
 
         if len(filtered_filepaths) == 0:
             logger.error("No files to ingest after filtering.")
-            results, failures = [], []
-            return results, failures
+            return {}, []
 
         nv_ingest_ingestor = get_nv_ingest_ingestor(
             nv_ingest_client_instance=NV_INGEST_CLIENT_INSTANCE,
@@ -1267,91 +2146,119 @@ class NvidiaRAGIngestor:
                 split_options
             }"
         )
-        results, failures = await asyncio.to_thread(
-            lambda: nv_ingest_ingestor.ingest(
-                return_failures=True,
-                show_progress=logger.getEffectiveLevel() <= logging.DEBUG,
+        with tracer.start_as_current_span(
+            "nv_ingest.ingest",
+            attributes={
+                "rag.batch_number": batch_number,
+                "rag.file_count": len(filtered_filepaths),
+            },
+        ) as span:
+            # asyncio.to_thread runs the call in a copy of the current context,
+            # so spans of the vector DB writes are children of this span
+            results, failures = await asyncio.to_thread(
+                lambda: nv_ingest_ingestor.ingest(
+                    return_failures=True,
+                    show_progress=logger.getEffectiveLevel() <= logging.DEBUG,
+                )
             )
-        )
-        total_ingestion_time = time.time() - start_time
-        self._log_result_info(batch_number, results, failures, total_ingestion_time)
+            total_ingestion_time = time.time() - start_time
+            record_stage_duration("extraction", total_ingestion_time)
+            # Decoded once into columns, the result dicts are released right away
+            columns = ResultColumns.decode(
+                results, keep_citations=citation_uploader is not None
+            )
+            del results
+            span.set_attribute("rag.element_count", len(columns))
+            span.set_attribute("rag.failure_count", len(failures))
+        self._log_result_info(batch_number, columns, failures, total_ingestion_time)
 
         if generate_summary:
             logger.info(
-                f"Document summary generation starting in background for batch {
-                    batch_number
-                }.."
+                f"Queueing document summary generation for batch {batch_number}.."
+            )
+            # Only the extracted text is kept for the summary, not the full results
+            summary_documents = await self.__prepare_summary_documents(
+                columns, collection_name
             )
-            asyncio.create_task(
-                self.__ingest_document_summary(results, collection_name=collection_name)
+            # Waits while the summary queue is full, so a large upload can't
+            # flood the summarizer
+            await get_summary_job_queue().submit(
+                summary_documents,
+                self.__ingest_document_summary,
+                task_id=summary_task_id,
             )
 
-        if not results:
+        if not columns.sources:
             error_message = "NV-Ingest ingestion failed with no results."
             logger.error(error_message)
             if len(failures) > 0:
-                return results, failures
+                return {}, failures
             raise Exception(error_message)
 
-        try:
-            start_time = time.time()
-            self.__put_content_to_minio(
-                results=results, collection_name=collection_name
-            )
-            end_time = time.time()
-            logger.info(
-                f"== MinIO upload for collection_name: {collection_name} "
-                f"for batch {batch_number} is complete! Time taken: {
-                    end_time - start_time
-                } seconds =="
-            )
-        except Exception as e:
-            logger.error(
-                "Failed to put content to minio: %s, citations would be disabled for collection: %s",
-                str(e),
-                collection_name,
-                exc_info=logger.getEffectiveLevel() <= logging.DEBUG,
+        batch_sources = columns.source_counts()
+        journal = get_ingestion_journal()
+        batch_document_names = [os.path.basename(source) for source in batch_sources]
+        if journal is not None:
+            await asyncio.to_thread(
+                journal.mark_stage, collection_name, batch_document_names, STAGE_INDEXED
             )
 
-        return results, failures
+        if citation_uploader is not None:
+            try:
+                payloads, object_names = self.__get_citation_payloads(
+                    columns=columns, collection_name=collection_name
+                )
+                # Uploads complete in the background, overlapped with the next batch
+                citations_stored = await citation_uploader.submit(
+                    f"collection_name: {collection_name} batch {batch_number}",
+                    payloads,
+                    object_names,
+                )
+                if journal is not None:
+                    expected_uploads = len(payloads)
+                    loop = asyncio.get_running_loop()
+
+                    def _mark_citations_stored(future: asyncio.Future) -> None:
+                        # Files of the batch are complete once every object is stored
+                        if (
+                            not future.cancelled()
+                            and future.exception() is None
+                            and future.result() == expected_uploads
+                        ):
+                            loop.run_in_executor(
+                                None,
+                                journal.mark_stage,
+                                collection_name,
+                                batch_document_names,
+                                STAGE_CITATIONS,
+                            )
+
+                    citations_stored.add_done_callback(_mark_citations_stored)
+            except Exception as e:
+                logger.error(
+                    "Failed to put content to minio: %s, citations would be disabled for collection: %s",
+                    str(e),
+                    collection_name,
+                    exc_info=logger.getEffectiveLevel() <= logging.DEBUG,
+                )
+
+        return batch_sources, failures
 
     def _log_result_info(
         self,
         batch_number: int,
-        results: list[list[dict[str, str | dict]]],
+        columns: ResultColumns,
         failures: list[dict[str, Any]],
         total_ingestion_time: float,
     ):
         """
         Log the results info with document type counts
         """
-        from collections import defaultdict
-
         # Count document types
-        doc_type_counts = defaultdict(int)
-        total_documents = 0
-        total_elements = 0
-        raw_text_elements_size = 0  # in bytes
-
-        for result in results:
-            total_documents += 1
-            for result_element in result:
-                total_elements += 1
-                document_type = result_element.get("document_type", "unknown")
-                document_subtype = (
-                    result_element.get("metadata", {})
-                    .get("content_metadata", {})
-                    .get("subtype", "")
-                )
-                if document_subtype:
-                    document_type_subtype = f"{document_type}({document_subtype})"
-                else:
-                    document_type_subtype = document_type
-                doc_type_counts[document_type_subtype] += 1
-                if document_type == "text":
-                    raw_text_elements_size += len(
-                        result_element.get("metadata", {}).get("content", "")
-                    )
+        doc_type_counts = columns.type_counts()
+        total_documents = len(columns.sources)
+        total_elements = len(columns)
+        raw_text_elements_size = columns.text_size("text")  # in bytes
 
         # Create summary string
         summary_parts = []
@@ -1380,6 +2287,8 @@ class NvidiaRAGIngestor:
         failures: list[dict[str, Any]],
         filepaths: list[str],
         collection_name: str,
+        vdb_op: VDBRag = None,
+        manifest: FileManifest = None,
     ) -> list[dict[str, Any]]:
         """
         Get failed documents
@@ -1387,11 +2296,15 @@ class NvidiaRAGIngestor:
         Arguments:
             - failures: List[Dict[str, Any]] - List of failures
             - filepaths: List[str] - List of filepaths
-            - results: List[List[Dict[str, Union[str, dict]]]] - List of results
+            - collection_name: str - Name of the collection in the vector database
+            - vdb_op: VDBRag - Vector database operator used for the ingestion
+            - manifest: FileManifest - Stat results of the files, built if not given
 
         Returns:
             - List[Dict[str, Any]] - List of failed documents
         """
+        if manifest is None:
+            manifest = await asyncio.to_thread(FileManifest.build, filepaths)
         failed_documents = []
         failed_documents_filenames = set()
         for failure in failures:
@@ -1403,8 +2316,8 @@ class NvidiaRAGIngestor:
             failed_documents_filenames.add(failed_filename)
 
         # Add non-supported files to failed documents
-        for filepath in await self.__get_non_supported_files(filepaths):
-            filename = os.path.basename(filepath)
+        for filepath in await self.__get_non_supported_files(filepaths, manifest):
+            filename = manifest.get(filepath).document_name
             if filename not in failed_documents_filenames:
                 failed_documents.append(
                     {
@@ -1417,10 +2330,10 @@ class NvidiaRAGIngestor:
 
         # Add non-pdf files to failed documents if pdf extract method is not None
         if CONFIG.nv_ingest.pdf_extract_method not in ["None", "none"]:
-            for filepath in filepaths:
+            for file_entry in map(manifest.get, filepaths):
                 # Check if the file is a pdf
-                if os.path.splitext(filepath)[1].lower() != ".pdf":
-                    filename = os.path.basename(filepath)
+                if file_entry.extension != ".pdf":
+                    filename = file_entry.document_name
                     if filename not in failed_documents_filenames:
                         failed_documents.append(
                             {
@@ -1432,90 +2345,120 @@ class NvidiaRAGIngestor:
                         )
                         failed_documents_filenames.add(filename)
 
-        # Add document to failed documents if it is not in the vector DB
-        # For OpenSearch/OpenSearch Serverless, add retry logic to handle eventual consistency
-        vector_store_name = CONFIG.vector_store.name
-        is_opensearch = vector_store_name in ["opensearch", "elasticsearch"]
-        
-        # Smart retry settings based on vector store type
-        # Defaults optimized per service, with optional override for advanced users
-        if is_opensearch:
-            # Check if OpenSearch Serverless (slower) vs OpenSearch Service (faster)
-            is_aoss = os.getenv("APP_VECTORSTORE_AWS_SERVICE", "").lower() == "aoss"
-            
-            if is_aoss:
-                # OpenSearch Serverless defaults (eventual consistency ~10-60s)
-                max_validation_retries = 10
-                validation_retry_delay = 10
-                validation_initial_delay = 5
-            else:
-                # OpenSearch Service defaults (near-immediate consistency with refresh)
-                max_validation_retries = 5
-                validation_retry_delay = 3
-                validation_initial_delay = 0
-        else:
-            # Milvus/other vector stores (immediate consistency)
-            max_validation_retries = 1
-            validation_retry_delay = 0
-            validation_initial_delay = 0
-        
-        # Advanced override (optional - for power users only)
-        max_validation_retries = int(os.getenv("VALIDATION_MAX_RETRIES", str(max_validation_retries)))
-        
-        # Give indexing a head start before first validation check
-        if is_opensearch and validation_initial_delay > 0:
-            logger.info(
-                f"Waiting {validation_initial_delay}s before validation to allow indexing to begin (OpenSearch eventual consistency)"
-            )
-            time.sleep(validation_initial_delay)
-        
-        filenames_in_vdb = set()
-        
-        for attempt in range(max_validation_retries):
-            # Query vector DB for documents
-            filenames_in_vdb = set()
-            for document in self.get_documents(collection_name, bypass_validation=True).get(
-                "documents"
-            ):
-                filenames_in_vdb.add(document.get("document_name"))
-            
-            # Check how many expected documents are missing
-            missing_filenames = [
-                os.path.basename(fp) for fp in filepaths 
-                if os.path.basename(fp) not in filenames_in_vdb 
-                and os.path.basename(fp) not in failed_documents_filenames
-            ]
-            
-            if not missing_filenames:
-                # All documents found!
-                logger.info("Validation successful: all %d document(s) found in vector DB", len(filepaths))
-                break
-            elif attempt < max_validation_retries - 1:
-                # Documents still missing, retry
-                logger.info(
-                    "Validation attempt %d/%d: %d document(s) not yet visible in vector DB, retrying in %ds... (eventual consistency delay)",
-                    attempt + 1, 
-                    max_validation_retries, 
-                    len(missing_filenames), 
-                    validation_retry_delay
-                )
-                time.sleep(validation_retry_delay)
-            else:
-                # Final attempt - mark remaining as failed
-                logger.warning(
-                    "Validation failed after %d attempts: %d document(s) still not visible in vector DB",
-                    max_validation_retries,
-                    len(missing_filenames)
-                )
-                for filename in missing_filenames:
+        # Add documents the vector DB rejected chunks of to failed documents
+        if hasattr(vdb_op, "pop_failed_chunk_counts"):
+            rejected_counts = vdb_op.pop_failed_chunk_counts(filepaths)
+            # Their stored chunks are not verified, drop the counts
+            vdb_op.pop_written_chunk_counts(list(rejected_counts))
+            for filepath, count in rejected_counts.items():
+                filename = os.path.basename(filepath)
+                if filename not in failed_documents_filenames:
                     failed_documents.append(
                         {
                             "document_name": filename,
-                            "error_message": "Ingestion did not complete successfully",
+                            "error_message": f"{count} chunk(s) could not be indexed",
                         }
                     )
                     failed_documents_filenames.add(filename)
 
+        # Add document to failed documents if it is not in the vector DB
+        expected_filepaths = [
+            filepath
+            for filepath in filepaths
+            if os.path.basename(filepath) not in failed_documents_filenames
+        ]
+        partially_indexed = {}
+        if expected_filepaths and hasattr(vdb_op, "wait_for_visibility"):
+            # Expect every chunk the vector DB wrote for a file; files without a
+            # known count need at least one chunk
+            expected_counts = dict.fromkeys(expected_filepaths, 1)
+            if hasattr(vdb_op, "pop_written_chunk_counts"):
+                expected_counts.update(
+                    {
+                        filepath: count
+                        for filepath, count in vdb_op.pop_written_chunk_counts(
+                            expected_filepaths
+                        ).items()
+                        if count > 0
+                    }
+                )
+            # Poll only the just-ingested sources until they are searchable
+            # (OpenSearch Serverless is eventually consistent)
+            with (
+                stage_timer("consistency_wait"),
+                tracer.start_as_current_span(
+                    "consistency_wait",
+                    attributes={
+                        "rag.file_count": len(expected_counts),
+                        "rag.expected_chunks": sum(expected_counts.values()),
+                    },
+                ),
+            ):
+                chunk_counts = await asyncio.to_thread(
+                    vdb_op.wait_for_visibility,
+                    collection_name,
+                    expected_counts,
+                )
+            missing_filenames = [
+                os.path.basename(filepath)
+                for filepath in expected_filepaths
+                if chunk_counts.get(filepath, 0) == 0
+            ]
+            partially_indexed = {
+                os.path.basename(filepath): (
+                    chunk_counts[filepath],
+                    expected_counts[filepath],
+                )
+                for filepath in expected_filepaths
+                if 0 < chunk_counts.get(filepath, 0) < expected_counts[filepath]
+            }
+        elif expected_filepaths and hasattr(vdb_op, "documents_exist"):
+            filenames_in_vdb = await asyncio.to_thread(
+                vdb_op.documents_exist,
+                collection_name,
+                [os.path.basename(filepath) for filepath in expected_filepaths],
+                expected_filepaths,
+            )
+            missing_filenames = [
+                os.path.basename(filepath)
+                for filepath in expected_filepaths
+                if os.path.basename(filepath) not in filenames_in_vdb
+            ]
+        elif expected_filepaths:
+            filenames_in_vdb = {
+                document.get("document_name")
+                for document in self.get_documents(
+                    collection_name, bypass_validation=True
+                ).get("documents")
+            }
+            missing_filenames = [
+                os.path.basename(filepath)
+                for filepath in expected_filepaths
+                if os.path.basename(filepath) not in filenames_in_vdb
+            ]
+        else:
+            missing_filenames = []
+
+        for filename, (indexed_chunks, expected_chunks) in partially_indexed.items():
+            failed_documents.append(
+                {
+                    "document_name": filename,
+                    "error_message": f"Ingestion partially completed, {
+                        indexed_chunks
+                    } of {expected_chunks} chunks indexed",
+                }
+            )
+            failed_documents_filenames.add(filename)
+
+        for filename in missing_filenames:
+            failed_documents.append(
+                {
+                    "document_name": filename,
+                    "error_message": "Ingestion did not complete successfully",
+                }
+            )
+            failed_documents_filenames.add(filename)
+
         if failed_documents:
             logger.error("Ingestion failed for %d document(s)", len(failed_documents))
             logger.error(
@@ -1527,31 +2470,38 @@ class NvidiaRAGIngestor:
     async def __remove_unsupported_files(
         self,
         filepaths: list[str],
+        manifest: FileManifest,
     ) -> list[str]:
         """Remove unsupported files from the list of filepaths"""
-        non_supported_files = await self.__get_non_supported_files(filepaths)
+        non_supported_files = set(
+            await self.__get_non_supported_files(filepaths, manifest)
+        )
         return [
             filepath for filepath in filepaths if filepath not in non_supported_files
         ]
 
-    async def __remove_non_pdf_files(self, filepaths: list[str]) -> list[str]:
+    async def __remove_non_pdf_files(
+        self, filepaths: list[str], manifest: FileManifest
+    ) -> list[str]:
         """Remove non-PDF files from the list of filepaths."""
         return [
             filepath
             for filepath in filepaths
-            if os.path.splitext(filepath)[1].lower() == ".pdf"
+            if manifest.get(filepath).extension == ".pdf"
         ]
 
-    async def __get_non_supported_files(self, filepaths: list[str]) -> list[str]:
-        """Get filepaths of non-supported file extensions"""
-        non_supported_files = []
-        for filepath in filepaths:
-            ext = os.path.splitext(filepath)[1].lower()
-            if ext not in [
-                "." + supported_ext for supported_ext in SUPPORTED_FILE_TYPES
-            ]:
-                non_supported_files.append(filepath)
-        return non_supported_files
+    async def __get_non_supported_files(
+        self, filepaths: list[str], manifest: FileManifest
+    ) -> list[str]:
+        """Get filepaths of non-supported file extensions, read from the manifest"""
+        supported_extensions = {
+            "." + supported_ext for supported_ext in SUPPORTED_FILE_TYPES
+        }
+        return [
+            filepath
+            for filepath in filepaths
+            if manifest.get(filepath).extension not in supported_extensions
+        ]
 
     async def _validate_custom_metadata(
         self,
@@ -1687,15 +2637,17 @@ class NvidiaRAGIngestor:
         return validation_status, validation_errors
 
     async def __prepare_summary_documents(
-        self, results: list[list[dict[str, str | dict]]], collection_name: str
+        self, columns: ResultColumns, collection_name: str
     ) -> list[Document]:
         """
         Prepare summary documents from the results to gather content for each file
         """
         summary_documents = []
 
-        for result in results:
-            documents = self.__parse_documents([result])
+        for source_number in range(len(columns.sources)):
+            documents = self.__parse_documents(
+                columns, columns.source_elements(source_number)
+            )
             if documents:
                 full_content = " ".join([doc.page_content for doc in documents])
                 metadata = {
@@ -1708,82 +2660,57 @@ class NvidiaRAGIngestor:
         return summary_documents
 
     def __parse_documents(
-        self, results: list[list[dict[str, str | dict]]]
+        self, columns: ResultColumns, elements: range | None = None
     ) -> list[Document]:
         """
         Extract document page content from the results obtained from nv-ingest
 
         Arguments:
-            - results: List[List[Dict[str, Union[str, dict]]]] - Results obtained from nv-ingest
+            - columns: ResultColumns - Decoded results obtained from nv-ingest
+            - elements: range - Elements to parse, all elements if not given
 
         Returns
             - List[Document] - List of documents with page content
         """
         documents = []
-        for result in results:
-            for result_element in result:
-                # Prepare metadata
-                metadata = self.__prepare_metadata(result_element=result_element)
-
-                # Extract documents page_content and prepare docs
-                page_content = None
-                # For textual data
-                if result_element.get("document_type") == "text":
-                    page_content = result_element.get("metadata").get("content")
-
-                # For both tables and charts
-                elif result_element.get("document_type") == "structured":
-                    structured_page_content = (
-                        result_element.get("metadata")
-                        .get("table_metadata")
-                        .get("table_content")
-                    )
-                    subtype = (
-                        result_element.get("metadata")
-                        .get("content_metadata")
-                        .get("subtype")
-                    )
-                    # Check for tables
-                    if subtype == "table" and self._config.nv_ingest.extract_tables:
-                        page_content = structured_page_content
-                    # Check for charts
-                    elif subtype == "chart" and self._config.nv_ingest.extract_charts:
-                        page_content = structured_page_content
-
-                # For image captions
-                elif (
-                    result_element.get("document_type") == "image"
-                    and self._config.nv_ingest.extract_images
-                ):
-                    page_content = (
-                        result_element.get("metadata")
-                        .get("image_metadata")
-                        .get("caption")
-                    )
-
-                # For audio transcripts
-                elif result_element.get("document_type") == "audio":
-                    page_content = (
-                        result_element.get("metadata")
-                        .get("audio_metadata")
-                        .get("audio_transcript")
-                    )
-
-                # Add doc to list
-                if page_content:
-                    documents.append(
-                        Document(page_content=page_content, metadata=metadata)
+        for element in elements if elements is not None else range(len(columns)):
+            document_type = columns.document_type(element)
+            page_content = None
+            # For textual data and audio transcripts
+            if document_type in ["text", "audio"]:
+                page_content = columns.get_text(element)
+
+            # For both tables and charts
+            elif document_type == "structured":
+                subtype = columns.subtype(element)
+                # Check for tables
+                if subtype == "table" and self._config.nv_ingest.extract_tables:
+                    page_content = columns.get_text(element)
+                # Check for charts
+                elif subtype == "chart" and self._config.nv_ingest.extract_charts:
+                    page_content = columns.get_text(element)
+
+            # For image captions
+            elif document_type == "image" and self._config.nv_ingest.extract_images:
+                page_content = columns.get_text(element)
+
+            # Add doc to list
+            if page_content:
+                documents.append(
+                    Document(
+                        page_content=page_content,
+                        metadata=self.__prepare_metadata(columns, element),
                     )
+                )
         return documents
 
-    def __prepare_metadata(
-        self, result_element: dict[str, str | dict]
-    ) -> dict[str, str]:
+    def __prepare_metadata(self, columns: ResultColumns, element: int) -> dict[str, str]:
         """
         Prepare metadata object w.r.t. to a single chunk
 
         Arguments:
-            - result_element: Dict[str, Union[str, dict]]] - Result element for single chunk
+            - columns: ResultColumns - Decoded results obtained from nv-ingest
+            - element: int - Index of the element for single chunk
 
         Returns:
             - metadata: Dict[str, str] - Dict of metadata for s single chunk
@@ -1791,42 +2718,39 @@ class NvidiaRAGIngestor:
                 "source": "<filepath>",
                 "chunk_type": "<chunk_type>", # ["text", "image", "table", "chart"]
                 "source_name": "<filename>",
-                "content": "<base64_str encoded content>" # Only for ["image", "table", "chart"]
             }
         """
-        source_id = (
-            result_element.get("metadata").get("source_metadata").get("source_id")
-        )
+        source_id = columns.source(element)
 
         # Get chunk_type
-        if result_element.get("document_type") == "structured":
-            chunk_type = (
-                result_element.get("metadata").get("content_metadata").get("subtype")
-            )
+        if columns.document_type(element) == "structured":
+            chunk_type = columns.subtype(element)
         else:
-            chunk_type = result_element.get("document_type")
-
-        # Get base64_str encoded content, empty str in case of text
-        # content = (
-        #     result_element.get("metadata").get("content")
-        #     if chunk_type != "text"
-        #     else ""
-        # )
+            chunk_type = columns.document_type(element)
 
         metadata = {
             # Add filepath (Key-name same for backward compatibility)
             "source": source_id,
             "chunk_type": chunk_type,  # ["text", "image", "table", "chart"]
             "source_name": os.path.basename(source_id),  # Add filename
-            # "content": content # content encoded in base64_str format [Must not exceed 64KB]
         }
         return metadata
 
     async def __generate_summary_for_documents(
-        self, documents: list[Document]
+        self,
+        documents: list[Document],
+        on_summary: Callable[[Document], Awaitable[None]] = None,
     ) -> list[Document]:
         """
-        Generate summaries for documents using iterative chunk-wise approach
+        Generate summaries for documents concurrently.
+
+        Documents longer than one request are split into chunks and summarized
+        either by refining a running summary chunk after chunk ("refine") or by
+        summarizing all chunks in parallel and combining the partial summaries
+        hierarchically ("map_reduce"), see SUMMARY_STRATEGY.
+
+        on_summary, if given, is awaited with each document as soon as its
+        summary is available.
         """
         # Generate document summary
         summary_llm_name = CONFIG.summarizer.model_name
@@ -1871,7 +2795,26 @@ class NvidiaRAGIngestor:
         # Use configured chunk size
         max_chunk_chars = CONFIG.summarizer.max_chunk_length
         chunk_overlap = CONFIG.summarizer.chunk_overlap
-        logger.info(f"Using chunk size: {max_chunk_chars} characters")
+
+        # Chunks are packed by tokens: a request is filled up to the context
+        # window minus the prompt, the summary to generate and, when refining,
+        # the previous summary
+        initial_budget = get_token_budget(
+            document_summary_prompt["system"] + document_summary_prompt["human"],
+            max_chunk_chars,
+        )
+        iterative_budget = get_token_budget(
+            iterative_summary_prompt_config["system"]
+            + iterative_summary_prompt_config["human"],
+            max_chunk_chars,
+            reserved_tokens=SUMMARY_MAX_OUTPUT_TOKENS,
+        )
+        overlap_tokens = chars_to_tokens(chunk_overlap)
+        logger.info(
+            f"Using token budget per request: {initial_budget} (initial), {
+                iterative_budget
+            } (iterative)"
+        )
 
         if not len(documents):
             logger.error(
@@ -1879,97 +2822,208 @@ class NvidiaRAGIngestor:
             )
             return []
 
-        for document in documents:
-            document_text = document.page_content
+        # Cached summaries are only reused for the same model, prompts and chunking
+        summary_version = get_summary_version(
+            model=summary_llm_name,
+            document_summary_prompt=document_summary_prompt,
+            iterative_summary_prompt=iterative_summary_prompt_config,
+            strategy=SUMMARY_STRATEGY,
+            initial_budget=initial_budget,
+            iterative_budget=iterative_budget,
+            chunk_overlap=chunk_overlap,
+        )
 
-            # Check if document fits in single request
-            if len(document_text) <= max_chunk_chars:
-                # Process as single chunk
-                logger.info(
-                    f"Processing document {
-                        document.metadata['filename']
-                    } as single chunk"
+        # Shared by all summary jobs, so the queue workers together never exceed
+        # SUMMARY_MAX_CONCURRENCY LLM calls
+        llm_semaphore = _get_summary_llm_semaphore()
+
+        async def invoke(chain, inputs: dict[str, str], run_name: str) -> str:
+            async with llm_semaphore:
+                with tracer.start_as_current_span(
+                    "summary.llm_call", attributes={"rag.run_name": run_name}
+                ):
+                    return await chain.ainvoke(inputs, config={"run_name": run_name})
+
+        async def refine(filename: str, text_chunks: list[str]) -> str:
+            # Generate initial summary from first chunk
+            summary = await invoke(
+                initial_chain,
+                {"document_text": text_chunks[0]},
+                "document-summary-initial",
+            )
+
+            # Iteratively update summary with remaining chunks
+            for i, chunk in enumerate(text_chunks[1:], 1):
+                logger.info(f"Processing chunk {i + 1}/{len(text_chunks)} for {filename}")
+                summary = await invoke(
+                    iterative_chain,
+                    {"previous_summary": summary, "new_chunk": chunk},
+                    f"document-summary-chunk-{i + 1}",
+                )
+                logger.debug(
+                    f"Summary for chunk {i + 1}/{len(text_chunks)} for {filename}: {
+                        summary
+                    }"
                 )
-                summary = await initial_chain.ainvoke(
-                    {"document_text": document_text},
-                    config={"run_name": "document-summary"},
+            return summary
+
+        async def map_reduce(filename: str, text_chunks: list[str]) -> str:
+            # Summarize all chunks in parallel, then merge the partial summaries
+            # in groups that fit a single request until one summary is left
+            summaries = await asyncio.gather(
+                *(
+                    invoke(
+                        initial_chain,
+                        {"document_text": chunk},
+                        f"document-summary-map-{i + 1}",
+                    )
+                    for i, chunk in enumerate(text_chunks)
                 )
-            else:
-                # Process in chunks iteratively using LangChain's text splitter
-                text_splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=max_chunk_chars,
-                    chunk_overlap=chunk_overlap,
-                    length_function=len,
-                    separators=["\n\n", "\n", ". ", "! ", "? ", " ", ""],
-                )
-                text_chunks = text_splitter.split_text(document_text)
+            )
+            level = 0
+            while len(summaries) > 1:
+                level += 1
+                groups = pack_by_tokens(summaries, initial_budget)
+                if len(groups) == len(summaries):
+                    # Summaries too long to group, merge them pairwise
+                    groups = [summaries[i : i + 2] for i in range(0, len(summaries), 2)]
                 logger.info(
-                    f"Processing document {document.metadata['filename']} in {
-                        len(text_chunks)
-                    } chunks"
+                    f"Combining {len(summaries)} partial summaries of {filename} into {
+                        len(groups)
+                    } (level {level})"
                 )
-
-                # Generate initial summary from first chunk
-                summary = await initial_chain.ainvoke(
-                    {"document_text": text_chunks[0]},
-                    config={"run_name": "document-summary-initial"},
+                summaries = await asyncio.gather(
+                    *(
+                        invoke(
+                            initial_chain,
+                            {"document_text": "\n\n".join(group)},
+                            f"document-summary-reduce-{level}",
+                        )
+                        if len(group) > 1
+                        else asyncio.sleep(0, result=group[0])
+                        for group in groups
+                    )
                 )
+            return summaries[0]
+
+        async def summarize(document: Document) -> Document | None:
+            with tracer.start_as_current_span(
+                "summarize_document",
+                attributes={
+                    "rag.document_name": document.metadata["filename"],
+                    "rag.text_length": len(document.page_content),
+                },
+            ):
+                document = await generate(document)
+            if document is not None and on_summary is not None:
+                await on_summary(document)
+            return document
 
-                # Iteratively update summary with remaining chunks
-                for i, chunk in enumerate(text_chunks[1:], 1):
-                    logger.info(
-                        f"Processing chunk {i + 1}/{len(text_chunks)} for {
-                            document.metadata['filename']
-                        }"
+        async def generate(document: Document) -> Document | None:
+            document_text = document.page_content
+            filename = document.metadata["filename"]
+            collection_name = document.metadata["collection_name"]
+            cache_key = None
+            if ENABLE_SUMMARY_CACHE:
+                cache_key = get_summary_cache_key(document_text, summary_version)
+                document.metadata["summary_cache_key"] = cache_key
+                cached_summary = await asyncio.to_thread(
+                    get_cached_summary,
+                    get_minio_operator_instance(),
+                    cache_key,
+                    collection_name,
+                    filename,
+                )
+                if cached_summary is not None:
+                    logger.info(f"Reusing cached summary for unchanged document {filename}")
+                    document.metadata["summary_cached"] = True
+                    document.metadata["summary"] = cached_summary
+                    return document
+            try:
+                # Check if document fits in single request
+                if count_tokens(document_text) <= initial_budget:
+                    # Process as single chunk
+                    logger.info(f"Processing document {filename} as single chunk")
+                    summary = await invoke(
+                        initial_chain, {"document_text": document_text}, "document-summary"
                     )
-                    summary = await iterative_chain.ainvoke(
-                        {"previous_summary": summary, "new_chunk": chunk},
-                        config={"run_name": f"document-summary-chunk-{i + 1}"},
+                else:
+                    # Process in chunks of at most the token budget
+                    text_chunks = split_by_tokens(
+                        document_text,
+                        initial_budget
+                        if SUMMARY_STRATEGY == "map_reduce"
+                        else iterative_budget,
+                        overlap_tokens,
                     )
-                    logger.debug(
-                        f"Summary for chunk {i + 1}/{len(text_chunks)} for {
-                            document.metadata['filename']
-                        }: {summary}"
+                    logger.info(
+                        f"Processing document {filename} in {len(text_chunks)} chunks "
+                        f"with {SUMMARY_STRATEGY} strategy"
                     )
+                    if SUMMARY_STRATEGY == "map_reduce":
+                        summary = await map_reduce(filename, text_chunks)
+                    else:
+                        summary = await refine(filename, text_chunks)
+            except Exception as e:
+                logger.error(
+                    f"Summary generation failed for {filename}: {e}",
+                    exc_info=logger.getEffectiveLevel() <= logging.DEBUG,
+                )
+                return None
 
             document.metadata["summary"] = summary
-            logger.debug(
-                f"Document summary for {document.metadata['filename']}: {summary}"
-            )
+            logger.debug(f"Document summary for {filename}: {summary}")
+            if cache_key is not None:
+                try:
+                    await asyncio.to_thread(
+                        put_cached_summary,
+                        get_minio_operator_instance(),
+                        cache_key,
+                        summary,
+                        collection_name,
+                        filename,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to cache summary of {filename}: {e}")
+            return document
+
+        summarized = await asyncio.gather(*(summarize(document) for document in documents))
+        documents = [document for document in summarized if document is not None]
 
         logger.info("Document summary generation complete!")
         return documents
 
-    async def __put_document_summary_to_minio(self, documents: list[Document]) -> None:
-        """
-        Put document summary to minio
+    async def __put_document_summary_to_minio(
+        self, documents: list[Document]
+    ) -> asyncio.Future:
         """
-        if not len(documents):
-            logger.error("No documents to put to minio")
-            return
+        Queue document summaries for upload to minio.
 
+        Returns a future that resolves with the number of stored summaries.
+        """
+        payloads = []
+        object_names = []
         for document in documents:
-            summary = document.metadata["summary"]
             file_name = document.metadata["filename"]
             collection_name = document.metadata["collection_name"]
-            page_number = 0
-            location = []
-
-            unique_thumbnail_id = get_unique_thumbnail_id(
-                collection_name=f"summary_{collection_name}",
-                file_name=file_name,
-                page_number=page_number,
-                location=location,
-            )
-
-            get_minio_operator_instance().put_payload(
-                payload={
-                    "summary": summary,
+            payloads.append(
+                {
+                    "summary": document.metadata["summary"],
                     "file_name": file_name,
                     "collection_name": collection_name,
-                },
-                object_name=unique_thumbnail_id,
+                    "summary_cache_key": document.metadata.get("summary_cache_key"),
+                }
+            )
+            object_names.append(
+                get_unique_thumbnail_id(
+                    collection_name=f"summary_{collection_name}",
+                    file_name=file_name,
+                    page_number=0,
+                    location=[],
+                )
             )
-            logger.debug(f"Document summary for {file_name} ingested to minio")
 
-        logger.info("Document summary insertion completed to minio!")
+        label = ", ".join(document.metadata["filename"] for document in documents)
+        return await _get_summary_uploader().submit(
+            f"summary of {label}", payloads, object_names
+        )
@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared fixtures for the unit tests: an in-memory OpenSearch"""
+
+import itertools
+import json
+from collections import Counter
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from nvidia_rag.utils.vdb.opensearch.opensearch_vdb import OpenSearchVDB
+
+
+def _field_value(document: dict[str, Any], field: str) -> Any:
+    value = document
+    for key in field.removesuffix(".keyword").split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+class FakeOpenSearchClient:
+    """In-memory stand-in for the low-level OpenSearch client.
+
+    Supports the bulk, search (term, terms, ids, exists and bool queries, terms
+    aggregations, scrolling) and index calls the VDB makes. Written documents
+    become searchable after visibility_delay further searches, like on
+    OpenSearch Serverless.
+    """
+
+    def __init__(self, visibility_delay: int = 0):
+        self.documents: dict[str, dict[str, dict[str, Any]]] = {}
+        self.visibility_delay = visibility_delay
+        self.search_calls = 0
+        self.bulk_calls: list[list[dict[str, Any]]] = []
+        self._visible_at: dict[tuple[str, str], int] = {}
+        self._scrolls: dict[str, list[list[dict[str, Any]]]] = {}
+        self._ids = itertools.count(1)
+        self.transport = SimpleNamespace(serializer=SimpleNamespace(dumps=json.dumps))
+        self.indices = SimpleNamespace(
+            exists=lambda index: index in self.documents,
+            create=lambda index, body: self.documents.setdefault(index, {}),
+            refresh=lambda index: None,
+        )
+
+    def add(
+        self, index: str, document: dict[str, Any], doc_id: str | None = None
+    ) -> str:
+        doc_id = doc_id or f"doc-{next(self._ids)}"
+        self.documents.setdefault(index, {})[doc_id] = document
+        self._visible_at[(index, doc_id)] = self.search_calls + self.visibility_delay
+        return doc_id
+
+    def bulk(self, body: str) -> dict[str, Any]:
+        lines = [json.loads(line) for line in body.splitlines() if line]
+        self.bulk_calls.append(lines)
+        items = []
+        lines = iter(lines)
+        for action in lines:
+            operation, meta = next(iter(action.items()))
+            index, doc_id = meta["_index"], meta.get("_id")
+            stored = self.documents.setdefault(index, {})
+            if operation == "delete":
+                status = 200 if stored.pop(doc_id, None) is not None else 404
+                items.append({operation: {"_id": doc_id, "status": status}})
+            elif operation == "create" and doc_id in stored:
+                next(lines)
+                items.append(
+                    {
+                        operation: {
+                            "_id": doc_id,
+                            "status": 409,
+                            "error": {"type": "conflict"},
+                        }
+                    }
+                )
+            else:
+                doc_id = self.add(index, next(lines), doc_id)
+                items.append({operation: {"_id": doc_id, "status": 201}})
+        errors = any(next(iter(item.values())).get("error") for item in items)
+        return {"errors": errors, "items": items}
+
+    def _matches(
+        self, document: dict[str, Any], doc_id: str, query: dict[str, Any]
+    ) -> bool:
+        kind, spec = next(iter(query.items()))
+        if kind == "match_all":
+            return True
+        if kind == "ids":
+            return doc_id in spec["values"]
+        if kind == "exists":
+            return _field_value(document, spec["field"]) is not None
+        if kind == "term":
+            field, value = next(iter(spec.items()))
+            return _field_value(document, field) == value
+        if kind == "terms":
+            field, values = next(iter(spec.items()))
+            return _field_value(document, field) in values
+        if kind == "bool":
+            must = spec.get("filter", []) + spec.get("must", [])
+            should = spec.get("should", [])
+            minimum_should_match = spec.get("minimum_should_match", 1 if should else 0)
+            return (
+                all(self._matches(document, doc_id, clause) for clause in must)
+                and sum(self._matches(document, doc_id, clause) for clause in should)
+                >= minimum_should_match
+                and not any(
+                    self._matches(document, doc_id, clause)
+                    for clause in spec.get("must_not", [])
+                )
+            )
+        raise NotImplementedError(kind)
+
+    def search(
+        self,
+        index: str,
+        body: dict[str, Any],
+        size: int | None = None,
+        scroll: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        self.search_calls += 1
+        query = body.get("query", {"match_all": {}})
+        hits = [
+            {"_id": doc_id, "_source": document}
+            for doc_id, document in self.documents.get(index, {}).items()
+            if self._visible_at[(index, doc_id)] < self.search_calls
+            and self._matches(document, doc_id, query)
+        ]
+        size = body.get("size", 10) if size is None else size
+        response = {
+            "_shards": {"total": 1, "successful": 1, "skipped": 0},
+            "hits": {"total": {"value": len(hits)}, "hits": hits[:size]},
+        }
+        if scroll:
+            scroll_id = f"scroll-{next(self._ids)}"
+            self._scrolls[scroll_id] = [
+                hits[i : i + size] for i in range(size, len(hits), size)
+            ]
+            response["_scroll_id"] = scroll_id
+        aggregations = {}
+        for name, aggregation in body.get("aggs", {}).items():
+            counts = Counter(
+                _field_value(hit["_source"], aggregation["terms"]["field"])
+                for hit in hits
+            )
+            aggregations[name] = {
+                "buckets": [
+                    {"key": key, "doc_count": count}
+                    for key, count in counts.most_common(aggregation["terms"]["size"])
+                    if key is not None
+                ]
+            }
+        if aggregations:
+            response["aggregations"] = aggregations
+        return response
+
+    def scroll(self, body: dict[str, Any], **kwargs) -> dict[str, Any]:
+        pages = self._scrolls[body["scroll_id"]]
+        return {
+            "_scroll_id": body["scroll_id"],
+            "_shards": {"total": 1, "successful": 1, "skipped": 0},
+            "hits": {"hits": pages.pop(0) if pages else []},
+        }
+
+    def clear_scroll(self, body: dict[str, Any], **kwargs) -> None:
+        for scroll_id in body["scroll_id"]:
+            self._scrolls.pop(scroll_id, None)
+
+
+@pytest.fixture
+def opensearch_client() -> FakeOpenSearchClient:
+    return FakeOpenSearchClient()
+
+
+@pytest.fixture
+def vdb(monkeypatch, opensearch_client) -> OpenSearchVDB:
+    monkeypatch.setenv("APP_VECTORSTORE_CUSTOM_IDS", "true")
+    vdb = OpenSearchVDB(opensearch_url="http://opensearch:9200", index_name="docs")
+    monkeypatch.setattr(vdb, "_make_low_level_client", lambda: opensearch_client)
+    return vdb
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the upload file manifest"""
+
+import hashlib
+
+from nvidia_rag.ingestor_server import file_manifest
+from nvidia_rag.ingestor_server.file_manifest import FileManifest
+
+
+def test_build(tmp_path):
+    filepath = tmp_path / "a.PDF"
+    filepath.write_bytes(b"12345")
+    manifest = FileManifest.build(
+        [str(filepath), str(filepath), str(tmp_path / "missing.txt"), str(tmp_path)]
+    )
+
+    assert len(manifest.entries) == 3
+    entry = manifest.get(str(filepath))
+    assert entry.document_name == "a.PDF"
+    assert entry.extension == ".pdf"
+    assert entry.exists and entry.is_file and entry.size_bytes == 5
+    missing = manifest.get(str(tmp_path / "missing.txt"))
+    assert not missing.exists and missing.size_bytes == 0
+    directory = manifest.get(str(tmp_path))
+    assert directory.exists and not directory.is_file
+    assert manifest.total_size([str(filepath), str(tmp_path / "missing.txt")]) == 5
+
+
+def test_get_stats_files_outside_the_manifest(tmp_path):
+    filepath = tmp_path / "a.txt"
+    filepath.write_text("abc")
+    assert FileManifest().size(str(filepath)) == 3
+
+
+def test_content_hashes_are_read_once(tmp_path, monkeypatch):
+    filepaths = []
+    for name, content in [("a.txt", b"a"), ("b.txt", b"b")]:
+        filepath = tmp_path / name
+        filepath.write_bytes(content)
+        filepaths.append(str(filepath))
+    missing = str(tmp_path / "missing.txt")
+    manifest = FileManifest.build(filepaths + [missing])
+
+    hashes = manifest.content_hashes(filepaths + [missing])
+    assert hashes == {
+        filepaths[0]: hashlib.sha256(b"a").hexdigest(),
+        filepaths[1]: hashlib.sha256(b"b").hexdigest(),
+    }
+
+    def read_content(*args):
+        raise AssertionError("file read twice")
+
+    monkeypatch.setattr(file_manifest, "_read_content", read_content)
+    assert manifest.content_hash(filepaths[0]) == hashes[filepaths[0]]
+    assert manifest.content_hash(missing) is None
+
+
+def test_pdf_pages_are_counted_across_reads(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_manifest, "_HASH_READ_SIZE", 100)
+    content = b"%PDF-1.7\n<< /Type /Pages /Count 3 >>\n"
+    for i in range(3):
+        content += b"x" * (90 + i * 7) + b"<< /Type  /Page /Parent 2 0 R >>\n"
+    filepath = tmp_path / "a.pdf"
+    filepath.write_bytes(content)
+    text_filepath = tmp_path / "a.txt"
+    text_filepath.write_bytes(content)
+    manifest = FileManifest.build([str(filepath), str(text_filepath)])
+
+    assert manifest.page_counts([str(filepath)]) == {}
+    manifest.content_hashes([str(filepath), str(text_filepath)])
+    assert manifest.content_hash(str(filepath)) == hashlib.sha256(content).hexdigest()
+    assert manifest.page_counts([str(filepath), str(text_filepath)]) == {
+        str(filepath): 3
+    }
@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the content fingerprint index and duplicate planning"""
+
+import pytest
+
+from nvidia_rag.ingestor_server.fingerprint_index import (
+    FingerprintIndex,
+    get_settings_key,
+    plan_duplicates,
+)
+
+COLLECTION = "docs"
+SETTINGS = get_settings_key(chunk_size=512, chunk_overlap=150)
+
+
+@pytest.fixture
+def index(tmp_path):
+    return FingerprintIndex(str(tmp_path / "fingerprints.sqlite"))
+
+
+def test_settings_key_is_order_independent():
+    assert get_settings_key(a=1, b="x") == get_settings_key(b="x", a=1)
+    assert get_settings_key(a=1) != get_settings_key(a=2)
+
+
+def test_lookup_filters_by_settings(index):
+    index.record(COLLECTION, [("/tmp/a.pdf", "sha-a", False, 4)], SETTINGS)
+    assert [match.document_name for match in index.lookup("sha-a")] == ["a.pdf"]
+    assert index.lookup("sha-a", SETTINGS)[0].chunk_count == 4
+    assert index.lookup("sha-a", "other-settings") == []
+
+
+def test_alias_to_ingested_document_with_known_count(index):
+    index.record("other", [("/data/a.pdf", "sha-a", False, 4)], SETTINGS)
+    index.record(COLLECTION, [("/data/a.pdf", "sha-a", False, 7)], SETTINGS)
+    aliases, rejections = plan_duplicates(
+        index, COLLECTION, {"/upload/b.pdf": "sha-a"}, set(), SETTINGS, "alias"
+    )
+    # A copy within the collection is preferred
+    assert aliases == {"/upload/b.pdf": (COLLECTION, "/data/a.pdf", 7)}
+    assert rejections == {}
+
+
+def test_alias_to_twin_in_same_upload(index):
+    aliases, _ = plan_duplicates(
+        index,
+        COLLECTION,
+        {"/upload/a.pdf": "sha-a", "/upload/b.pdf": "sha-a"},
+        set(),
+        SETTINGS,
+        "alias",
+    )
+    assert aliases == {"/upload/b.pdf": (COLLECTION, "/upload/a.pdf", None)}
+
+
+def test_no_alias_for_other_settings_or_unknown_count(index):
+    index.record(COLLECTION, [("/data/a.pdf", "sha-a", False, 4)], "other-settings")
+    index.record(COLLECTION, [("/data/c.pdf", "sha-c", False, 0)], SETTINGS)
+    aliases, _ = plan_duplicates(
+        index,
+        COLLECTION,
+        {"/upload/b.pdf": "sha-a", "/upload/d.pdf": "sha-c"},
+        set(),
+        SETTINGS,
+        "alias",
+    )
+    assert aliases == {}
+
+
+def test_no_alias_with_custom_metadata(index):
+    index.record(COLLECTION, [("/data/a.pdf", "sha-a", True, 4)], SETTINGS)
+    index.record(COLLECTION, [("/data/c.pdf", "sha-c", False, 4)], SETTINGS)
+    aliases, _ = plan_duplicates(
+        index,
+        COLLECTION,
+        {"/upload/b.pdf": "sha-a", "/upload/d.pdf": "sha-c"},
+        {"d.pdf"},
+        SETTINGS,
+        "alias",
+    )
+    assert aliases == {}
+
+
+def test_same_document_is_not_its_own_duplicate(index):
+    index.record(COLLECTION, [("/data/a.pdf", "sha-a", False, 4)], SETTINGS)
+    aliases, rejections = plan_duplicates(
+        index, COLLECTION, {"/upload/a.pdf": "sha-a"}, set(), SETTINGS, "alias"
+    )
+    assert aliases == {} and rejections == {}
+
+
+def test_reject_ignores_settings_and_other_collections(index):
+    index.record(COLLECTION, [("/data/a.pdf", "sha-a", False, 4)], "other-settings")
+    index.record("other", [("/data/c.pdf", "sha-c", False, 4)], SETTINGS)
+    aliases, rejections = plan_duplicates(
+        index,
+        COLLECTION,
+        {
+            "/upload/b.pdf": "sha-a",
+            "/upload/d.pdf": "sha-c",
+            "/upload/e.pdf": "sha-c",
+        },
+        set(),
+        SETTINGS,
+        "reject",
+    )
+    assert aliases == {}
+    assert set(rejections) == {"/upload/b.pdf", "/upload/e.pdf"}
+    assert "a.pdf" in rejections["/upload/b.pdf"]
+    assert "d.pdf" in rejections["/upload/e.pdf"]
+
+
+def test_policy_off(index):
+    index.record(COLLECTION, [("/data/a.pdf", "sha-a", False, 4)], SETTINGS)
+    assert plan_duplicates(
+        index, COLLECTION, {"/upload/b.pdf": "sha-a"}, set(), SETTINGS, "off"
+    ) == ({}, {})
+
+
+def test_forget(index):
+    index.record(
+        COLLECTION,
+        [("/data/a.pdf", "sha-a", False, 4), ("/data/b.pdf", "sha-b", False, 4)],
+    )
+    index.forget(COLLECTION, ["a.pdf"])
+    assert index.lookup("sha-a") == []
+    assert len(index.lookup("sha-b")) == 1
+    index.forget(COLLECTION)
+    assert index.lookup("sha-b") == []
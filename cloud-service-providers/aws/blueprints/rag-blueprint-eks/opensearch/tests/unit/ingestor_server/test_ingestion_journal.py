@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the ingestion journal"""
+
+import sqlite3
+
+import pytest
+
+from nvidia_rag.ingestor_server import ingestion_journal
+from nvidia_rag.ingestor_server.ingestion_journal import (
+    STAGE_CITATIONS,
+    STAGE_FAILED,
+    STAGE_INDEXED,
+    STAGE_SUMMARIZED,
+    STAGE_VALIDATED,
+    IngestionJournal,
+)
+
+COLLECTION = "docs"
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return IngestionJournal(str(tmp_path / "journal.sqlite"))
+
+
+def test_stage_transitions_only_move_forward(journal):
+    owner = journal.new_owner()
+    journal.start_files(COLLECTION, {"a.pdf": "hash-a"}, owner)
+    assert journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"].stage == (
+        STAGE_VALIDATED
+    )
+
+    journal.mark_stage(COLLECTION, ["a.pdf"], STAGE_CITATIONS)
+    journal.mark_stage(COLLECTION, ["a.pdf"], STAGE_INDEXED)
+    assert journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"].stage == (
+        STAGE_CITATIONS
+    )
+
+    journal.mark_stage(COLLECTION, ["a.pdf"], STAGE_SUMMARIZED)
+    assert journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"].stage == (
+        STAGE_SUMMARIZED
+    )
+
+
+def test_start_files_resets_resubmitted_files(journal):
+    owner = journal.new_owner()
+    journal.start_files(COLLECTION, {"a.pdf": "hash-a"}, owner)
+    journal.mark_stage(COLLECTION, ["a.pdf"], STAGE_INDEXED)
+    journal.start_files(COLLECTION, {"a.pdf": "hash-a"}, owner)
+    assert journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"].stage == (
+        STAGE_VALIDATED
+    )
+
+
+def test_entries_are_looked_up_by_name(journal):
+    owner = journal.new_owner()
+    journal.start_files(COLLECTION, {"a.pdf": "hash-a", "b.pdf": "hash-b"}, owner)
+    entries = journal.get_entries(COLLECTION, ["b.pdf", "c.pdf"])
+    assert set(entries) == {"b.pdf"}
+    # Callers compare the content before resuming a file
+    assert entries["b.pdf"].fingerprint == "hash-b"
+    assert journal.get_entries("other", ["b.pdf"]) == {}
+
+
+def test_mark_stage_ignores_unknown_documents(journal):
+    journal.mark_stage(COLLECTION, ["missing.pdf"], STAGE_INDEXED)
+    assert journal.get_entries(COLLECTION, ["missing.pdf"]) == {}
+
+
+def test_mark_failed(journal):
+    owner = journal.new_owner()
+    journal.start_files(COLLECTION, {"a.pdf": "hash-a"}, owner)
+    journal.mark_failed(COLLECTION, {"a.pdf": "boom"})
+    entry = journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"]
+    assert entry.stage == STAGE_FAILED
+    assert not IngestionJournal.is_in_progress(entry, citations_required=False)
+
+
+def test_released_owner_marks_files_interrupted(journal):
+    owner = journal.new_owner()
+    journal.start_files(COLLECTION, {"a.pdf": "hash-a"}, owner)
+    entry = journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"]
+    assert entry.owner == owner
+    assert IngestionJournal.is_in_progress(entry, citations_required=False)
+
+    journal.release_owner(owner)
+    entry = journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"]
+    assert not entry.owner_active
+    assert not IngestionJournal.is_in_progress(entry, citations_required=False)
+
+
+def test_owner_of_another_process_times_out(journal, tmp_path, monkeypatch):
+    # An owner registered by another process is only known by its heartbeat
+    other = IngestionJournal(journal.path)
+    owner = other.new_owner()
+    other.start_files(COLLECTION, {"a.pdf": "hash-a"}, owner)
+    assert journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"].owner_active
+
+    monkeypatch.setattr(ingestion_journal, "JOURNAL_OWNER_TIMEOUT", -1)
+    assert not journal.get_entries(COLLECTION, ["a.pdf"])["a.pdf"].owner_active
+
+
+def test_is_complete_depends_on_citations():
+    assert IngestionJournal.is_complete(STAGE_INDEXED, citations_required=False)
+    assert not IngestionJournal.is_complete(STAGE_INDEXED, citations_required=True)
+    assert IngestionJournal.is_complete(STAGE_CITATIONS, citations_required=True)
+    assert not IngestionJournal.is_complete(STAGE_VALIDATED, citations_required=False)
+
+
+def test_forget(journal):
+    owner = journal.new_owner()
+    fingerprints = {"a.pdf": "hash-a", "b.pdf": "hash-b"}
+    journal.start_files(COLLECTION, fingerprints, owner)
+    journal.forget(COLLECTION, ["a.pdf"])
+    assert set(journal.get_entries(COLLECTION, list(fingerprints))) == {"b.pdf"}
+    journal.forget(COLLECTION)
+    assert journal.get_entries(COLLECTION, list(fingerprints)) == {}
+
+
+def test_journal_without_owner_column_is_migrated(tmp_path):
+    path = str(tmp_path / "journal.sqlite")
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute(
+            """
+            CREATE TABLE ingestion_journal (
+                collection_name TEXT NOT NULL,
+                document_name TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (collection_name, document_name)
+            )
+            """
+        )
+        connection.execute(
+            "INSERT INTO ingestion_journal VALUES (?, ?, ?, ?, NULL, 0)",
+            (COLLECTION, "a.pdf", "hash-a", STAGE_INDEXED),
+        )
+    connection.close()
+
+    entry = IngestionJournal(path).get_entries(COLLECTION, ["a.pdf"])["a.pdf"]
+    assert entry.stage == STAGE_INDEXED
+    assert entry.owner is None
+    assert not entry.owner_active
+
+
+def test_journal_requires_a_path(monkeypatch):
+    monkeypatch.setattr(ingestion_journal, "ENABLE_INGESTION_JOURNAL", True)
+    monkeypatch.setattr(ingestion_journal, "INGESTION_JOURNAL_PATH", "")
+    assert ingestion_journal.get_ingestion_journal() is None
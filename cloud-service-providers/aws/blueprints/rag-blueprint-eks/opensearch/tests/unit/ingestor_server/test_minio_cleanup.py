@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the batched MinIO cleanup"""
+
+import pytest
+
+from nvidia_rag.ingestor_server import minio_cleanup
+from nvidia_rag.ingestor_server.minio_cleanup import (
+    delete_objects,
+    list_document_objects,
+    list_prefixes,
+)
+from nvidia_rag.utils.minio_operator import get_unique_thumbnail_id_file_name_prefix
+
+
+@pytest.fixture
+def stored_documents(minio_operator):
+    for document_name in ["a.pdf", "b.pdf", "c.pdf"]:
+        prefix = get_unique_thumbnail_id_file_name_prefix("docs", document_name)
+        minio_operator.put_payloads_bulk([{}, {}], [f"{prefix}1_0", f"{prefix}2_0"])
+    prefix = get_unique_thumbnail_id_file_name_prefix("docs_2", "a.pdf")
+    minio_operator.put_payload({}, f"{prefix}1_0")
+    return minio_operator
+
+
+@pytest.mark.parametrize("scan_threshold", [0, 8])
+def test_list_document_objects(monkeypatch, stored_documents, scan_threshold):
+    monkeypatch.setattr(minio_cleanup, "MINIO_CLEANUP_SCAN_THRESHOLD", scan_threshold)
+    objects = list_document_objects(
+        stored_documents, "docs", ["a.pdf", "c.pdf", "a.pdf", "missing.pdf"]
+    )
+    assert list(objects) == ["a.pdf", "c.pdf", "missing.pdf"]
+    prefix = get_unique_thumbnail_id_file_name_prefix("docs", "a.pdf")
+    assert sorted(objects["a.pdf"]) == [f"{prefix}1_0", f"{prefix}2_0"]
+    assert len(objects["c.pdf"]) == 2
+    assert objects["missing.pdf"] == []
+
+
+def test_list_prefixes(stored_documents):
+    prefixes = [
+        get_unique_thumbnail_id_file_name_prefix("docs", "a.pdf"),
+        get_unique_thumbnail_id_file_name_prefix("docs_2", "a.pdf"),
+        get_unique_thumbnail_id_file_name_prefix("other", "a.pdf"),
+    ]
+    listings = list_prefixes(stored_documents, prefixes)
+    assert [len(listings[prefix]) for prefix in prefixes] == [2, 1, 0]
+
+
+def test_delete_objects_in_batches(monkeypatch, minio_operator):
+    monkeypatch.setattr(minio_cleanup, "MINIO_DELETE_BATCH_SIZE", 2)
+    names = [f"object_{i}" for i in range(5)]
+    minio_operator.put_payloads_bulk([{}] * 5, names)
+
+    assert delete_objects(minio_operator, names + names[:2]) == 5
+    assert minio_operator.objects == {}
+    assert sorted(len(batch) for batch in minio_operator.delete_calls) == [1, 2, 2]
+
+
+def test_delete_nothing(minio_operator):
+    assert delete_objects(minio_operator, []) == 0
+    assert minio_operator.delete_calls == []
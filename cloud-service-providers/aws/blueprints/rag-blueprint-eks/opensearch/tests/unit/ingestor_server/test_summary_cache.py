@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the reference counted summary cache"""
+
+from nvidia_rag.ingestor_server.summary_cache import (
+    get_cached_summary,
+    get_summary_cache_key,
+    get_summary_version,
+    put_cached_summary,
+    release_summary_cache,
+)
+
+VERSION = get_summary_version(model="llm", prompt="summarize")
+
+
+def _entries(minio_operator):
+    return sorted(
+        name
+        for name in minio_operator.objects
+        if name.startswith("summary-cache/entries/")
+    )
+
+
+def test_cache_key_covers_text_and_version():
+    key = get_summary_cache_key("text", VERSION)
+    assert key == get_summary_cache_key("text", VERSION)
+    assert key != get_summary_cache_key("other text", VERSION)
+    assert key != get_summary_cache_key("text", get_summary_version(model="other"))
+
+
+def test_put_and_get(minio_operator):
+    key = get_summary_cache_key("text", VERSION)
+    assert get_cached_summary(minio_operator, key, "docs", "a.pdf") is None
+    put_cached_summary(minio_operator, key, "summary", "docs", "a.pdf")
+    assert get_cached_summary(minio_operator, key, "other", "b.pdf") == "summary"
+
+
+def test_shared_entry_is_kept_until_last_reference(minio_operator):
+    key = get_summary_cache_key("text", VERSION)
+    put_cached_summary(minio_operator, key, "summary", "docs", "a.pdf")
+    get_cached_summary(minio_operator, key, "other", "b.pdf")
+
+    assert release_summary_cache(minio_operator, "docs", ["a.pdf"]) == 0
+    assert _entries(minio_operator) == [f"summary-cache/entries/{key}"]
+
+    assert release_summary_cache(minio_operator, "other") == 1
+    assert minio_operator.objects == {}
+
+
+def test_new_key_replaces_reference_of_document(minio_operator):
+    old_key = get_summary_cache_key("old text", VERSION)
+    new_key = get_summary_cache_key("new text", VERSION)
+    put_cached_summary(minio_operator, old_key, "old", "docs", "a.pdf")
+    put_cached_summary(minio_operator, new_key, "new", "docs", "a.pdf")
+    # The old entry lost its only reference and is evicted
+    assert _entries(minio_operator) == [f"summary-cache/entries/{new_key}"]
+
+
+def test_release_is_scoped_to_collection(minio_operator):
+    key = get_summary_cache_key("text", VERSION)
+    put_cached_summary(minio_operator, key, "summary", "docs", "a.pdf")
+    put_cached_summary(minio_operator, key, "summary", "docs_2", "a.pdf")
+
+    assert release_summary_cache(minio_operator, "docs") == 0
+    assert release_summary_cache(minio_operator, "docs", ["a.pdf"]) == 0
+    assert release_summary_cache(minio_operator, "docs_2") == 1
+
+
+def test_release_without_references(minio_operator):
+    assert release_summary_cache(minio_operator, "docs") == 0
+    assert minio_operator.delete_calls == []
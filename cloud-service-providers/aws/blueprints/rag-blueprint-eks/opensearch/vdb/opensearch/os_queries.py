@@ -22,8 +22,16 @@ Provides pre-built query functions for document and metadata management in OpenS
 3. get_metadata_schema_query: Build search query to retrieve metadata schema for specified collection
 4. get_delete_metadata_schema_query: Create deletion query for removing metadata schema by collection name
 5. create_metadata_collection_mapping: Generate OpenSearch index mapping for metadata schema collections
+6. get_source_counts_query: Build terms aggregation counting chunks for the given document sources
+7. get_chunk_ids_query: Build search query returning which of the given chunk ids are stored
+8. get_source_chunks_query: Build scroll query listing stored chunk ids of the given document sources
+9. get_source_documents_query: Build search query returning the stored chunks of a document source
+10. get_document_names_query: Build terms aggregation listing stored sources of the given document names
 """
 
+# Default index.max_result_window, the most hits a single search may return
+SOURCE_CHUNKS_MAX_HITS = 10000
+
 
 def get_unique_sources_query():
     """
@@ -101,3 +109,86 @@ def create_metadata_collection_mapping():
             }
         }
     }
+
+
+def get_source_counts_query(source_values: list[str]):
+    """
+    Build terms aggregation counting chunks for the given document sources.
+    Only the requested sources are matched, so the cost is independent of collection size.
+    """
+    query_source_counts = {
+        "size": 0,
+        "query": {"terms": {"metadata.source.source_name.keyword": source_values}},
+        "aggs": {
+            "source_counts": {
+                "terms": {
+                    "field": "metadata.source.source_name.keyword",
+                    "size": len(source_values),
+                }
+            }
+        },
+    }
+    return query_source_counts
+
+
+def get_chunk_ids_query(chunk_ids: list[str]):
+    """
+    Build search query returning which of the given chunk ids are stored.
+    """
+    query_chunk_ids = {
+        "size": len(chunk_ids),
+        "query": {"terms": {"metadata.chunk_id.keyword": chunk_ids}},
+        "_source": ["metadata.chunk_id"],
+    }
+    return query_chunk_ids
+
+
+def get_source_chunks_query(source_values: list[str]):
+    """
+    Build scroll query listing stored chunk ids of the given document sources.
+    The page size is set by the scroll, so the listing is not capped.
+    """
+    query_source_chunks = {
+        "query": {"terms": {"metadata.source.source_name.keyword": source_values}},
+        "_source": ["metadata.chunk_id"],
+    }
+    return query_source_chunks
+
+
+def get_source_documents_query(source_value: str):
+    """
+    Build search query returning the stored chunks of a document source.
+    """
+    query_source_documents = {
+        "size": SOURCE_CHUNKS_MAX_HITS,
+        "query": {"term": {"metadata.source.source_name.keyword": source_value}},
+    }
+    return query_source_documents
+
+
+def get_document_names_query(document_names: list[str], source_values: list[str]):
+    """
+    Build terms aggregation listing stored sources of the given document names.
+    Chunks written before document names were stored are matched by source.
+    """
+    query_document_names = {
+        "size": 0,
+        "query": {
+            "bool": {
+                "should": [
+                    {"terms": {"metadata.document_name.keyword": document_names}},
+                    {"terms": {"metadata.source.source_name.keyword": source_values}},
+                ],
+                "minimum_should_match": 1,
+            }
+        },
+        "aggs": {
+            "document_sources": {
+                "terms": {
+                    "field": "metadata.source.source_name.keyword",
+                    "size": 2 * (len(document_names) + len(source_values)),
+                }
+            }
+        },
+    }
+    return query_document_names